@@ -0,0 +1,33 @@
+"""bcrypt cost factors: hash and verify time and logins per second per core, plus bulk hashing on the pool."""
+import argparse
+import os
+
+import bcrypt as pybcrypt
+
+from common import make_app, timed
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--costs", default="4,8,10,11,12,13")
+parser.add_argument("--bulk", type=int, default=32, help="passwords per bulk hashing run")
+parser.add_argument("--bulk-rounds", type=int, default=10)
+args = parser.parse_args()
+
+password = b"secret-password"
+print(f"{os.cpu_count()} core(s)")
+print("cost    hash ms  verify ms  logins/s/core")
+for cost in (int(value) for value in args.costs.split(",")):
+    repeat = 3 if cost >= 12 else 10
+    hash_time = timed(lambda: pybcrypt.hashpw(password, pybcrypt.gensalt(cost)), repeat)
+    stored = pybcrypt.hashpw(password, pybcrypt.gensalt(cost))
+    verify_time = timed(lambda: pybcrypt.checkpw(password, stored), repeat)
+    print(f"{cost:4} {hash_time * 1000:10.1f} {verify_time * 1000:10.1f} {1 / verify_time:14.1f}")
+
+os.environ["BCRYPT_LOG_ROUNDS"] = str(args.bulk_rounds)
+app = make_app()
+from src.passwords import hash_password, hash_passwords
+
+passwords = [f"password-{i}" for i in range(args.bulk)]
+with app.app_context():
+    serial = timed(lambda: [hash_password(value) for value in passwords], 2)
+    pooled = timed(lambda: hash_passwords(passwords), 2)
+print(f"bulk {args.bulk} hashes at cost {args.bulk_rounds}: serial {serial * 1000:.0f} ms, pool {pooled * 1000:.0f} ms")
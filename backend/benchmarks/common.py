@@ -0,0 +1,45 @@
+"""Shared setup for the benchmark scripts.
+
+Each script builds the app on a throwaway SQLite file. Set ``LMS_BACKEND``
+to another checkout's backend directory to run the same script against
+that tree, e.g. the commit before a change for a before/after comparison.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(os.getenv("LMS_BACKEND", Path(__file__).resolve().parent.parent)).resolve()
+# Older trees import the agent package as ``backend.src``, so the repo root goes on the path too.
+sys.path[:0] = [str(BACKEND_DIR), str(BACKEND_DIR.parent)]
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-that-is-long-enough")
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+
+
+# SQLite only autoincrements INTEGER primary keys.
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    return "INTEGER"
+
+
+def make_app():
+    """The app on a new SQLite file, with its tables created."""
+    path = Path(tempfile.mkdtemp(prefix="lms-bench-")) / "bench.db"
+    os.environ["DATABASE_URI"] = f"sqlite:///{path}"
+    from src import create_app
+    return create_app()
+
+
+def timed(func, repeat=5):
+    """Best wall-clock time of ``repeat`` calls to ``func``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
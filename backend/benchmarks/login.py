@@ -0,0 +1,62 @@
+"""Login throughput: POST /api/login for admin, teacher and student accounts.
+
+Stored hashes use ``--rounds`` (default 4) so bcrypt does not drown out
+the account lookup; run with ``--rounds 12`` for production cost.
+"""
+import argparse
+import time
+
+import bcrypt as pybcrypt
+from sqlalchemy import event, insert
+
+from common import make_app, timed
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--students", type=int, default=20000)
+parser.add_argument("--teachers", type=int, default=500)
+parser.add_argument("--rounds", type=int, default=4)
+parser.add_argument("--logins", type=int, default=2000)
+args = parser.parse_args()
+
+app = make_app()
+from src.db import db
+from src.models import Admin, Section, Student, Teacher
+
+password_hash = pybcrypt.hashpw(b"secret123", pybcrypt.gensalt(args.rounds)).decode()
+app.config["BCRYPT_LOG_ROUNDS"] = args.rounds
+
+with app.app_context():
+    def accounts(prefix, count, **extra):
+        return [
+            {"name": f"{prefix} {i}", "username": f"{prefix}{i}", "email": f"{prefix}{i}@example.com", "password": password_hash, **extra}
+            for i in range(count)
+        ]
+
+    db.session.execute(insert(Admin), accounts("admin", 10))
+    db.session.execute(insert(Teacher), accounts("teacher", args.teachers))
+    section = Section(name="Section A", teacher_id=1)
+    db.session.add(section)
+    db.session.flush()
+    db.session.execute(insert(Student), accounts("student", args.students, section_id=section.id))
+    db.session.commit()
+
+    statements = []
+    event.listen(db.engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+client = app.test_client()
+
+
+def login_all(emails):
+    for email in emails:
+        response = client.post("/api/login", json={"email": email, "password": "secret123"})
+        assert response.status_code == 200, response.get_json()
+
+
+print(f"{args.students} students, {args.teachers} teachers, bcrypt cost {args.rounds}")
+for prefix, count in (("admin", 10), ("teacher", args.teachers), ("student", args.students)):
+    emails = [f"{prefix}{i % count}@example.com" for i in range(args.logins)]
+    statements.clear()
+    login_all(emails[:1])
+    queries = len(statements)
+    elapsed = timed(lambda: login_all(emails), repeat=3)
+    print(f"{prefix:8} {args.logins / elapsed:8.1f} logins/s  {elapsed * 1000 / args.logins:7.2f} ms/login  {queries} queries/login")
@@ -0,0 +1,94 @@
+"""Notification fan-out: thousands of stream subscribers on one hub against the same clients polling GET /api/notifications.
+
+Each subscriber thread runs the stream's per-item work, ``hub.wait`` plus
+the visibility filter, without the HTTP layer; polling goes through the
+full request path once per client.
+"""
+import argparse
+import threading
+import time
+
+from common import make_app, timed
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--subscribers", type=int, default=5000)
+parser.add_argument("--events", type=int, default=10)
+parser.add_argument("--pollers", type=int, default=500, help="clients timed polling once; the cost is scaled to --subscribers")
+args = parser.parse_args()
+
+app = make_app()
+from src.db import db
+from src.models import Admin, Announcement, Section, Student, Teacher
+from src.notification_hub import NotificationHub
+from src.services.notification import _is_visible
+
+with app.app_context():
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com", password="x")
+    admin = Admin(name="Admin", username="admin", email="admin@example.com", password="x")
+    db.session.add_all([teacher, admin])
+    db.session.flush()
+    section = Section(name="Section A", teacher_id=teacher.id)
+    db.session.add(section)
+    db.session.flush()
+    student = Student(name="Student", username="student", email="student@example.com", password="x", section_id=section.id)
+    db.session.add(student)
+    db.session.add_all(
+        Announcement(title=f"Announcement {i}", content="...", teacher_id=teacher.id) for i in range(50)
+    )
+    db.session.commit()
+    from flask_jwt_extended import create_access_token
+    token = create_access_token(identity=str(student.id), additional_claims={"role": "student"})
+    section_id = section.id
+    student_id = student.id
+    teacher_id = teacher.id
+
+hub = NotificationHub()
+ready = threading.Barrier(args.subscribers + 1)
+delivered = [threading.Event() for _ in range(args.events)]
+counts = [0] * args.events
+lock = threading.Lock()
+
+
+def subscriber():
+    seq = hub.seq
+    ready.wait()
+    received = 0
+    while received < args.events:
+        published, seq, missed = hub.wait(seq, 30)
+        for entry in published:
+            _is_visible(entry, "student", student_id, section_id)
+            with lock:
+                counts[received] += 1
+                if counts[received] == args.subscribers:
+                    delivered[received].set()
+            received += 1
+
+
+threading.stack_size(256 * 1024)
+threads = [threading.Thread(target=subscriber, daemon=True) for _ in range(args.subscribers)]
+for thread in threads:
+    thread.start()
+ready.wait()
+time.sleep(0.5)
+
+publish_times = []
+fan_out_times = []
+for i in range(args.events):
+    item = {"item": {"type": "announcement", "item_id": 100 + i, "creator_id": teacher_id},
+            "target_audience": "all", "section_id": None}
+    start = time.perf_counter()
+    hub.publish(item)
+    publish_times.append(time.perf_counter() - start)
+    delivered[i].wait(60)
+    fan_out_times.append(time.perf_counter() - start)
+
+client = app.test_client()
+headers = {"Authorization": f"Bearer {token}"}
+poll = timed(lambda: [client.get("/api/notifications", headers=headers) for _ in range(args.pollers)], 3) / args.pollers
+
+print(f"{args.subscribers} subscribers, {args.events} events, 1 worker process")
+print(f"publish                     {max(publish_times) * 1000:8.2f} ms worst")
+print(f"delivered to all            {sorted(fan_out_times)[len(fan_out_times) // 2] * 1000:8.1f} ms median, "
+      f"{max(fan_out_times) * 1000:.1f} ms worst")
+print(f"one poll request            {poll * 1000:8.2f} ms")
+print(f"{args.subscribers} clients polling once  {poll * args.subscribers:8.2f} s of worker time per interval")
@@ -0,0 +1,82 @@
+"""Result analytics: fetching every result and computing the statistics client-side against GET /api/get/result/analytics."""
+import argparse
+import time
+from statistics import fmean, median, pstdev
+
+from sqlalchemy import insert
+
+from common import make_app, timed
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--results", type=int, default=100000)
+parser.add_argument("--subjects", type=int, default=20)
+args = parser.parse_args()
+
+app = make_app()
+from flask_jwt_extended import create_access_token
+from src.db import db
+from src.models import Course, Result, Section, Student, Subject, Teacher
+
+students_per_subject = args.results // args.subjects
+
+with app.app_context():
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com", password="x")
+    db.session.add(teacher)
+    db.session.flush()
+    course = Course(name="Course", course_code="C-1", teacher_id=teacher.id)
+    section = Section(name="Section A", teacher_id=teacher.id)
+    db.session.add_all([course, section])
+    db.session.flush()
+    db.session.execute(insert(Subject), [
+        {"name": f"Subject {i}", "teacher_id": teacher.id, "course_id": course.id} for i in range(args.subjects)
+    ])
+    db.session.execute(insert(Student), [
+        {"name": f"Student {i}", "username": f"student{i}", "email": f"student{i}@example.com",
+         "password": "x", "section_id": section.id}
+        for i in range(students_per_subject)
+    ])
+    db.session.execute(insert(Result), [
+        {"student_id": student + 1, "subject_id": subject + 1, "total_marks": 100,
+         "obtained_marks": (student * 37 + subject * 11) % 101, "grade": "C", "exam_type": "final"}
+        for subject in range(args.subjects) for student in range(students_per_subject)
+    ])
+    db.session.commit()
+    token = create_access_token(identity=str(teacher.id), additional_claims={"role": "teacher"})
+
+client = app.test_client()
+headers = {"Authorization": f"Bearer {token}"}
+
+
+def client_side():
+    """What the browser did: pull every result, then crunch one subject."""
+    rows = client.get("/api/get/result?stream=json", headers=headers).get_json()
+    scores = sorted(
+        row["obtained_marks"] * 100 / row["total_marks"]
+        for row in rows if row["subject_name"] == "Subject 0" and row["exam_type"] == "final"
+    )
+    assert len(rows) == args.results
+    return fmean(scores), median(scores), pstdev(scores)
+
+
+def server_side():
+    response = client.get("/api/get/result/analytics?subject_name=Subject 0&exam_type=final", headers=headers)
+    assert response.get_json()["students"] == students_per_subject
+    return response
+
+
+def invalidate_and_read():
+    """One result write, then the read that recomputes the subject's analytics."""
+    assert client.put("/api/update/result?id=1", headers=headers, json={"obtained_marks": "55"}).status_code == 200
+    server_side()
+
+
+print(f"{args.results} results, {args.subjects} subjects, {students_per_subject} students per subject")
+print(f"client-side fetch + stats   {timed(client_side, 3) * 1000:9.1f} ms")
+with app.app_context():
+    from src.cache import report_cache
+    report_cache.clear()
+start = time.perf_counter()
+server_side()
+print(f"analytics endpoint, cold    {(time.perf_counter() - start) * 1000:9.1f} ms")
+print(f"analytics endpoint, cached  {timed(server_side, 50) * 1000:9.3f} ms")
+print(f"write, then analytics       {timed(invalidate_and_read, 3) * 1000:9.1f} ms")
@@ -0,0 +1,114 @@
+"""Row serialization: hand-built dicts with Flask's stdlib jsonify against src.serializers with the orjson provider."""
+import argparse
+import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from common import make_app, timed
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--rows", type=int, default=100000)
+args = parser.parse_args()
+
+app = make_app()
+from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
+from src.json_provider import OrjsonProvider
+from src.serializers import event_row, result_row, student_submission_row
+
+now = datetime.datetime(2026, 10, 18, 11, 0, 0, 123456)
+subject = SimpleNamespace(name="Mathematics")
+student = SimpleNamespace(name="Student")
+results = [
+    SimpleNamespace(id=i, total_marks=Decimal("100.00"), obtained_marks=Decimal("77.50"), grade="C", exam_type="final",
+                    exam_label="Final 2026", remarks=None, subject=subject, student=student)
+    for i in range(args.rows)
+]
+events = [
+    SimpleNamespace(id=i, title=f"Event {i}", description="...", event_date=now.date(), event_time=now.time(),
+                    admin_id=1, created_at=now)
+    for i in range(args.rows)
+]
+submissions = [
+    SimpleNamespace(id=i, assignment_id=i % 50, assignment_title=f"Assignment {i % 50}", submission_text="answer",
+                    submission_file=None, submitted_at=now, marks=Decimal("8.50"), feedback=None)
+    for i in range(args.rows)
+]
+
+
+# The per-row code the services had before src.serializers.
+def old_result(result):
+    return {
+        "id": result.id,
+        "subject_name": result.subject.name if result.subject else None,
+        "student_name": result.student.name if result.student else None,
+        "total_marks": float(result.total_marks),
+        "obtained_marks": float(result.obtained_marks),
+        "grade": result.grade,
+        "exam_type": result.exam_type,
+        "exam_label": result.exam_label,
+        "remarks": result.remarks
+    }
+
+
+def old_event(event):
+    return {
+        "id": event.id,
+        "title": event.title,
+        "description": event.description,
+        "event_date": str(event.event_date),
+        "event_time": str(event.event_time),
+        "admin_id": event.admin_id,
+        "created_at": str(event.created_at)
+    }
+
+
+def old_submission(submission):
+    submitted_at_str = None
+    if submission.submitted_at:
+        try:
+            submitted_at_str = submission.submitted_at.isoformat()
+        except Exception as e:
+            print(f"Error converting date for submission {submission.id}: {e}")
+            submitted_at_str = str(submission.submitted_at)
+
+    marks_value = None
+    if submission.marks is not None:
+        try:
+            marks_value = float(submission.marks)
+        except (ValueError, TypeError) as e:
+            print(f"Error converting marks for submission {submission.id}: {e}")
+            marks_value = None
+
+    return {
+        "id": submission.id,
+        "assignment_id": submission.assignment_id,
+        "assignment": submission.assignment_title,
+        "submission_text": submission.submission_text or "",
+        "submission_file": submission.submission_file or "",
+        "submitted_at": submitted_at_str,
+        "marks": marks_value,
+        "marks_obtained": marks_value,
+        "feedback": submission.feedback or ""
+    }
+
+
+def body(provider, serializer, rows):
+    app.json = provider(app)
+    return jsonify({"data": [serializer(row) for row in rows], "status": "success"}).get_data()
+
+
+print(f"{args.rows} rows per listing, best of 3")
+print(f"{'':12s} {'old dicts + stdlib':>22s} {'serializers + stdlib':>22s} {'serializers + orjson':>22s}")
+with app.test_request_context():
+    for name, old, new, rows in (
+        ("results", old_result, result_row, results),
+        ("events", old_event, event_row, events),
+        ("submissions", old_submission, student_submission_row, submissions)
+    ):
+        assert body(DefaultJSONProvider, old, rows) == body(OrjsonProvider, new, rows), name
+        times = [
+            timed(lambda: body(provider, serializer, rows), 3)
+            for provider, serializer in ((DefaultJSONProvider, old), (DefaultJSONProvider, new), (OrjsonProvider, new))
+        ]
+        print(f"{name:12s} " + " ".join(f"{seconds * 1000:19.0f} ms" for seconds in times))
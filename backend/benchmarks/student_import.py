@@ -0,0 +1,59 @@
+"""Student onboarding: one POST /api/add/student per row against one POST /api/import/students upload."""
+import argparse
+import csv
+import io
+import os
+import time
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--rows", type=int, default=10000)
+parser.add_argument("--rounds", type=int, default=4, help="bcrypt cost of the new accounts")
+args = parser.parse_args()
+os.environ["BCRYPT_LOG_ROUNDS"] = str(args.rounds)
+
+from common import make_app
+
+
+def seeded_app():
+    app = make_app()
+    from flask_jwt_extended import create_access_token
+    from src.db import db
+    from src.models import Admin, Section, Teacher
+
+    with app.app_context():
+        teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com", password="x")
+        admin = Admin(name="Admin", username="admin", email="admin@example.com", password="x")
+        db.session.add_all([teacher, admin])
+        db.session.flush()
+        db.session.add(Section(name="Section A", teacher_id=teacher.id))
+        db.session.commit()
+        token = create_access_token(identity=str(admin.id), additional_claims={"role": "admin"})
+    return app.test_client(), {"Authorization": f"Bearer {token}"}
+
+
+rows = [
+    {"name": f"Student {i}", "username": f"student{i}", "email": f"student{i}@example.com",
+     "password": "secret123", "section_name": "Section A"}
+    for i in range(args.rows)
+]
+
+client, headers = seeded_app()
+start = time.perf_counter()
+for row in rows:
+    assert client.post("/api/add/student", json=row, headers=headers).status_code == 201
+per_row = time.perf_counter() - start
+
+client, headers = seeded_app()
+upload = io.StringIO()
+writer = csv.DictWriter(upload, fieldnames=list(rows[0]))
+writer.writeheader()
+writer.writerows(rows)
+body = upload.getvalue().encode()
+start = time.perf_counter()
+response = client.post("/api/import/students", data={"file": (io.BytesIO(body), "students.csv")}, headers=headers)
+bulk = time.perf_counter() - start
+assert response.get_json()["imported"] == args.rows, response.get_json()
+
+print(f"{args.rows} students, bcrypt cost {args.rounds}, {os.cpu_count()} core(s)")
+print(f"per-row add   {per_row:8.2f} s  {args.rows / per_row:8.0f} rows/s")
+print(f"CSV import    {bulk:8.2f} s  {args.rows / bulk:8.0f} rows/s")
@@ -4,20 +4,23 @@ import os
 from dotenv import load_dotenv
 from src.db import db
 from src.extention import bcrypt , jwt
-from src.models import Student, Teacher, Admin, Assignment, Attendance,Result,Subject,Course,Announcement,AssignmentSubmission,Enrollment,Event,Message,Section
+from src.json_provider import json_provider
+from src.commands import ensure_indexes, rebuild_attendance_summary_command
+from src.models import Student, Teacher, Admin, Assignment, Attendance,AttendanceSummary,Result,Subject,Course,Announcement,AssignmentSubmission,Enrollment,Event,Message,Section,ChatCheckpoint,ChatCheckpointWrite,NotificationReadMarker,ResourceVersion
 
-from src.routes import home_bp,auth_bp,student_bp,teacher_bp,admin_bp,assignment_bp,subject_bp,result_bp,section_bp,assignment_submission_bp,announcement_bp,chatbot_bp,course_bp,enrollment_bp,event_bp,attendance_bp
+from src.routes import home_bp,auth_bp,student_bp,teacher_bp,admin_bp,assignment_bp,subject_bp,result_bp,section_bp,assignment_submission_bp,announcement_bp,chatbot_bp,course_bp,enrollment_bp,event_bp,attendance_bp,dashboard_bp,notification_bp
 
 load_dotenv()
 
 def create_app():
     app = Flask(__name__)
+    app.json = json_provider(app)
     
     CORS(app, 
          resources={r"/api/*": {
              "origins": "*",
              "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-             "allow_headers": ["Content-Type", "Authorization"]
+             "allow_headers": ["Content-Type", "Authorization", "Last-Event-ID"]
          }}, 
          supports_credentials=True) 
 
@@ -25,6 +28,7 @@ def create_app():
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(
         "DATABASE_URI"
     )
+    app.config["BCRYPT_LOG_ROUNDS"] = int(os.getenv("BCRYPT_LOG_ROUNDS", 12))
 
     db.init_app(app)
     jwt.init_app(app)
@@ -44,8 +48,13 @@ def create_app():
     app.register_blueprint(enrollment_bp)
     app.register_blueprint(event_bp)
     app.register_blueprint(attendance_bp)
+    app.register_blueprint(dashboard_bp)
+    app.register_blueprint(notification_bp)
     app.register_blueprint(chatbot_bp)
 
+    app.cli.add_command(ensure_indexes)
+    app.cli.add_command(rebuild_attendance_summary_command)
+
 
     with app.app_context():
         db.create_all()
@@ -0,0 +1,213 @@
+import random
+from sqlalchemy import select, insert, delete, and_
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    WRITES_IDX_MAP,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from src.db import db
+from src.models import ChatCheckpoint, ChatCheckpointWrite
+
+
+class SQLAlchemyCheckpointSaver(BaseCheckpointSaver):
+    """LangGraph checkpointer keeping the newest ``keep`` checkpoints of each thread on its own connection."""
+
+    def __init__(self, keep=2, serde=None):
+        super().__init__(serde=serde)
+        self.keep = keep
+
+    def _thread(self, config):
+        configurable = config["configurable"]
+        return configurable["thread_id"], configurable.get("checkpoint_ns", "")
+
+    def _load_writes(self, conn, thread_id, checkpoint_ns, checkpoint_id):
+        table = ChatCheckpointWrite.__table__
+        rows = conn.execute(
+            select(table.c.task_id, table.c.task_path, table.c.idx, table.c.channel, table.c.value_type, table.c.value)
+            .where(
+                table.c.thread_id == thread_id,
+                table.c.checkpoint_ns == checkpoint_ns,
+                table.c.checkpoint_id == checkpoint_id
+            )
+        ).all()
+        rows.sort(key=lambda row: (row.task_path, row.task_id, row.idx))
+        return [
+            (row.task_id, row.channel, self.serde.loads_typed((row.value_type, row.value)))
+            for row in rows
+        ]
+
+    def _to_tuple(self, conn, row):
+        config = {
+            "configurable": {
+                "thread_id": row.thread_id,
+                "checkpoint_ns": row.checkpoint_ns,
+                "checkpoint_id": row.checkpoint_id,
+            }
+        }
+        parent_config = None
+        if row.parent_checkpoint_id:
+            parent_config = {
+                "configurable": {
+                    "thread_id": row.thread_id,
+                    "checkpoint_ns": row.checkpoint_ns,
+                    "checkpoint_id": row.parent_checkpoint_id,
+                }
+            }
+        return CheckpointTuple(
+            config=config,
+            checkpoint=self.serde.loads_typed((row.checkpoint_type, row.checkpoint)),
+            metadata=self.serde.loads_typed((row.metadata_type, row.checkpoint_metadata)),
+            parent_config=parent_config,
+            pending_writes=self._load_writes(conn, row.thread_id, row.checkpoint_ns, row.checkpoint_id),
+        )
+
+    def get_tuple(self, config):
+        table = ChatCheckpoint.__table__
+        thread_id, checkpoint_ns = self._thread(config)
+        query = select(table).where(table.c.thread_id == thread_id, table.c.checkpoint_ns == checkpoint_ns)
+        if checkpoint_id := get_checkpoint_id(config):
+            query = query.where(table.c.checkpoint_id == checkpoint_id)
+        else:
+            query = query.order_by(table.c.checkpoint_id.desc()).limit(1)
+
+        with db.engine.connect() as conn:
+            row = conn.execute(query).first()
+            return self._to_tuple(conn, row) if row else None
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        table = ChatCheckpoint.__table__
+        query = select(table).order_by(table.c.checkpoint_id.desc())
+        if config:
+            thread_id, checkpoint_ns = self._thread(config)
+            query = query.where(table.c.thread_id == thread_id)
+            if "checkpoint_ns" in config["configurable"]:
+                query = query.where(table.c.checkpoint_ns == checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                query = query.where(table.c.checkpoint_id == checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            query = query.where(table.c.checkpoint_id < before_id)
+
+        with db.engine.connect() as conn:
+            for row in conn.execute(query).all():
+                checkpoint_tuple = self._to_tuple(conn, row)
+                if filter and not all(checkpoint_tuple.metadata.get(key) == value for key, value in filter.items()):
+                    continue
+                if limit is not None:
+                    if limit <= 0:
+                        break
+                    limit -= 1
+                yield checkpoint_tuple
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        table = ChatCheckpoint.__table__
+        thread_id, checkpoint_ns = self._thread(config)
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        with db.engine.begin() as conn:
+            conn.execute(
+                insert(table).values(
+                    thread_id=thread_id,
+                    checkpoint_ns=checkpoint_ns,
+                    checkpoint_id=checkpoint["id"],
+                    parent_checkpoint_id=config["configurable"].get("checkpoint_id"),
+                    checkpoint_type=checkpoint_type,
+                    checkpoint=checkpoint_blob,
+                    metadata_type=metadata_type,
+                    checkpoint_metadata=metadata_blob
+                )
+            )
+            self._prune(conn, thread_id, checkpoint_ns)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _prune(self, conn, thread_id, checkpoint_ns):
+        """Delete all but the newest ``keep`` checkpoints of a thread, with their writes."""
+        table = ChatCheckpoint.__table__
+        stale = conn.execute(
+            select(table.c.checkpoint_id)
+            .where(table.c.thread_id == thread_id, table.c.checkpoint_ns == checkpoint_ns)
+            .order_by(table.c.checkpoint_id.desc())
+            .offset(self.keep)
+        ).scalars().all()
+        if not stale:
+            return
+
+        for model in (ChatCheckpointWrite, ChatCheckpoint):
+            stale_table = model.__table__
+            conn.execute(
+                delete(stale_table).where(and_(
+                    stale_table.c.thread_id == thread_id,
+                    stale_table.c.checkpoint_ns == checkpoint_ns,
+                    stale_table.c.checkpoint_id.in_(stale)
+                ))
+            )
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        table = ChatCheckpointWrite.__table__
+        thread_id, checkpoint_ns = self._thread(config)
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        with db.engine.begin() as conn:
+            existing = set(conn.execute(
+                select(table.c.idx).where(
+                    table.c.thread_id == thread_id,
+                    table.c.checkpoint_ns == checkpoint_ns,
+                    table.c.checkpoint_id == checkpoint_id,
+                    table.c.task_id == task_id
+                )
+            ).scalars())
+
+            rows = []
+            for idx, (channel, value) in enumerate(writes):
+                idx = WRITES_IDX_MAP.get(channel, idx)
+                if idx in existing:
+                    # Regular writes are kept once; special channels are replaced.
+                    if idx >= 0:
+                        continue
+                    conn.execute(
+                        delete(table).where(
+                            table.c.thread_id == thread_id,
+                            table.c.checkpoint_ns == checkpoint_ns,
+                            table.c.checkpoint_id == checkpoint_id,
+                            table.c.task_id == task_id,
+                            table.c.idx == idx
+                        )
+                    )
+                value_type, value_blob = self.serde.dumps_typed(value)
+                rows.append({
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                    "task_id": task_id,
+                    "task_path": task_path,
+                    "idx": idx,
+                    "channel": channel,
+                    "value_type": value_type,
+                    "value": value_blob
+                })
+            if rows:
+                conn.execute(insert(table), rows)
+
+    def delete_thread(self, thread_id):
+        with db.engine.begin() as conn:
+            for model in (ChatCheckpointWrite, ChatCheckpoint):
+                table = model.__table__
+                conn.execute(delete(table).where(table.c.thread_id == thread_id))
+
+    def get_next_version(self, current, channel):
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
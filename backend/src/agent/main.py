@@ -2,12 +2,16 @@ from typing import TypedDict, Annotated, Sequence
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langgraph.prebuilt import ToolNode
-import operator
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage, ToolMessage, RemoveMessage
+from langgraph.graph.message import add_messages
+import threading
+from itertools import combinations
 from pathlib import Path
-from backend.src.agent.tools_list import admin_tools, teacher_tools, student_tools
+from src.agent.tools_list import admin_tools, teacher_tools, student_tools, TOOL_SETS, _flatten_tools
+from src.agent.router import classify_domains, MAX_ROUTED_DOMAINS
 from src.agent.prompts import admin_system_prompt, teacher_system_prompt, student_system_prompt
+from src.agent.checkpointer import SQLAlchemyCheckpointSaver
+from src.agent.tool_executor import create_tool_node
 
 backend_dir = Path(__file__).parent.parent.parent
 env_path = backend_dir / ".env"
@@ -20,6 +24,32 @@ model = ChatGroq(model="qwen/qwen3-32b")
 # Cache tool schemas globally to reduce token usage in multi-turn conversations
 _CACHED_TOOL_SCHEMAS = {}
 
+# (role, domains) -> model bound to those domains' tools, and the tool names.
+_DOMAIN_MODELS = {}
+
+# Bound with every domain selection so paged results can always be continued.
+ALWAYS_BOUND_DOMAINS = ("paging",)
+
+# Compiled graphs are stateless between invocations, so one per role is
+# built once and shared by every request.
+_COMPILED_GRAPHS = {}
+_GRAPH_LOCK = threading.Lock()
+
+# Conversation state lives in the database, keyed by thread id, so a client
+# only sends its newest message.
+_CHECKPOINTER = SQLAlchemyCheckpointSaver()
+
+# Past MAX_HISTORY_MESSAGES, older turns are folded into a running summary.
+MAX_HISTORY_MESSAGES = 20
+KEEP_RECENT_MESSAGES = 8
+SUMMARY_TOOL_OUTPUT_CHARS = 500
+
+summary_prompt = (
+    "You maintain the memory of a conversation between an LMS user and an assistant. "
+    "Write a concise summary of the conversation below, extending the existing summary if one is given. "
+    "Keep names, ids, dates, figures and any pending requests; drop pleasantries."
+)
+
 def _build_tool_schemas_cache():
     """Build and cache tool schemas for all roles on initialization."""
     global _CACHED_TOOL_SCHEMAS
@@ -29,10 +59,36 @@ def _build_tool_schemas_cache():
         "student": model.bind_tools(student_tools)
     }
 
+    # Binding is cheap, so every one- and two-domain selection is prebuilt.
+    _DOMAIN_MODELS.clear()
+    for user_role, role_tool_sets in TOOL_SETS.items():
+        domains = get_routable_domains(user_role)
+        for size in range(1, MAX_ROUTED_DOMAINS + 1):
+            for selection in combinations(domains, size):
+                selected = _flatten_tools({domain: role_tool_sets[domain] for domain in selection + ALWAYS_BOUND_DOMAINS})
+                _DOMAIN_MODELS[(user_role, selection)] = (
+                    model.bind_tools(selected),
+                    frozenset(tool.name for tool in selected)
+                )
+
+def get_routable_domains(user_role: str):
+    """Domains of a role that the router may select, in TOOL_SETS order."""
+    return [domain for domain in TOOL_SETS.get(user_role, {}) if domain not in ALWAYS_BOUND_DOMAINS]
+
+def get_model_for_domains(user_role: str, domains=None):
+    """Return the model bound to ``domains``' tools and their names, or the full role model and None."""
+    if domains:
+        bound = _DOMAIN_MODELS.get((user_role, tuple(domains)))
+        if bound is not None:
+            return bound
+    return _CACHED_TOOL_SCHEMAS[user_role], None
+
 class AgentState(TypedDict):
-    messages: Annotated[Sequence[BaseMessage], operator.add]
+    messages: Annotated[Sequence[BaseMessage], add_messages]
     user_role: str
     user_info: dict
+    summary: str
+    tool_domains: list
 
 def get_tools_for_role(user_role: str):
     """Get tools based on user role."""
@@ -52,17 +108,64 @@ def get_system_prompt_for_role(user_role: str):
         "student": student_system_prompt
     }.get(user_role, "You are a helpful assistant.")
 
-def agent_node(state: AgentState, model_with_tools, system_prompt):
+def _render_transcript(messages):
+    """Flatten messages into plain text for the summarizer."""
+    lines = []
+    for message in messages:
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {message.content}")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool {message.name}: {str(message.content)[:SUMMARY_TOOL_OUTPUT_CHARS]}")
+        elif isinstance(message, AIMessage):
+            if message.content:
+                lines.append(f"Assistant: {message.content}")
+            for tool_call in message.tool_calls:
+                lines.append(f"Assistant called {tool_call['name']} with {tool_call['args']}")
+    return "\n".join(lines)
+
+def memory_node(state: AgentState):
+    """Fold old turns into the running summary once the history is too long."""
+    messages = state["messages"]
+    if len(messages) <= MAX_HISTORY_MESSAGES:
+        return {}
+
+    # Cut on a user message so a tool call is never separated from its result.
+    cut = len(messages) - KEEP_RECENT_MESSAGES
+    while cut < len(messages) - 1 and not isinstance(messages[cut], HumanMessage):
+        cut += 1
+    old_messages = messages[:cut]
+
+    transcript = _render_transcript(old_messages)
+    if state.get("summary"):
+        transcript = f"Existing summary:\n{state['summary']}\n\nConversation:\n{transcript}"
+    summary = model.invoke([SystemMessage(content=summary_prompt), HumanMessage(content=transcript)])
+
+    return {
+        "summary": summary.content,
+        "messages": [RemoveMessage(id=message.id) for message in old_messages]
+    }
+
+def route_node(state: AgentState, user_role: str):
+    """Pick the tool domains for this turn; None gives the agent every tool of the role."""
+    domains = classify_domains(state["messages"][-1].content, get_routable_domains(user_role))
+    return {"tool_domains": domains or None}
+
+def agent_node(state: AgentState, user_role, system_prompt):
     """Agent node that calls the model."""
     messages = state["messages"]
-    user_role = state.get("user_role")
+    model_with_tools, bound_names = get_model_for_domains(user_role, state.get("tool_domains"))
     
     context_prompt = f"{system_prompt}\n\nNote: You are logged in as {user_role}. Your identity is automatically used in relevant operations."
-    
-    if len(messages) == 1 and isinstance(messages[0], HumanMessage):
-        messages = [AIMessage(content=context_prompt)] + messages
-    
-    response = model_with_tools.invoke(messages)
+    if state.get("summary"):
+        context_prompt += f"\n\nSummary of the earlier conversation:\n{state['summary']}"
+
+    prompt = [SystemMessage(content=context_prompt)] + list(messages)
+    response = model_with_tools.invoke(prompt)
+
+    # The router guessed wrong if the model reaches for a tool it was not given.
+    if bound_names is not None and any(call["name"] not in bound_names for call in response.tool_calls):
+        response = _CACHED_TOOL_SCHEMAS[user_role].invoke(prompt)
+        return {"messages": [response], "tool_domains": None}
     return {"messages": [response]}
 
 def should_continue(state: AgentState) -> str:
@@ -84,20 +187,43 @@ def create_chatbot_graph(user_role: str):
     tools = get_tools_for_role(user_role)
     system_prompt = get_system_prompt_for_role(user_role)
 
-    # ToolNode in LangGraph automatically handles parallel execution 
-    # if the model returns multiple tool calls in a single message.
-    tool_node = ToolNode(tools)
+    # Independent read-only calls of one model message run in parallel,
+    # each on its own session; writes stay serialized.
+    tool_node = create_tool_node(tools)
     
-    # Use cached tool schemas instead of rebuilding them
-    model_with_tools = _CACHED_TOOL_SCHEMAS[user_role]
-
     workflow = StateGraph(AgentState)
 
-    workflow.add_node("agent", lambda state: agent_node(state, model_with_tools, system_prompt))
+    workflow.add_node("memory", memory_node)
+    workflow.add_node("route", lambda state: route_node(state, user_role))
+    workflow.add_node("agent", lambda state: agent_node(state, user_role, system_prompt))
     workflow.add_node("tools", tool_node)
 
-    workflow.add_edge(START, "agent")
+    workflow.add_edge(START, "memory")
+    workflow.add_edge("memory", "route")
+    workflow.add_edge("route", "agent")
     workflow.add_conditional_edges("agent", should_continue, {"tools": "tools", END: END})
     workflow.add_edge("tools", "agent")
 
-    return workflow.compile()
+    return workflow.compile(checkpointer=_CHECKPOINTER)
+
+def get_chatbot_graph(user_role: str):
+    """Return the compiled graph for a role, building it on first use."""
+    graph = _COMPILED_GRAPHS.get(user_role)
+    if graph is not None:
+        return graph
+
+    with _GRAPH_LOCK:
+        graph = _COMPILED_GRAPHS.get(user_role)
+        if graph is None:
+            graph = create_chatbot_graph(user_role)
+            _COMPILED_GRAPHS[user_role] = graph
+    return graph
+
+def warm_up_chatbot_graphs():
+    """Compile the graph of every role so the first chat request does not pay for it."""
+    for user_role in ("admin", "teacher", "student"):
+        get_chatbot_graph(user_role)
+
+def clear_conversation(thread_id: str):
+    """Forget everything stored for a conversation thread."""
+    _CHECKPOINTER.delete_thread(thread_id)
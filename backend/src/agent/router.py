@@ -0,0 +1,52 @@
+import re
+
+# Word prefixes that point a message at a TOOL_SETS domain ("enrol" matches "enrolled").
+DOMAIN_KEYWORDS = {
+    "attendance": ("attend", "present", "absent", "absence"),
+    "result": ("result", "grade", "mark", "score", "exam", "midterm", "final", "quiz", "gpa", "transcript", "percentage"),
+    "assignment": ("assignment", "homework", "due", "deadline"),
+    "submission": ("submission", "submit", "feedback"),
+    "announcement": ("announcement", "announce", "notice", "news"),
+    "event": ("event", "calendar", "schedule", "holiday"),
+    "enrollment": ("enrol", "registered", "dropped"),
+    "course": ("course",),
+    "subject": ("subject",),
+    "section": ("section", "class"),
+    "student": ("student", "pupil", "learner"),
+    "teacher": ("teacher", "instructor", "faculty", "professor"),
+}
+
+# Prefixes common enough outside their domain ("present" a report, "mark"
+# as done, the "final" answer) that one of them alone is weak evidence.
+WEAK_KEYWORDS = frozenset((
+    "present", "mark", "score", "final", "due", "news", "notice", "schedule",
+    "registered", "dropped", "submit", "feedback", "class"
+))
+
+MAX_ROUTED_DOMAINS = 2
+
+# A domain is only routed to on a strong keyword or two weak ones.
+MIN_DOMAIN_SCORE = 2
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def _keyword_weight(word, prefixes):
+    for prefix in prefixes:
+        if word.startswith(prefix):
+            return 1 if prefix in WEAK_KEYWORDS else 2
+    return 0
+
+
+def classify_domains(message, domains, max_domains=MAX_ROUTED_DOMAINS):
+    """Domains a message is about, in ``domains`` order; empty means use every tool."""
+    words = _WORD.findall(str(message).lower())
+    chosen = []
+    for domain in domains:
+        prefixes = DOMAIN_KEYWORDS.get(domain)
+        if prefixes and sum(_keyword_weight(word, prefixes) for word in words) >= MIN_DOMAIN_SCORE:
+            chosen.append(domain)
+
+    if len(chosen) > max_domains:
+        return []
+    return chosen
@@ -0,0 +1,67 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import copy_current_request_context, has_request_context
+from langchain_core.messages import ToolMessage
+
+# Read-only tools of one model message run together on this pool.
+_tool_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TOOL_WORKERS", 4)),
+    thread_name_prefix="agent-tool"
+)
+
+
+def is_read_only_tool(name):
+    """Read tools are the ``get_*`` ones; everything else writes."""
+    return name.startswith("get_")
+
+
+def _run_tool_call(tools_by_name, tool_call):
+    """Run one tool call and return its ToolMessage, timed in ``response_metadata``."""
+    started = time.perf_counter()
+    tool = tools_by_name.get(tool_call["name"])
+    try:
+        if tool is None:
+            raise ValueError(f"Tool {tool_call['name']} is not available")
+        message = tool.invoke({**tool_call, "type": "tool_call"})
+    except Exception as e:
+        message = ToolMessage(
+            content=f"Error: {str(e)}",
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            status="error"
+        )
+    message.response_metadata["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return message
+
+
+def _run_in_own_context(tools_by_name, tool_call):
+    """Run a tool call under a copy of the request context, so it gets its own session."""
+    run = copy_current_request_context(lambda: _run_tool_call(tools_by_name, tool_call))
+    return _tool_pool.submit(run)
+
+
+def create_tool_node(tools):
+    """Tool node running consecutive read-only calls concurrently and writes alone, in order."""
+    tools_by_name = {tool.name: tool for tool in tools}
+
+    def tools_node(state):
+        tool_calls = state["messages"][-1].tool_calls
+        results = []
+        pending = []
+
+        def drain():
+            results.extend(future.result() for future in pending)
+            pending.clear()
+
+        for tool_call in tool_calls:
+            if is_read_only_tool(tool_call["name"]) and len(tool_calls) > 1 and has_request_context():
+                pending.append(_run_in_own_context(tools_by_name, tool_call))
+                continue
+            drain()
+            results.append(_run_tool_call(tools_by_name, tool_call))
+        drain()
+
+        return {"messages": results}
+
+    return tools_node
@@ -1,11 +1,19 @@
 import os
 import sys
+import json
+import uuid
+from collections import Counter, defaultdict
+from decimal import Decimal, InvalidOperation
+from functools import wraps
 from flask import Response
 from langchain.tools import tool
 from src.models import Subject,Student,Teacher,Course,Section,Attendance
 from flask_jwt_extended import get_jwt_identity, get_jwt,jwt_required
+from src.cache import cached, tool_cache, TTLCache, MISSING
+from src.pagination import MAX_PAGE_SIZE
+from src.services.result_analytics import ANALYTICS_TOP_N
 
-from src.services import add_announcement,get_all_announcements,get_announcement_by_title,edit_announcement,delete_announcement,add_event,get_event_by_id,get_all_events,update_event,delete_event,add_section,get_section_by_id,get_all_sections,edit_section,delete_section,add_students,get_all_students,get_student_by_id,update_student,delete_student,add_course,get_all_courses,get_course_by_id,update_course,delete_course,enroll_student,get_enrollments_by_course,get_enrollments_by_student,update_enrollment,delete_enrollment,get_all_enrollments,add_result, get_result_by_id, get_all_results, edit_result, delete_result,add_subject, get_all_subjects, get_subject_by_id, delete_subject,update_subject,add_teacher, get_teacher_by_id, update_teacher, delete_teacher, get_all_teachers,mark_attend, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance,add_assignment, get_assignment_by_id,get_all_assignments,edit_assignment,delete_assignment,get_submissions_by_student, get_submissions_by_assignment, update_submission
+from src.services import add_announcement,get_all_announcements,get_announcement_by_title,edit_announcement,delete_announcement,add_event,get_event_by_id,get_all_events,update_event,delete_event,add_section,get_section_by_id,get_all_sections,edit_section,delete_section,add_students,get_all_students,get_student_by_id,update_student,delete_student,add_course,get_all_courses,get_course_by_id,update_course,delete_course,enroll_student,get_enrollments_by_course,get_enrollments_by_student,update_enrollment,delete_enrollment,get_all_enrollments,add_result, get_result_by_id, get_all_results, edit_result, delete_result,add_subject, get_all_subjects, get_subject_by_id, delete_subject,update_subject,add_teacher, get_teacher_by_id, update_teacher, delete_teacher, get_all_teachers,mark_attend, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance,add_assignment, get_assignment_by_id,get_all_assignments,edit_assignment,delete_assignment,get_submissions_by_student, get_submissions_by_assignment, update_submission,get_attendance_roster,mark_bulk_attendance,add_bulk_results,get_attendance_summary,get_student_transcript,result_analytics
 
 
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,6 +33,140 @@ def extract_data_from_response(response):
     
     return response
 
+def _caller_role():
+    """Cache scope for read-only tools: what a tool returns depends on the caller's role."""
+    return get_jwt().get("role")
+
+# Per-call row and token budget of list tools; the rest is paged with get_more_results.
+TOOL_PAGE_ROWS = 25
+TOOL_TOKEN_BUDGET = 2000
+CHARS_PER_TOKEN = 4
+SUMMARY_TOP_N = 5
+_continuations = TTLCache(ttl=600, maxsize=128)
+
+def _estimate_tokens(value):
+    return len(json.dumps(value, default=str)) // CHARS_PER_TOKEN
+
+def _rows_per_page(rows):
+    sample = rows[:TOOL_PAGE_ROWS]
+    tokens_per_row = max(1, _estimate_tokens(sample) // len(sample))
+    return max(1, min(TOOL_PAGE_ROWS, TOOL_TOKEN_BUDGET // tokens_per_row))
+
+def _page_of(rows, page, continuation):
+    size = _rows_per_page(rows)
+    pages = -(-len(rows) // size)
+    start = (page - 1) * size
+    chunk = rows[start:start + size]
+    result = {"total_rows": len(rows), "page": page, "pages": pages, "rows": chunk}
+    if page < pages:
+        result["continuation"] = continuation
+        result["message"] = (
+            f"Showing rows {start + 1}-{start + len(chunk)} of {len(rows)}. "
+            f"Call get_more_results with continuation='{continuation}' and page={page + 1} for more."
+        )
+    return result
+
+def budgeted(summarize=None):
+    """Cap the rows a list tool returns, with ``summarize`` computed over all of them."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            rows = result.get("data") if isinstance(result, dict) else result
+            if not isinstance(rows, list) or not rows:
+                return result
+            if len(rows) <= TOOL_PAGE_ROWS and _estimate_tokens(rows) <= TOOL_TOKEN_BUDGET:
+                return result
+
+            continuation = uuid.uuid4().hex
+            _continuations.set((continuation, _caller_role()), rows)
+            output = _page_of(rows, 1, continuation)
+            if summarize:
+                output["summary"] = summarize(rows)
+            if isinstance(result, dict) and result.get("next_cursor") is not None:
+                output["note"] = f"Only the first {len(rows)} rows were fetched; ask about a narrower set for the rest."
+            return output
+        return wrapper
+    return decorator
+
+def _rate(part, total):
+    return round(part * 100 / total, 1) if total else 0.0
+
+def _summarize_attendance(rows):
+    status_counts = Counter(str(row["status"]).lower() for row in rows)
+    by_subject = defaultdict(lambda: [0, 0])
+    by_student = defaultdict(lambda: [0, 0])
+    for row in rows:
+        present = str(row["status"]).lower() == "present"
+        for totals in (by_subject[row["subject_name"]], by_student[row["student_name"]]):
+            totals[0] += present
+            totals[1] += 1
+
+    student_rates = sorted(
+        ({"student_name": name, "present_rate": _rate(present, total), "records": total}
+         for name, (present, total) in by_student.items()),
+        key=lambda row: row["present_rate"]
+    )
+    return {
+        "records": len(rows),
+        "status_counts": dict(status_counts),
+        "present_rate_by_subject": {name: _rate(present, total) for name, (present, total) in by_subject.items()},
+        "lowest_present_rate_students": student_rates[:SUMMARY_TOP_N]
+    }
+
+def _summarize_results(rows):
+    by_subject = defaultdict(list)
+    by_student = defaultdict(list)
+    for row in rows:
+        percentage = _rate(row["obtained_marks"], row["total_marks"])
+        by_subject[row["subject_name"]].append(percentage)
+        by_student[row["student_name"]].append(percentage)
+
+    student_averages = sorted(
+        ({"student_name": name, "average_percentage": round(sum(values) / len(values), 1), "results": len(values)}
+         for name, values in by_student.items()),
+        key=lambda row: row["average_percentage"],
+        reverse=True
+    )
+    return {
+        "results": len(rows),
+        "grade_counts": dict(Counter(row["grade"] for row in rows)),
+        "exam_type_counts": dict(Counter(row["exam_type"] for row in rows)),
+        "average_percentage_by_subject": {name: round(sum(values) / len(values), 1) for name, values in by_subject.items()},
+        "top_students": student_averages[:SUMMARY_TOP_N],
+        "bottom_students": student_averages[-SUMMARY_TOP_N:][::-1]
+    }
+
+def _summarize_enrollments(rows):
+    summary = {
+        "enrollments": len(rows),
+        "status_counts": dict(Counter(row["status"] for row in rows))
+    }
+    if "course_name" in rows[0]:
+        summary["top_courses"] = Counter(row["course_name"] for row in rows).most_common(SUMMARY_TOP_N)
+    return summary
+
+@tool
+@jwt_required()
+def get_more_results(continuation, page):
+    """Fetch another page of a tool result that was too large to return at once.
+
+    Args:
+        continuation: The continuation value returned with the first page
+        page: The page number to fetch, starting at 2
+    """
+    rows = _continuations.get((str(continuation), _caller_role()))
+    if rows is MISSING:
+        return {"message": "This continuation has expired, call the original tool again", "status": "failed"}
+
+    try:
+        page = int(page)
+    except (TypeError, ValueError):
+        return {"message": "Page must be a number", "status": "failed"}
+    if page < 1 or (page - 1) * _rows_per_page(rows) >= len(rows):
+        return {"message": "Page out of range", "status": "failed"}
+    return _page_of(rows, page, continuation)
+
 @tool
 @jwt_required()
 def create_announcement(title, content, section_name, target_audience = 'all', created_at = None):
@@ -51,17 +193,20 @@ def create_announcement(title, content, section_name, target_audience = 'all', c
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "announcements", "sections", scope=_caller_role)
 def get_announcements():
     """Retrieve all announcements from the LMS system. Use this tool whenever users ask about announcements."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher", "student"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return get_all_announcements()
+    return extract_data_from_response(get_all_announcements(limit=MAX_PAGE_SIZE))
 
 
 @tool
 @jwt_required()
+@cached(tool_cache, "announcements", "sections", scope=_caller_role)
 def get_announcement(announcement_title):
     """Retrieve a specific announcement by its title. Use this tool to get details of a specific announcement.
     
@@ -72,7 +217,7 @@ def get_announcement(announcement_title):
     if token.get("role") not in ["admin", "teacher", "student"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return get_announcement_by_title(announcement_title)
+    return extract_data_from_response(get_announcement_by_title(announcement_title))
 
 
 @tool
@@ -141,6 +286,7 @@ def create_event(title, description, event_date, event_time):
 
 @tool
 @jwt_required()
+@cached(tool_cache, "events", scope=_caller_role)
 def get_event(event_id):
     """Retrieve a specific event by its ID. Use this tool when users ask about a specific event.
     
@@ -156,13 +302,15 @@ def get_event(event_id):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "events", scope=_caller_role)
 def get_events():
     """Retrieve all events from the LMS system. Use this tool when users ask about events."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher", "student"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_events())
+    return extract_data_from_response(get_all_events(limit=MAX_PAGE_SIZE))
 
 
 @tool
@@ -227,6 +375,7 @@ def create_section(name, teacher_name):
 
 @tool
 @jwt_required()
+@cached(tool_cache, "sections", "teachers", scope=_caller_role)
 def get_section(section_id):
     """Retrieve a specific section by its ID. Use this when users ask about a specific section.
     
@@ -242,13 +391,15 @@ def get_section(section_id):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "sections", "teachers", scope=_caller_role)
 def get_sections():
     """Retrieve all sections from the LMS system. Use this when users ask about sections."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher", "student"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_sections())
+    return extract_data_from_response(get_all_sections(limit=MAX_PAGE_SIZE))
 
 
 @tool
@@ -314,17 +465,20 @@ def create_student(name, username, section_name, password, email):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "students", "sections", scope=_caller_role)
 def get_students():
     """Retrieve all students from the LMS system. Use this when users ask about students."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher"]:
         return {"message": "Only admins and teachers can view students", "status": "failed"}
     
-    return extract_data_from_response(get_all_students())
+    return extract_data_from_response(get_all_students(limit=MAX_PAGE_SIZE))
 
 
 @tool
 @jwt_required()
+@cached(tool_cache, "students", "sections", scope=_caller_role)
 def get_student(student_id):
     """Retrieve a specific student by their ID. Use this when users ask about a specific student.
     
@@ -409,17 +563,20 @@ def create_course(name, description, course_code, teacher_name, created_at=None)
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "courses", "teachers", scope=_caller_role)
 def get_courses():
     """Retrieve all courses from the LMS system. Use this when users ask about courses."""
     token = get_jwt()
     if token.get("role") not in "admin":
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_courses())
+    return extract_data_from_response(get_all_courses(limit=MAX_PAGE_SIZE))
 
 
 @tool
 @jwt_required()
+@cached(tool_cache, "courses", "teachers", scope=_caller_role)
 def get_course(course_id):
     """Retrieve a specific course by its ID. Use this when users ask about a specific course.
     
@@ -505,17 +662,21 @@ def enroll_student_tool(student_name, course_name, enrollment_date, status='acti
 
 @tool
 @jwt_required()
+@budgeted(_summarize_enrollments)
+@cached(tool_cache, "enrollments", "students", "courses", scope=_caller_role)
 def get_enrollments():
     """Retrieve all enrollments from the LMS system. Use this when users ask about enrollments."""
     token = get_jwt()
     if token.get("role") != "admin":
         return {"message": "Only admins can view enrollments", "status": "failed"}
     
-    return extract_data_from_response(get_all_enrollments())
+    return extract_data_from_response(get_all_enrollments(stream="json"))
 
 
 @tool
 @jwt_required()
+@budgeted(_summarize_enrollments)
+@cached(tool_cache, "enrollments", "students", "courses", scope=_caller_role)
 def get_enrollments_by_student_tool(student_name):
     """Retrieve enrollments for a specific student.
     
@@ -534,6 +695,8 @@ def get_enrollments_by_student_tool(student_name):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_enrollments)
+@cached(tool_cache, "enrollments", "students", "courses", scope=_caller_role)
 def get_enrollments_by_course_tool(course_name):
     """Retrieve enrollments for a specific course.
     
@@ -615,6 +778,56 @@ def add_result_tool(subject_name, student_name, total_marks, obtained_marks, exa
 
 @tool
 @jwt_required()
+def add_exam_results(subject_name, exam_type, exam_label, marks, total_marks):
+    """Enter one exam's marks for many students at once; re-entering the same exam label updates them.
+
+    Args:
+        subject_name: The name of the subject
+        exam_type: Type of the exam ('midterm', 'final', 'quiz', 'assignment')
+        exam_label: Name of this particular exam, e.g. "Quiz 3" or "Final 2026"
+        marks: Mapping of student name to obtained marks, e.g. {"Ali Khan": 78, "Sara Ahmed": 91}
+        total_marks: Total marks of the exam, shared by every student
+    """
+    token = get_jwt()
+    if token.get("role") != "teacher":
+        return {"message": "Only teachers can add results", "status": "failed"}
+    if exam_type not in ('midterm', 'final', 'quiz', 'assignment'):
+        return {"message": "Exam type must be one of midterm, final, quiz, assignment", "status": "failed"}
+    if not exam_label:
+        return {"message": "Give the exam a label, e.g. 'Quiz 3', so it can be updated later", "status": "failed"}
+    if not isinstance(marks, dict) or not marks:
+        return {"message": "Marks must map each student name to the marks obtained", "status": "failed"}
+
+    subject = Subject.query.filter_by(name=subject_name).first()
+    if not subject:
+        return {"message": "Subject not found", "status": "failed"}
+
+    ids_by_name = {}
+    for student in Student.query.with_entities(Student.id, Student.name).filter(Student.name.in_(list(marks))):
+        ids_by_name.setdefault(student.name, []).append(student.id)
+
+    problems = [name for name in marks if len(ids_by_name.get(name, [])) != 1]
+    if problems:
+        return {
+            "message": "These students were not found or share a name with another student: " + ", ".join(problems),
+            "status": "failed"
+        }
+
+    try:
+        entries = [
+            {"student_id": ids_by_name[name][0], "obtained_marks": Decimal(str(obtained))}
+            for name, obtained in marks.items()
+        ]
+        total = Decimal(str(total_marks))
+    except InvalidOperation:
+        return {"message": "Marks must be numbers", "status": "failed"}
+
+    return extract_data_from_response(add_bulk_results(subject.id, exam_type, str(exam_label), entries, total))
+
+
+@tool
+@jwt_required()
+@cached(tool_cache, "results", "students", "subjects", scope=_caller_role)
 def get_result(result_id):
     """Retrieve a specific result by its ID. Use this when users ask about a specific result.
     
@@ -630,13 +843,63 @@ def get_result(result_id):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_results)
+@cached(tool_cache, "results", "students", "subjects", scope=_caller_role)
 def get_results():
     """Retrieve all results from the LMS system. Use this when users ask about results."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_results())
+    return extract_data_from_response(get_all_results(stream="json"))
+
+
+@tool
+@jwt_required()
+def get_transcript(student_name=None):
+    """Get a student's transcript with percentage and grade per subject, overall percentage and GPA.
+
+    Args:
+        student_name: The name of the student (required for admins and teachers)
+    """
+    token = get_jwt()
+    if token.get("role") == "student":
+        return extract_data_from_response(get_student_transcript(int(get_jwt_identity())))
+
+    if not student_name:
+        return {"message": "Student name is required", "status": "failed"}
+    student = Student.query.filter_by(name=student_name).first()
+    if not student:
+        return {"message": "Student not found", "status": "failed"}
+    return extract_data_from_response(get_student_transcript(student.id))
+
+
+@tool
+@jwt_required()
+def get_result_analytics_tool(subject_name, exam_type, student_name=None):
+    """Class statistics for one exam: mean, median, spread, grade distribution, top students and a student's rank.
+
+    Args:
+        subject_name: The name of the subject
+        exam_type: Type of the exam ('midterm', 'final', 'quiz', 'assignment')
+        student_name: A student whose rank to include (optional)
+    """
+    token = get_jwt()
+    if token.get("role") not in ["admin", "teacher"]:
+        return {"message": "Unauthorized access", "status": "failed"}
+    if exam_type not in ('midterm', 'final', 'quiz', 'assignment'):
+        return {"message": "Exam type must be one of midterm, final, quiz, assignment", "status": "failed"}
+
+    subject = Subject.query.filter_by(name=subject_name).first()
+    if not subject:
+        return {"message": "Subject not found", "status": "failed"}
+
+    analytics = result_analytics(subject.id, exam_type)
+    rankings = analytics["rankings"]
+    output = {**analytics, "rankings": rankings[:ANALYTICS_TOP_N]}
+    if student_name:
+        output["student"] = next((row for row in rankings if row["student_name"] == student_name), None)
+    return output
 
 
 @tool
@@ -700,17 +963,20 @@ def create_subject(name, teacher_name, course_name):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "subjects", "teachers", "courses", scope=_caller_role)
 def get_subjects():
     """Retrieve all subjects from the LMS system. Use this when users ask about subjects."""
     token = get_jwt()
     if token.get("role") not in "admin":
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_subjects())
+    return extract_data_from_response(get_all_subjects(limit=MAX_PAGE_SIZE))
 
 
 @tool
 @jwt_required()
+@cached(tool_cache, "subjects", "teachers", "courses", scope=_caller_role)
 def get_subject(subject_id):
     """Retrieve a specific subject by its ID. Use this when users ask about a specific subject.
     
@@ -785,17 +1051,20 @@ def create_teacher(name, subject_name, username, email, password_hash):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "teachers", "subjects", scope=_caller_role)
 def get_teachers():
     """Retrieve all teachers from the LMS system. Use this when users ask about teachers."""
     token = get_jwt()
     if token.get("role") not in "admin":
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_teachers())
+    return extract_data_from_response(get_all_teachers(limit=MAX_PAGE_SIZE))
 
 
 @tool
 @jwt_required()
+@cached(tool_cache, "teachers", "subjects", scope=_caller_role)
 def get_teacher(teacher_id):
     """Retrieve a specific teacher by their ID. Use this when users ask about a specific teacher.
     
@@ -878,6 +1147,8 @@ def mark_attendance(student_name, subject_name,status):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_attendance_by_student_tool(student_id):
     """Retrieve attendance records for a specific student. Use this when users ask about a student's attendance.
     
@@ -895,6 +1166,8 @@ def get_attendance_by_student_tool(student_id):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_attendance_by_subject_tool(subject_name):
     """Retrieve attendance records for a specific subject.
     
@@ -914,12 +1187,14 @@ def get_attendance_by_subject_tool(subject_name):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_all_attendance_tool():
     """Retrieve all attendance records from the LMS system. Use this when users ask about attendance."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher"]:
         return {"message": "Unauthorized access", "status": "failed"}
-    return extract_data_from_response(get_all_attendance())
+    return extract_data_from_response(get_all_attendance(stream="json"))
 
 
 @tool
@@ -979,6 +1254,7 @@ def create_assignment(title, description, due_date, subject_name, total_marks):
 
 @tool
 @jwt_required()
+@cached(tool_cache, "assignments", "subjects", "teachers", scope=_caller_role)
 def get_assignment(assignment_id):
     """Retrieve a specific assignment by its ID. Use this when users ask about a specific assignment.
     
@@ -990,10 +1266,12 @@ def get_assignment(assignment_id):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "assignments", "subjects", "teachers", scope=_caller_role)
 def get_assignments():
     """Retrieve all assignments from the LMS system. Use this when users ask about assignments."""
 
-    return extract_data_from_response(get_all_assignments())
+    return extract_data_from_response(get_all_assignments(limit=MAX_PAGE_SIZE))
 
 
 @tool
@@ -1041,6 +1319,8 @@ def remove_assignment(assignment_id):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "submissions", "assignments", "students", scope=_caller_role)
 def get_submissions_by_student_tool(student_id):
     """Retrieve assignment submissions for a specific student.
     
@@ -1057,6 +1337,8 @@ def get_submissions_by_student_tool(student_id):
 
 @tool
 @jwt_required()
+@budgeted()
+@cached(tool_cache, "submissions", "assignments", "students", scope=_caller_role)
 def get_submissions_by_assignment_tool(assignment_id):
     """Retrieve assignment submissions for a specific assignment.
     
@@ -1124,6 +1406,57 @@ def mark_attendance(student_name, subject_name, status):
 
 @tool
 @jwt_required()
+def mark_section_attendance(subject_name, section_name=None, absent_students=None, late_students=None, default_status='present'):
+    """Mark attendance for a whole class in one call, e.g. "mark everyone in section A present except Ali".
+
+    Args:
+        subject_name: The name of the subject
+        section_name: Name of the section to mark; when omitted, every student enrolled in the subject's course is marked
+        absent_students: List of student names to mark absent
+        late_students: List of student names to mark late
+        default_status: Status for everyone else ('present', 'absent', 'late'), defaults to 'present'
+    """
+    token = get_jwt()
+    if token.get("role") != "teacher":
+        return {"message": "Only teachers can mark attendance", "status": "failed"}
+
+    subject = Subject.query.filter_by(name=subject_name).first()
+    if not subject:
+        return {"message": "Subject not found", "status": "failed"}
+
+    section_id = None
+    if section_name:
+        section = Section.query.filter_by(name=section_name).first()
+        if not section:
+            return {"message": "Section not found", "status": "failed"}
+        section_id = section.id
+
+    ids_by_name = {}
+    for student in get_attendance_roster(subject.id, section_id):
+        ids_by_name.setdefault(student.name.lower(), []).append(student.id)
+
+    entries = {}
+    problems = []
+    for status, names in (("absent", absent_students), ("late", late_students)):
+        for name in names or []:
+            ids = ids_by_name.get(str(name).lower(), [])
+            if len(ids) != 1:
+                problems.append(name)
+                continue
+            entries[ids[0]] = status
+    if problems:
+        return {
+            "message": "These students are not on the roster or share a name with another student: " + ", ".join(map(str, problems)),
+            "status": "failed"
+        }
+
+    return extract_data_from_response(mark_bulk_attendance(subject.id, section_id, entries, default_status))
+
+
+@tool
+@jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_attendance_by_student_tool(student_name):
     """Retrieve attendance records for a specific student.
     
@@ -1142,6 +1475,8 @@ def get_attendance_by_student_tool(student_name):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_attendance_by_subject_tool(subject_name):
     """Retrieve attendance records for a specific subject.
     
@@ -1160,13 +1495,45 @@ def get_attendance_by_subject_tool(subject_name):
 
 @tool
 @jwt_required()
+@budgeted(_summarize_attendance)
+@cached(tool_cache, "attendance", "students", "subjects", scope=_caller_role)
 def get_all_attendance_tool():
     """Retrieve all attendance records from the LMS system."""
     token = get_jwt()
     if token.get("role") not in ["admin", "teacher"]:
         return {"message": "Unauthorized access", "status": "failed"}
     
-    return extract_data_from_response(get_all_attendance())
+    return extract_data_from_response(get_all_attendance(stream="json"))
+
+
+@tool
+@jwt_required()
+@budgeted()
+def get_attendance_summary_tool(student_name=None, subject_name=None):
+    """Attendance counts and present rate per student and subject, e.g. "what's my attendance in Physics".
+
+    Args:
+        student_name: The name of the student (optional, ignored for students)
+        subject_name: The name of the subject (optional)
+    """
+    token = get_jwt()
+    student_id = None
+    if token.get("role") == "student":
+        student_id = int(get_jwt_identity())
+    elif student_name:
+        student = Student.query.filter_by(name=student_name).first()
+        if not student:
+            return {"message": "Student not found", "status": "failed"}
+        student_id = student.id
+
+    subject_id = None
+    if subject_name:
+        subject = Subject.query.filter_by(name=subject_name).first()
+        if not subject:
+            return {"message": "Subject not found", "status": "failed"}
+        subject_id = subject.id
+
+    return extract_data_from_response(get_attendance_summary(student_id, subject_id))
 
 
 @tool
@@ -1,16 +1,17 @@
-from backend.src.agent.tools import (
+from src.agent.tools import (
     create_announcement, get_announcements, get_announcement, update_announcement, remove_announcement,
     create_event, get_events, get_event, update_event_tool, remove_event,
     create_section, get_sections, get_section, update_section, remove_section,
     create_student, get_students, get_student, update_student_tool, remove_student,
     create_course, get_courses, get_course, update_course_tool, remove_course,
     enroll_student_tool, get_enrollments, get_enrollments_by_student_tool, get_enrollments_by_course_tool, update_enrollment_tool, remove_enrollment,
-    add_result_tool, get_results, get_result, update_result, remove_result,
+    add_result_tool, add_exam_results, get_transcript, get_result_analytics_tool, get_results, get_result, update_result, remove_result,
     create_subject, get_subjects, get_subject, update_subject_tool, remove_subject,
     create_teacher, get_teachers, get_teacher, update_teacher_tool, remove_teacher,
-    mark_attendance, get_attendance_by_student_tool, get_attendance_by_subject_tool, get_all_attendance_tool, update_attendance_tool, remove_attendance,
+    mark_attendance, mark_section_attendance, get_attendance_summary_tool, get_attendance_by_student_tool, get_attendance_by_subject_tool, get_all_attendance_tool, update_attendance_tool, remove_attendance,
     create_assignment, get_assignments, get_assignment, update_assignment, remove_assignment,
-    get_submissions_by_student_tool, get_submissions_by_assignment_tool, update_submission_tool
+    get_submissions_by_student_tool, get_submissions_by_assignment_tool, update_submission_tool,
+    get_more_results
 )
 
 announcement_tools = [create_announcement, get_announcements, get_announcement, update_announcement, remove_announcement]
@@ -19,12 +20,13 @@ section_tools = [create_section, get_sections, get_section, update_section, remo
 student_tools_list = [create_student, get_students, get_student, update_student_tool, remove_student]
 course_tools = [create_course, get_courses, get_course, update_course_tool, remove_course]
 enrollment_tools = [enroll_student_tool, get_enrollments, get_enrollments_by_student_tool, get_enrollments_by_course_tool, update_enrollment_tool, remove_enrollment]
-result_tools = [add_result_tool, get_results, get_result, update_result, remove_result]
+result_tools = [add_result_tool, add_exam_results, get_transcript, get_result_analytics_tool, get_results, get_result, update_result, remove_result]
 subject_tools = [create_subject, get_subjects, get_subject, update_subject_tool, remove_subject]
 teacher_tools_list = [create_teacher, get_teachers, get_teacher, update_teacher_tool, remove_teacher]
-attendance_tools = [mark_attendance, get_attendance_by_student_tool, get_attendance_by_subject_tool, get_all_attendance_tool, update_attendance_tool, remove_attendance]
+attendance_tools = [mark_attendance, mark_section_attendance, get_attendance_summary_tool, get_attendance_by_student_tool, get_attendance_by_subject_tool, get_all_attendance_tool, update_attendance_tool, remove_attendance]
 assignment_tools = [create_assignment, get_assignments, get_assignment, update_assignment, remove_assignment]
 submission_tools = [get_submissions_by_student_tool, get_submissions_by_assignment_tool, update_submission_tool]
+paging_tools = [get_more_results]
 
 TOOL_SETS = {
     "admin": {
@@ -35,11 +37,12 @@ TOOL_SETS = {
         "subject": subject_tools,
         "enrollment": enrollment_tools,
         "event": event_tools,
-        "result": [get_results, get_result],
+        "result": [get_transcript, get_result_analytics_tool, get_results, get_result],
         "assignment": assignment_tools,
         "submission": submission_tools,
         "attendance": attendance_tools,
-        "announcement": announcement_tools
+        "announcement": announcement_tools,
+        "paging": paging_tools
     },
     "teacher": {
         "announcement": announcement_tools,
@@ -47,13 +50,15 @@ TOOL_SETS = {
         "attendance": attendance_tools,
         "result": result_tools,
         "student": [get_students, get_student],
-        "submission": [get_submissions_by_student_tool, get_submissions_by_assignment_tool, update_submission_tool]
+        "submission": [get_submissions_by_student_tool, get_submissions_by_assignment_tool, update_submission_tool],
+        "paging": paging_tools
     },
     "student": {
         "submission": [get_submissions_by_student_tool],
-        "attendance": [get_attendance_by_student_tool],
-        "result": [get_result],
-        "announcement": [get_announcements, get_announcement]
+        "attendance": [get_attendance_summary_tool, get_attendance_by_student_tool],
+        "result": [get_transcript, get_result],
+        "announcement": [get_announcements, get_announcement],
+        "paging": paging_tools
     }
 }
 
@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+MISSING = object()
+
+# Every cache registers itself here so one invalidate() call reaches them all.
+_caches = []
+
+# Functions called with the tags of every invalidate(), e.g. resource version counters.
+_invalidation_listeners = []
+
+
+class TTLCache:
+    """Thread-safe, per-process LRU cache with tagged entries that expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl, maxsize=512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._keys_by_tag = {}
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value, tags = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, tags=()):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tuple(tags))
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+def invalidate(*tags):
+    """Drop entries tagged with any of ``tags`` from every cache and tell the listeners."""
+    for cache in _caches:
+        cache.invalidate(*tags)
+    for listener in _invalidation_listeners:
+        listener(*tags)
+
+
+def on_invalidate(listener):
+    """Register ``listener`` to be called with the tags of every :func:`invalidate`."""
+    _invalidation_listeners.append(listener)
+    return listener
+
+
+def cached(cache, *tags, scope=None):
+    """Memoize a function in ``cache``, keyed by its arguments and the optional ``scope()``."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, scope() if scope else None, args, tuple(sorted(kwargs.items())))
+            try:
+                value = cache.get(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            if value is MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value, tags)
+            return value
+        return wrapper
+    return decorator
+
+
+tool_cache = TTLCache(
+    ttl=int(os.getenv("TOOL_CACHE_TTL", 60)),
+    maxsize=int(os.getenv("TOOL_CACHE_SIZE", 512))
+)
+
+# Computed reports (transcripts, analytics, dashboards) built from many rows.
+report_cache = TTLCache(
+    ttl=int(os.getenv("REPORT_CACHE_TTL", 300)),
+    maxsize=int(os.getenv("REPORT_CACHE_SIZE", 1024))
+)
@@ -0,0 +1,54 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, OperationalError
+from src.db import db
+
+
+@click.command("ensure-indexes")
+@with_appcontext
+def ensure_indexes():
+    """Add nullable columns and create indexes that an existing database lacks."""
+    inspector = inspect(db.engine)
+    preparer = db.engine.dialect.identifier_preparer
+    created = 0
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns or not column.nullable:
+                continue
+            with db.engine.begin() as connection:
+                connection.execute(db.text(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{preparer.format_column(column)} {column.type.compile(db.engine.dialect)}"
+                ))
+            click.echo(f"added    {table.name}.{column.name}")
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        existing.update(constraint["name"] for constraint in inspector.get_unique_constraints(table.name))
+
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name in existing:
+                continue
+            try:
+                index.create(db.engine)
+            except (IntegrityError, OperationalError) as e:
+                click.echo(f"failed   {index.name}: {e.orig}")
+                continue
+            click.echo(f"created  {index.name}")
+            created += 1
+
+    click.echo(f"{created} index(es) created")
+
+
+@click.command("rebuild-attendance-summary")
+@with_appcontext
+def rebuild_attendance_summary_command():
+    """Recompute attendance_summary and print how many pairs were corrected."""
+    from src.services import rebuild_attendance_summary
+
+    mismatched = rebuild_attendance_summary()
+    click.echo(f"{mismatched} student/subject pair(s) corrected")
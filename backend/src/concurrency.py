@@ -0,0 +1,56 @@
+import os
+import threading
+
+
+class Lease:
+    """A held slot of a :class:`ConcurrencyLimiter`; ``release`` is idempotent."""
+
+    def __init__(self, limiter, key):
+        self._limiter = limiter
+        self._key = key
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._limiter._release(self._key)
+
+
+class ConcurrencyLimiter:
+    """Non-blocking cap on concurrent operations, overall and per key."""
+
+    def __init__(self, max_concurrency, max_per_key, retry_after):
+        self.max_concurrency = max_concurrency
+        self.max_per_key = max_per_key
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._active = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key):
+        with self._lock:
+            if self._active.get(key, 0) >= self.max_per_key:
+                return None
+            if not self._slots.acquire(blocking=False):
+                return None
+            self._active[key] = self._active.get(key, 0) + 1
+        return Lease(self, key)
+
+    def _release(self, key):
+        with self._lock:
+            remaining = self._active.get(key, 0) - 1
+            if remaining > 0:
+                self._active[key] = remaining
+            else:
+                self._active.pop(key, None)
+            self._slots.release()
+
+
+chat_limiter = ConcurrencyLimiter(
+    max_concurrency=int(os.getenv("CHAT_MAX_CONCURRENCY", 4)),
+    max_per_key=int(os.getenv("CHAT_MAX_PER_USER", 1)),
+    retry_after=int(os.getenv("CHAT_RETRY_AFTER", 5))
+)
@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from functools import wraps
+from zoneinfo import ZoneInfo
+from flask import current_app, has_app_context, make_response, request
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from src.db import db
+from src.models import ResourceVersion
+from src.cache import on_invalidate
+
+# Cache tags whose writes are counted, for the list endpoints answered conditionally.
+VERSIONED_RESOURCES = frozenset(("courses", "subjects", "sections", "events", "teachers"))
+
+
+@on_invalidate
+def bump_resource_versions(*tags):
+    """Advance the versions of the counted resources among ``tags``, on a separate connection."""
+    names = sorted(VERSIONED_RESOURCES.intersection(tags))
+    if not names or not has_app_context():
+        return
+
+    now = datetime.now(ZoneInfo("Asia/Karachi"))
+    bump = (
+        update(ResourceVersion)
+        .where(ResourceVersion.name.in_(names))
+        .values(version=ResourceVersion.version + 1, updated_at=now)
+    )
+    try:
+        with db.engine.begin() as connection:
+            if connection.execute(bump).rowcount < len(names):
+                existing = set(connection.execute(
+                    select(ResourceVersion.name).where(ResourceVersion.name.in_(names))
+                ).scalars())
+                connection.execute(insert(ResourceVersion), [
+                    {"name": name, "version": 1, "updated_at": now}
+                    for name in names if name not in existing
+                ])
+    except IntegrityError:
+        # Another worker created the counter first; bump the row it made.
+        with db.engine.begin() as connection:
+            connection.execute(bump)
+
+
+def _validators(resources):
+    """Strong ETag and Last-Modified for a response built from ``resources``, from one query."""
+    rows = db.session.execute(
+        select(ResourceVersion.name, ResourceVersion.version, ResourceVersion.updated_at)
+        .where(ResourceVersion.name.in_(resources))
+    ).all()
+    versions = {row.name: row.version for row in rows}
+    etag = "-".join(f"{name}.{versions.get(name, 0)}" for name in resources)
+
+    last_modified = None
+    if rows:
+        latest = max(row.updated_at for row in rows)
+        last_modified = latest.replace(tzinfo=ZoneInfo("Asia/Karachi"), microsecond=0).astimezone(timezone.utc)
+    return etag, last_modified
+
+
+def _not_modified(etag, last_modified):
+    # If-Modified-Since only counts when no If-None-Match was sent (RFC 9110).
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def conditional(*resources):
+    """Answer a GET view conditionally with an ETag and Last-Modified built from ``resources``."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag, last_modified = _validators(resources)
+
+            if _not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Browsers may keep the copy but must revalidate it on every use.
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
@@ -2,7 +2,7 @@ from .student import Student
 from .teacher import Teacher
 from .admin import Admin
 from .assignment import Assignment
-from .attendance import Attendance
+from .attendance import Attendance, AttendanceSummary
 from .result import Result
 from .subject import Subject
 from .course import Course
@@ -12,5 +12,8 @@ from .enrollment import Enrollment
 from .event import Event
 from .message import Message
 from .section import Section
+from .chat_checkpoint import ChatCheckpoint, ChatCheckpointWrite
+from .notification import NotificationReadMarker
+from .resource_version import ResourceVersion
 
-__all__ = ["Student", "Teacher", "Admin", "Assignment", "Attendance","Result","Subject","Course","Announcement","AssignmentSubmission","Enrollment","Event","Message","Section"]
\ No newline at end of file
+__all__ = ["Student", "Teacher", "Admin", "Assignment", "Attendance","AttendanceSummary","Result","Subject","Course","Announcement","AssignmentSubmission","Enrollment","Event","Message","Section","ChatCheckpoint","ChatCheckpointWrite","NotificationReadMarker","ResourceVersion"]
\ No newline at end of file
@@ -8,10 +8,10 @@ class Assignment(db.Model):
     title = db.Column(db.String(255), nullable=False)
     subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), nullable=False)
     teacher_id = db.Column(db.BigInteger,db.ForeignKey('teachers.id'), nullable=False)
-    due_date = db.Column(db.Date, nullable=False)
+    due_date = db.Column(db.Date, nullable=False, index=True)
     description = db.Column(db.Text, nullable=False)
     total_marks = db.Column(db.Numeric(5, 2), default=100.00)
-    created_at = db.Column(db.DateTime, default=datetime.now(ZoneInfo("Asia/Karachi")))
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
 
     subject = db.relationship('Subject', backref='assignments', lazy=True)
     teacher = db.relationship('Teacher', backref='assignments', lazy=True)
\ No newline at end of file
@@ -9,7 +9,7 @@ class AssignmentSubmission(db.Model):
     assignment_id = db.Column(db.BigInteger, db.ForeignKey('assignments.id'), nullable=False)
     submission_text = db.Column(db.Text, nullable=True)
     submission_file = db.Column(db.String(500), nullable=True)
-    submitted_at = db.Column(db.DateTime, default=datetime.now(ZoneInfo("Asia/Karachi")))
+    submitted_at = db.Column(db.DateTime, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
     marks = db.Column(db.Numeric(5, 2), nullable=True)
     feedback = db.Column(db.Text, nullable=True)
 
@@ -4,11 +4,25 @@ from zoneinfo import ZoneInfo
 
 class Attendance(db.Model):
     __tablename__ = 'Attendance'
+    __table_args__ = (
+        db.Index('ix_attendance_student_subject_mark_at', 'student_id', 'subject_id', 'mark_at'),
+    )
     id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
-    mark_at = db.Column(db.DateTime, default=datetime.now(ZoneInfo("Asia/Karachi")))
+    mark_at = db.Column(db.DateTime, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
     student_id = db.Column(db.BigInteger,db.ForeignKey('students.id'), nullable=False)
-    subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), nullable=False)
+    subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), nullable=False, index=True)
     status = db.Column(db.String(50), nullable=False, default='present')
 
     student = db.relationship('Student', backref='attendances', lazy=True)
     subject = db.relationship('Subject', backref='attendances', lazy=True)
+
+
+class AttendanceSummary(db.Model):
+    """Running attendance counts per student and subject, kept in step with Attendance writes."""
+    __tablename__ = 'attendance_summary'
+    student_id = db.Column(db.BigInteger, db.ForeignKey('students.id'), primary_key=True)
+    subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), primary_key=True, index=True)
+    present = db.Column(db.Integer, nullable=False, default=0)
+    absent = db.Column(db.Integer, nullable=False, default=0)
+    late = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,40 @@
+from src.db import db
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# Large enough for a long conversation; MySQL picks MEDIUMBLOB for it.
+CHECKPOINT_BLOB_SIZE = 16 * 1024 * 1024 - 1
+
+class ChatCheckpoint(db.Model):
+    __tablename__ = 'chat_checkpoint'
+    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    thread_id = db.Column(db.String(255), nullable=False)
+    checkpoint_ns = db.Column(db.String(255), nullable=False, default='')
+    checkpoint_id = db.Column(db.String(64), nullable=False)
+    parent_checkpoint_id = db.Column(db.String(64), nullable=True)
+    checkpoint_type = db.Column(db.String(32), nullable=False)
+    checkpoint = db.Column(db.LargeBinary(CHECKPOINT_BLOB_SIZE), nullable=False)
+    metadata_type = db.Column(db.String(32), nullable=False)
+    checkpoint_metadata = db.Column(db.LargeBinary(CHECKPOINT_BLOB_SIZE), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
+
+    __table_args__ = (
+        db.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', name='uq_chat_checkpoint_thread_checkpoint'),
+    )
+
+class ChatCheckpointWrite(db.Model):
+    __tablename__ = 'chat_checkpoint_write'
+    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    thread_id = db.Column(db.String(255), nullable=False)
+    checkpoint_ns = db.Column(db.String(255), nullable=False, default='')
+    checkpoint_id = db.Column(db.String(64), nullable=False)
+    task_id = db.Column(db.String(64), nullable=False)
+    task_path = db.Column(db.String(255), nullable=False, default='')
+    idx = db.Column(db.Integer, nullable=False)
+    channel = db.Column(db.String(255), nullable=False)
+    value_type = db.Column(db.String(32), nullable=False)
+    value = db.Column(db.LargeBinary(CHECKPOINT_BLOB_SIZE), nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', 'task_id', 'idx', name='uq_chat_checkpoint_write_task'),
+    )
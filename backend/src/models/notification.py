@@ -0,0 +1,12 @@
+from src.db import db
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+class NotificationReadMarker(db.Model):
+    """How far a user has read the notification feed: the newest announcement and event id seen."""
+    __tablename__ = 'notification_read_marker'
+    user_id = db.Column(db.BigInteger, primary_key=True)
+    user_type = db.Column(db.Enum('admin', 'teacher', 'student'), primary_key=True)
+    last_announcement_id = db.Column(db.BigInteger, nullable=False, default=0)
+    last_event_id = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")), onupdate=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
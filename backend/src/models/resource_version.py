@@ -0,0 +1,10 @@
+from src.db import db
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+class ResourceVersion(db.Model):
+    """Change counter of a resource, keyed by its cache tag and bumped on every write to it."""
+    __tablename__ = 'resource_versions'
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(ZoneInfo("Asia/Karachi")))
@@ -2,13 +2,18 @@ from src.db import db
 
 class Result(db.Model):
     __tablename__ = 'results'
+    __table_args__ = (
+        db.Index('uq_results_student_subject_exam_label', 'student_id', 'subject_id', 'exam_type', 'exam_label', unique=True),
+    )
     id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
-    student_id = db.Column(db.BigInteger,db.ForeignKey('students.id'), nullable=False)
-    subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), nullable=False)
+    student_id = db.Column(db.BigInteger,db.ForeignKey('students.id'), nullable=False, index=True)
+    subject_id = db.Column(db.BigInteger, db.ForeignKey('subjects.id'), nullable=False, index=True)
     total_marks = db.Column(db.Numeric(5, 2), nullable=False)
     obtained_marks = db.Column(db.Numeric(5, 2), nullable=False)
     grade = db.Column(db.String(2), nullable=False)
     exam_type = db.Column(db.Enum('midterm', 'final', 'quiz', 'assignment'), default='final')
+    # Names one sitting of an exam type, e.g. "Quiz 3"; bulk entry upserts on it, single entries leave it empty.
+    exam_label = db.Column(db.String(100), nullable=True)
     remarks = db.Column(db.Text, nullable=True)
 
     student = db.relationship('Student', backref='results', lazy=True)
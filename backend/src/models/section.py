@@ -3,7 +3,7 @@ from src.db import db
 class Section(db.Model):
     __tablename__ = 'sections'
     id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
-    name = db.Column(db.String(255), nullable=False)
+    name = db.Column(db.String(255), nullable=False, unique=True, index=True)
     teacher_id = db.Column(db.BigInteger, db.ForeignKey("teachers.id"), nullable=False)
 
     teacher = db.relationship('Teacher', backref='sections', lazy=True)
\ No newline at end of file
@@ -1,16 +1,16 @@
 from src.db import db
-from src.extention import bcrypt
+from src.passwords import hash_password, verify_password
 
 class Teacher(db.Model):
     __tablename__ = 'teachers'
     id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
-    name = db.Column(db.String(255), nullable=False)
-    username = db.Column(db.String(255), nullable=False)
-    email = db.Column(db.String(255), nullable=False)
+    name = db.Column(db.String(255), nullable=False, index=True)
+    username = db.Column(db.String(255), nullable=False, unique=True, index=True)
+    email = db.Column(db.String(255), nullable=False, unique=True, index=True)
     password = db.Column(db.String(255), nullable=False)
 
     def set_password(self, password):
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = hash_password(password)
     def check_password(self, password):
-        return bcrypt.check_password_hash(self.password, password)
+        return verify_password(self.password, password)
     
\ No newline at end of file
@@ -0,0 +1,40 @@
+import os
+import threading
+from collections import deque
+
+NOTIFICATION_HUB_BUFFER = int(os.getenv("NOTIFICATION_HUB_BUFFER", 256))
+
+
+class NotificationHub:
+    """In-process ring buffer broadcasting new announcements and events to open streams."""
+
+    def __init__(self, buffer_size=NOTIFICATION_HUB_BUFFER):
+        self._items = deque(maxlen=buffer_size)
+        self._seq = 0
+        self._condition = threading.Condition()
+
+    @property
+    def seq(self):
+        with self._condition:
+            return self._seq
+
+    def publish(self, item):
+        with self._condition:
+            self._seq += 1
+            self._items.append((self._seq, item))
+            self._condition.notify_all()
+
+    def wait(self, after, timeout):
+        """Return ``(items, seq, missed)`` published after ``after``, waiting up to ``timeout`` seconds."""
+        with self._condition:
+            if self._seq == after:
+                self._condition.wait(timeout)
+            if self._seq == after:
+                return [], after, False
+            oldest = self._items[0][0] if self._items else self._seq + 1
+            missed = oldest > after + 1
+            items = [item for seq, item in self._items if seq > after]
+            return items, self._seq, missed
+
+
+notification_hub = NotificationHub()
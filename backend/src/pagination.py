@@ -0,0 +1,30 @@
+from flask import request, jsonify
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def get_page_args():
+    """Read the ``limit``/``cursor`` query parameters; a request without them gets the first page."""
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor", type=int)
+    return {
+        "limit": max(1, min(limit, MAX_PAGE_SIZE)),
+        "cursor": cursor
+    }
+
+
+def paginate(query, id_column, serializer, limit, cursor=None):
+    """Return one keyset page of ``query`` ordered by ``id_column``."""
+    if cursor is not None:
+        query = query.filter(id_column > cursor)
+
+    rows = query.order_by(None).order_by(id_column).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return jsonify({
+        "data": [serializer(row) for row in rows],
+        "next_cursor": rows[-1].id if has_more else None,
+        "status": "success"
+    })
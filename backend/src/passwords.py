@@ -0,0 +1,37 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from src.extention import bcrypt
+
+DEFAULT_LOG_ROUNDS = 12
+
+# bcrypt releases the GIL, so a batch of hashes runs in parallel on this
+# pool, capped so an import cannot occupy every core.
+_hash_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BCRYPT_WORKERS", os.cpu_count() or 2)),
+    thread_name_prefix="bcrypt"
+)
+
+
+def hash_password(password):
+    """Hash ``password`` at the configured cost."""
+    return bcrypt.generate_password_hash(password).decode("utf-8")
+
+
+def hash_passwords(passwords):
+    """Hash many passwords concurrently on the hashing pool, preserving input order."""
+    return [hashed.decode("utf-8") for hashed in _hash_pool.map(bcrypt.generate_password_hash, passwords)]
+
+
+def verify_password(password_hash, password):
+    """Check ``password`` against a stored bcrypt hash."""
+    return bcrypt.check_password_hash(password_hash, password)
+
+
+def password_needs_rehash(password_hash):
+    """True when ``password_hash`` was made with a cost other than the current one."""
+    try:
+        rounds = int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return True
+    return rounds != current_app.config.get("BCRYPT_LOG_ROUNDS", DEFAULT_LOG_ROUNDS)
@@ -14,6 +14,8 @@ from .course import course_bp
 from .enrollment import enrollment_bp
 from .event import event_bp
 from .attendance import attendance_bp
+from .dashboard import dashboard_bp
+from .notification import notification_bp
 
-__all__ = ["home_bp","auth_bp","student_bp","teacher_bp","admin_bp","assignment_bp","subject_bp","result_bp","section_bp","assignment_submission_bp","announcement_bp","chatbot_bp","course_bp","enrollment_bp","event_bp","attendance_bp"]
+__all__ = ["home_bp","auth_bp","student_bp","teacher_bp","admin_bp","assignment_bp","subject_bp","result_bp","section_bp","assignment_submission_bp","announcement_bp","chatbot_bp","course_bp","enrollment_bp","event_bp","attendance_bp","dashboard_bp","notification_bp"]
 
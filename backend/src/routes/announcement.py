@@ -4,6 +4,7 @@ from src.schemas import AnnouncementSchema,UpdateAnnouncementSchema
 from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt,get_jwt_identity
 from src.models import Section
+from src.pagination import get_page_args
 
 announcement_bp = Blueprint("announcement",__name__)
 
@@ -50,7 +51,7 @@ def create_announce():
 def fetch_all_announcements():
     announcement_title = request.args.get("title")
     if not announcement_title:
-        result = get_all_announcements()
+        result = get_all_announcements(**get_page_args())
         return result
 
     result = get_announcement_by_title(announcement_title)
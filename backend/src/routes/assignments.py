@@ -4,6 +4,7 @@ from src.schemas import assignmentSchema,UpdateAssignmentSchema
 from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from src.models import Subject
+from src.pagination import get_page_args
 
 assignment_bp = Blueprint("assignment", __name__)
 
@@ -47,7 +48,7 @@ def get_assignments():
     if assignment_id:
         result = get_assignment_by_id(assignment_id)
     else:
-        result = get_all_assignments()
+        result = get_all_assignments(**get_page_args())
     return result
 
 @assignment_bp.route("/api/update/assignments/", methods=["PUT"])
@@ -1,9 +1,11 @@
-from src.schemas import AttendanceSchema, UpdateAttendanceSchema
-from src.services import mark_attend, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance
+from src.schemas import AttendanceSchema, UpdateAttendanceSchema, BulkAttendanceSchema
+from src.services import mark_attend, mark_bulk_attendance, get_attendance_summary, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
-from flask_jwt_extended import jwt_required,get_jwt
-from src.models import Student,Attendance,Subject
+from flask_jwt_extended import jwt_required,get_jwt,get_jwt_identity
+from src.models import Student,Attendance,Subject,Section
+from src.pagination import get_page_args
+from src.streaming import get_stream_args
 
 attendance_bp = Blueprint('attendance', __name__)
 
@@ -44,6 +46,43 @@ def create_attendance():
     result = mark_attend(student.id, subject.id,status)
     return result
 
+@attendance_bp.route("/api/attendance/bulk", methods=["POST"])
+@jwt_required()
+def create_bulk_attendance():
+
+    token = get_jwt()
+    if token["role"] != "teacher":
+        return jsonify({
+            "message":"only teachers can create attendance",
+            "status":"failed"
+        }),403
+
+    try:
+        data = BulkAttendanceSchema().load(request.get_json())
+    except ValidationError as err:
+        return jsonify(err.messages), 400
+
+    subject = Subject.query.filter_by(name=data['subject_name']).first()
+    if not subject:
+        return jsonify({
+            "message": "Subject not found",
+            "status": "failed"
+        }), 400
+
+    section_id = None
+    if 'section_name' in data:
+        section = Section.query.filter_by(name=data['section_name']).first()
+        if not section:
+            return jsonify({
+                "message": "Section not found",
+                "status": "failed"
+            }), 400
+        section_id = section.id
+
+    entries = {entry['student_id']: entry['status'] for entry in data['entries']}
+    result = mark_bulk_attendance(subject.id, section_id, entries, data['default_status'])
+    return result
+
 @attendance_bp.route("/api/get/attendance", methods=["GET"])
 @jwt_required()
 def fetch_attendance():
@@ -67,8 +106,39 @@ def fetch_attendance():
             }), 400
         return get_attendance_by_subject(subject.id)
     else:
-        return get_all_attendance()
+        return get_all_attendance(**get_page_args(), **get_stream_args())
     
+@attendance_bp.route("/api/get/attendance/summary", methods=["GET"])
+@jwt_required()
+def fetch_attendance_summary():
+    token = get_jwt()
+    student_name = request.args.get('student_name')
+    subject_name = request.args.get('subject_name')
+
+    student_id = None
+    if token["role"] == "student":
+        student_id = int(get_jwt_identity())
+    elif student_name:
+        student = Student.query.filter_by(name=student_name).first()
+        if not student:
+            return jsonify({
+                "message": "Student not found",
+                "status": "failed"
+            }), 400
+        student_id = student.id
+
+    subject_id = None
+    if subject_name:
+        subject = Subject.query.filter_by(name=subject_name).first()
+        if not subject:
+            return jsonify({
+                "message": "Subject not found",
+                "status": "failed"
+            }), 400
+        subject_id = subject.id
+
+    return get_attendance_summary(student_id, subject_id)
+
 @attendance_bp.route("/api/update/attendance", methods=["PUT"])
 @jwt_required()
 def modify_attendance():
@@ -1,6 +1,8 @@
-from flask import Blueprint,request,jsonify
-from src.models import Admin,Teacher,Student
+from functools import partial
+from flask import Blueprint,request,jsonify,current_app
 from flask_jwt_extended import create_access_token
+from src.passwords import verify_password, password_needs_rehash
+from src.services import find_user_by_email, upgrade_password_hash
 from marshmallow import ValidationError
 from src.schemas import loginSchema
 from flask_jwt_extended import jwt_required, get_jwt_identity
@@ -24,28 +26,14 @@ def login():
         }), 400
     
 
-    role = ''
-    user = Admin.query.filter_by(email=email).first()
-    if user:
-        role = 'admin'
-    
-    if not role or not user:
-        user = Teacher.query.filter_by(email=email).first()
-        if user:
-            role = 'teacher'
-
-    if not role or not user:
-        user = Student.query.filter_by(email=email).first()
-        if user:
-            role = 'student'
-    
+    user = find_user_by_email(email)
 
     if not user:
         return jsonify({
             "status": False,
             "message": "Invalid email"
         }), 401
-    if not user.check_password(password):
+    if not verify_password(user.password, password):
         return jsonify({
             "status": False,
             "message": "Invalid password"
@@ -53,21 +41,24 @@ def login():
     try:
         # Include user information in JWT token
         additional_claims = {
-            "role": role,
+            "role": user.role,
             "name": user.name,
             "email": user.email,
-            "username": user.username if hasattr(user, 'username') else user.email
+            "username": user.username or user.email
         }
         token = create_access_token(identity=str(user.id), additional_claims=additional_claims)
     except Exception as e:
         return jsonify({
             "message": f"you have an error: {str(e)}"
         })
-    return jsonify({
+    response = jsonify({
         "status": True,
         "message": "Login successful",
         "token": token
     })
+    if password_needs_rehash(user.password):
+        response.call_on_close(partial(upgrade_password_hash, current_app._get_current_object(), user, password))
+    return response
 
 @auth_bp.route("/api/protected", methods=["GET"])
 @jwt_required()
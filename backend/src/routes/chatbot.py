@@ -1,11 +1,85 @@
-from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt
-from src.agent.main import create_chatbot_graph
-from langchain_core.messages import HumanMessage, AIMessage
+import time
+import uuid
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from src.agent.main import get_chatbot_graph, warm_up_chatbot_graphs, clear_conversation
+from src.streaming import sse_event, sse_response
+from src.concurrency import chat_limiter
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
 
 chatbot_bp = Blueprint("chatbot", __name__)
 
+# Compile the per-role graphs when the app registers the blueprint rather
+# than on the first chat request.
+chatbot_bp.record_once(lambda state: warm_up_chatbot_graphs())
+
+MAX_CONVERSATION_ID_LENGTH = 64
+
+def _conversation_thread_id(user_role, conversation_id):
+    """Scope a conversation to its owner so ids cannot be shared across users."""
+    return f"{user_role}:{get_jwt_identity()}:{conversation_id}"
+
+def _acquire_chat_slot(user_role):
+    """Reserve a chat slot for the caller, or build the 429 response when none is free."""
+    lease = chat_limiter.try_acquire(f"{user_role}:{get_jwt_identity()}")
+    if lease is not None:
+        return lease, None
+
+    response = jsonify({
+        "message": "The assistant is busy, please retry shortly",
+        "status": "failed"
+    })
+    response.headers["Retry-After"] = str(chat_limiter.retry_after)
+    return None, (response, 429)
+
+def _turn_tool_timings(messages):
+    """Per-tool durations of the latest turn, taken from its ToolMessages."""
+    timings = []
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, ToolMessage):
+            timings.append({"name": message.name, "duration_ms": message.response_metadata.get("duration_ms")})
+    return timings[::-1]
+
+def _read_chat_request(token, user_role):
+    """Validate a chat request body; returns ``(chat, None)`` or ``(None, error_response)``."""
+    data = request.get_json()
+    if not data or not data.get("message"):
+        return None, (jsonify({
+            "message": "Message is required",
+            "status": "failed"
+        }), 400)
+
+    conversation_id = data.get("conversation_id")
+    if conversation_id is not None and (not isinstance(conversation_id, str) or not conversation_id or len(conversation_id) > MAX_CONVERSATION_ID_LENGTH):
+        return None, (jsonify({
+            "message": "Invalid conversation_id",
+            "status": "failed"
+        }), 400)
+
+    # Earlier turns come from the checkpoint; a new conversation is seeded from ``history``.
+    messages = []
+    if conversation_id is None:
+        conversation_id = uuid.uuid4().hex
+        for msg in data.get("history", []):
+            if msg.get("role") == "user":
+                messages.append(HumanMessage(content=msg.get("content", "")))
+            elif msg.get("role") == "assistant":
+                messages.append(AIMessage(content=msg.get("content", "")))
+    messages.append(HumanMessage(content=data["message"]))
+
+    return {
+        "state": {
+            "messages": messages,
+            "user_role": user_role,
+            "user_info": dict(token)
+        },
+        "config": {"configurable": {"thread_id": _conversation_thread_id(user_role, conversation_id)}},
+        "conversation_id": conversation_id
+    }, None
+
 @chatbot_bp.route("/api/chat", methods=["POST"])
 @jwt_required()
 def chat():
@@ -20,54 +94,152 @@ def chat():
             "status": "failed"
         }), 403
 
+    lease, busy = _acquire_chat_slot(user_role)
+    if busy:
+        return busy
+
     try:
-        data = request.get_json()
-        if not data or not data.get("message"):
-            return jsonify({
-                "message": "Message is required",
-                "status": "failed"
-            }), 400
-
-        user_message = data["message"]
-        conversation_history = data.get("history", [])
-
-        with current_app.app_context():
-            # user_id = token.get("id")
-            graph = create_chatbot_graph(user_role)
-
-            # Convert conversation history to LangChain messages
-            messages = []
-            for msg in conversation_history:
-                if msg.get("role") == "user":
-                    messages.append(HumanMessage(content=msg.get("content", "")))
-                elif msg.get("role") == "assistant":
-                    messages.append(AIMessage(content=msg.get("content", "")))
-            
-            # Add the new user message
-            messages.append(HumanMessage(content=user_message))
-
-            initial_state = {
-                "messages": messages,
-                "user_role": user_role,
-                "user_info": dict(token)
-            }
-
-            result = graph.invoke(initial_state)
-
-            ai_messages = [msg for msg in result["messages"] if isinstance(msg, AIMessage)]
-            if ai_messages:
-                response_text = ai_messages[-1].content
-            else:
-                response_text = "I couldn't process your request."
+        chat_request, error = _read_chat_request(token, user_role)
+        if error:
+            return error
 
-        return jsonify({
+        started = time.perf_counter()
+        graph = get_chatbot_graph(user_role)
+        graph_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        # Persist once per turn instead of after every graph step.
+        result = graph.invoke(chat_request["state"], config=chat_request["config"], durability="exit")
+        invoke_ms = (time.perf_counter() - started) * 1000
+
+        tool_timings = _turn_tool_timings(result["messages"])
+        last_message = result["messages"][-1] if result["messages"] else None
+        if isinstance(last_message, AIMessage):
+            response_text = last_message.content
+        else:
+            response_text = "I couldn't process your request."
+
+        response = jsonify({
             "message": response_text,
             "status": "success",
-            "role": user_role
-        }), 200
+            "role": user_role,
+            "conversation_id": chat_request["conversation_id"],
+            "tool_timings": tool_timings
+        })
+        server_timing = [f"graph;dur={graph_ms:.2f}", f"invoke;dur={invoke_ms:.2f}"]
+        server_timing += [f"tool-{index};desc=\"{timing['name']}\";dur={timing['duration_ms']}" for index, timing in enumerate(tool_timings)]
+        response.headers["Server-Timing"] = ", ".join(server_timing)
+        return response, 200
+
+    except Exception as e:
+        return jsonify({
+            "message": f"An error occurred: {str(e)}",
+            "status": "failed"
+        }), 500
+    finally:
+        lease.release()
+
+@chatbot_bp.route("/api/chat/stream", methods=["POST"])
+@jwt_required()
+def chat_stream():
+    """Chat with the LMS assistant, streaming progress as Server-Sent Events."""
+
+    token = get_jwt()
+    user_role = token.get("role")
+
+    if not user_role or user_role not in ["admin", "teacher", "student"]:
+        return jsonify({
+            "message": "Invalid or missing user role",
+            "status": "failed"
+        }), 403
+
+    chat_request, error = _read_chat_request(token, user_role)
+    if error:
+        return error
+
+    lease, busy = _acquire_chat_slot(user_role)
+    if busy:
+        return busy
+
+    def generate():
+        conversation_id = chat_request["conversation_id"]
+        yield sse_event("conversation", {"conversation_id": conversation_id})
+
+        response_text = None
+        try:
+            graph = get_chatbot_graph(user_role)
+            stream = graph.stream(
+                chat_request["state"],
+                config=chat_request["config"],
+                stream_mode=["messages", "updates"],
+                durability="exit"
+            )
+            for mode, chunk in stream:
+                if mode == "messages":
+                    message, metadata = chunk
+                    # Only the answering model streams; the summarizer stays silent.
+                    if metadata.get("langgraph_node") == "agent" and isinstance(message.content, str) and message.content:
+                        yield sse_event("token", {"content": message.content})
+                    continue
+
+                for node, update in chunk.items():
+                    if not update:
+                        continue
+                    if node == "agent":
+                        last_message = update["messages"][-1]
+                        for tool_call in last_message.tool_calls:
+                            yield sse_event("tool_call", {"name": tool_call["name"], "args": tool_call["args"]})
+                        if not last_message.tool_calls:
+                            response_text = last_message.content
+                    elif node == "tools":
+                        for tool_message in update["messages"]:
+                            yield sse_event("tool_result", {
+                                "name": tool_message.name,
+                                "status": tool_message.status,
+                                "duration_ms": tool_message.response_metadata.get("duration_ms")
+                            })
+        except Exception as e:
+            yield sse_event("error", {"message": f"An error occurred: {str(e)}", "status": "failed"})
+            return
+        finally:
+            lease.release()
+
+        yield sse_event("done", {
+            "message": response_text or "I couldn't process your request.",
+            "status": "success",
+            "role": user_role,
+            "conversation_id": conversation_id
+        })
+
+    # The slot is freed once the graph finishes, or when the stream closes
+    # if the client leaves before that.
+    response = sse_response(generate())
+    response.call_on_close(lease.release)
+    return response
 
+@chatbot_bp.route("/api/chat/<conversation_id>", methods=["DELETE"])
+@jwt_required()
+def delete_conversation(conversation_id):
+    """Forget a conversation stored for the current user."""
+
+    token = get_jwt()
+    user_role = token.get("role")
+
+    if not user_role or user_role not in ["admin", "teacher", "student"]:
+        return jsonify({
+            "message": "Invalid or missing user role",
+            "status": "failed"
+        }), 403
+
+    try:
+        clear_conversation(_conversation_thread_id(user_role, conversation_id))
     except Exception as e:
         return jsonify({
             "message": f"An error occurred: {str(e)}",
             "status": "failed"
-        }), 500
\ No newline at end of file
+        }), 500
+
+    return jsonify({
+        "message": "Conversation deleted",
+        "status": "success"
+    }), 200
@@ -4,6 +4,8 @@ from flask import jsonify,Blueprint,request
 from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt
 from src.models import Teacher
+from src.pagination import get_page_args
+from src.conditional import conditional
 
 course_bp = Blueprint("course",__name__)
 
@@ -47,11 +49,12 @@ def add_cour():
 
 @course_bp.route("/api/get/courses", methods=["GET"])
 @jwt_required()
+@conditional("courses", "teachers")
 def get_cour():
     course_id = request.args.get("id", type=int)
 
     if course_id is None:
-        return get_all_courses()
+        return get_all_courses(**get_page_args())
         
 
     result = get_course_by_id(course_id)
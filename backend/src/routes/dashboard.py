@@ -0,0 +1,11 @@
+from flask import Blueprint
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from src.services import get_dashboard_summary
+
+dashboard_bp = Blueprint("dashboard", __name__)
+
+@dashboard_bp.route("/api/dashboard/summary", methods=["GET"])
+@jwt_required()
+def dashboard_summary():
+    token = get_jwt()
+    return get_dashboard_summary(token["role"], int(get_jwt_identity()))
@@ -4,6 +4,8 @@ from flask_jwt_extended import jwt_required, get_jwt
 from flask import jsonify,Blueprint,request
 from marshmallow import ValidationError
 from src.models import Student,Course
+from src.pagination import get_page_args
+from src.streaming import get_stream_args
 
 enrollment_bp = Blueprint("enrollment",__name__)
 
@@ -72,7 +74,7 @@ def get_enrollments():
             return jsonify({"message": "Student not found", "status": "failed"}), 404
         result = get_enrollments_by_student(student.id)
         return result
-    all_enrollments = get_all_enrollments()
+    all_enrollments = get_all_enrollments(**get_page_args(), **get_stream_args())
     return all_enrollments
 
 @enrollment_bp.route("/api/update/enrollment", methods=["PUT"])
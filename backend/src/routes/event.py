@@ -3,6 +3,8 @@ from src.services import add_event, get_event_by_id, get_all_events,update_event
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt,get_jwt_identity
+from src.pagination import get_page_args
+from src.conditional import conditional
 
 
 event_bp = Blueprint("event", __name__)
@@ -40,12 +42,13 @@ def create_ev():
 
 @event_bp.route("/api/get/events", methods=["GET"])
 @jwt_required()
+@conditional("events")
 def get_events():
     event_id = request.args.get("id", type=int)
     if event_id:
         result = get_event_by_id(event_id)
     else:
-        result = get_all_events()
+        result = get_all_events(**get_page_args())
     return result
 
 @event_bp.route("/api/update/event", methods=["PUT"])
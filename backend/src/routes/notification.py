@@ -0,0 +1,51 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from src.services import get_notifications, mark_notifications_read, parse_notification_cursor, stream_notifications
+
+notification_bp = Blueprint("notification", __name__)
+
+@notification_bp.route("/api/notifications", methods=["GET"])
+@jwt_required()
+def notifications():
+    token = get_jwt()
+    since = request.args.get("since")
+    cursor = None
+    if since:
+        cursor = parse_notification_cursor(since)
+        if cursor is None:
+            return jsonify({
+                "message": "Invalid cursor",
+                "status": "failed"
+            }), 400
+    return get_notifications(token["role"], int(get_jwt_identity()), cursor)
+
+@notification_bp.route("/api/notifications/stream", methods=["GET"])
+@jwt_required()
+def notifications_stream():
+    token = get_jwt()
+    # Browsers resend the last event id on reconnect; fetch clients may pass it as ?since=.
+    since = request.headers.get("Last-Event-ID") or request.args.get("since")
+    cursor = None
+    if since:
+        cursor = parse_notification_cursor(since)
+        if cursor is None:
+            return jsonify({
+                "message": "Invalid cursor",
+                "status": "failed"
+            }), 400
+    return stream_notifications(token["role"], int(get_jwt_identity()), cursor)
+
+@notification_bp.route("/api/notifications/read", methods=["POST"])
+@jwt_required()
+def notifications_read():
+    token = get_jwt()
+    data = request.get_json(silent=True) or {}
+    cursor = None
+    if data.get("cursor"):
+        cursor = parse_notification_cursor(data["cursor"])
+        if cursor is None:
+            return jsonify({
+                "message": "Invalid cursor",
+                "status": "failed"
+            }), 400
+    return mark_notifications_read(token["role"], int(get_jwt_identity()), cursor)
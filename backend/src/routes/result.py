@@ -1,9 +1,11 @@
-from src.services import add_result, get_result_by_id, get_all_results, edit_result, delete_result, get_results_by_student
+from src.services import add_result, add_bulk_results, get_student_transcript, get_result_analytics, get_result_by_id, get_all_results, edit_result, delete_result, get_results_by_student
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
-from src.schemas import ResultSchema,UpdateResultSchema
+from src.schemas import ResultSchema,UpdateResultSchema,BulkResultSchema
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from src.models import Student,Result,Subject 
+from src.pagination import get_page_args
+from src.streaming import get_stream_args
 
 result_bp = Blueprint("result", __name__)
 
@@ -48,6 +50,31 @@ def create_res():
     result = add_result(subject.id, student.id, total_marks, obtained_marks, exam_type, remarks)
     return result
 
+@result_bp.route("/api/create/result/bulk", methods=["POST"])
+@jwt_required()
+def create_bulk_res():
+
+    token = get_jwt()
+    if token["role"] != "teacher":
+        return jsonify({
+            "message":"only teacher's can add results",
+            "status":"failed"
+        }),403
+
+    try:
+        data = BulkResultSchema().load(request.get_json())
+    except ValidationError as e:
+        return jsonify(e.messages), 400
+
+    subject = Subject.query.filter_by(name=data["subject_name"]).first()
+    if not subject:
+        return jsonify({
+            "message": "Subject not found",
+            "status": "failed"
+        }), 400
+
+    return add_bulk_results(subject.id, data["exam_type"], data["exam_label"], data["results"], data.get("total_marks"))
+
 @result_bp.route("/api/get/result", methods=["GET"])
 @jwt_required()
 def get_res():
@@ -77,7 +104,7 @@ def get_res():
         result = get_results_by_student(user_id)
         return result
     elif user_role == "teacher" or user_role == "admin":
-        result = get_all_results()
+        result = get_all_results(**get_page_args(), **get_stream_args())
         return result
     else:
         return jsonify({
@@ -85,6 +112,54 @@ def get_res():
             "status": "failed"
         }), 403
 
+@result_bp.route("/api/get/result/transcript", methods=["GET"])
+@jwt_required()
+def get_transcript():
+    token = get_jwt()
+
+    if token["role"] == "student":
+        return get_student_transcript(int(get_jwt_identity()))
+
+    student_name = request.args.get("student_name")
+    if not student_name:
+        return jsonify({
+            "message": "student_name is required",
+            "status": "error"
+        }), 400
+    student = Student.query.filter_by(name=student_name).first()
+    if not student:
+        return jsonify({
+            "message": "Student not found",
+            "status": "failed"
+        }), 400
+    return get_student_transcript(student.id)
+
+@result_bp.route("/api/get/result/analytics", methods=["GET"])
+@jwt_required()
+def get_analytics():
+    token = get_jwt()
+    if token["role"] not in ["admin", "teacher"]:
+        return jsonify({
+            "message": "Only admin and teacher can view result analytics",
+            "status": "failed"
+        }), 403
+
+    subject_name = request.args.get("subject_name")
+    exam_type = request.args.get("exam_type")
+    if not subject_name or exam_type not in ['midterm', 'final', 'quiz', 'assignment']:
+        return jsonify({
+            "message": "subject_name and exam_type (midterm, final, quiz, assignment) are required",
+            "status": "error"
+        }), 400
+    subject = Subject.query.filter_by(name=subject_name).first()
+    if not subject:
+        return jsonify({
+            "message": "Subject not found",
+            "status": "failed"
+        }), 400
+
+    return get_result_analytics(subject.id, exam_type, request.args.get("top", type=int))
+
 @result_bp.route("/api/update/result", methods=["PUT"])
 @jwt_required()
 def update_res():
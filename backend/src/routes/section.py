@@ -4,6 +4,8 @@ from src.schemas import SectionSchema,UpdateSectionSchema
 from marshmallow import ValidationError
 from flask_jwt_extended import jwt_required,get_jwt
 from src.models import Teacher
+from src.pagination import get_page_args
+from src.conditional import conditional
 
 section_bp = Blueprint("section", __name__)
 
@@ -38,10 +40,11 @@ def add_sec():
 
 @section_bp.route("/api/get/section", methods=["GET"])
 @jwt_required()
+@conditional("sections", "teachers")
 def get_sec():
     section_id = request.args.get("id", type=int)
     if section_id is None:
-        result = get_all_sections()
+        result = get_all_sections(**get_page_args())
         return result
 
     result = get_section_by_id(section_id)
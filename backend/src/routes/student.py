@@ -1,8 +1,9 @@
 from flask import Blueprint, request,jsonify
 from src.models import Section,Student
-from src.services import add_students, get_all_students, get_student_by_id, update_student, delete_student
+from src.services import add_students, get_all_students, get_student_by_id, update_student, delete_student, import_students
 from flask_jwt_extended import jwt_required , get_jwt, get_jwt_identity
 from src.schemas import RegisterStudentSchema,UpdateStudentSchema
+from src.pagination import get_page_args
 from marshmallow import ValidationError
 
 student_bp = Blueprint("student",__name__)
@@ -43,6 +44,26 @@ def add_student():
 
     return result
    
+@student_bp.route("/api/import/students", methods=["POST"])
+@jwt_required()
+def import_students_file():
+
+    token = get_jwt()
+    if token["role"] != "admin":
+        return jsonify({
+            "message":"only admins can import students",
+            "status":"failed"
+        }),403
+
+    upload = request.files.get("file")
+    if not upload:
+        return jsonify({
+            "message": "Upload a file in the 'file' field",
+            "status": "failed"
+        }), 400
+
+    return import_students(upload)
+
 @student_bp.route("/api/get/student", methods=["GET"])
 @jwt_required()
 def get_student():
@@ -57,7 +78,7 @@ def get_student():
             return jsonify({
                 "message":"Only admin and teacher can access all student details"
             }),403
-        return get_all_students()
+        return get_all_students(**get_page_args())
 
     student_data = Student.query.get(student_id)
 
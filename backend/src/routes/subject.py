@@ -4,6 +4,8 @@ from marshmallow import ValidationError
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt
 from src.models import Teacher,Course
+from src.pagination import get_page_args
+from src.conditional import conditional
 
 subject_bp = Blueprint("subject", __name__)
 
@@ -46,11 +48,12 @@ def create_subj():
 
 @subject_bp.route("/api/get/subjects", methods=["GET"])
 @jwt_required()
+@conditional("subjects", "teachers", "courses")
 def get_subj():
     subject_id = request.args.get("id", type=int)
 
     if subject_id is None:
-        return get_all_subjects()
+        return get_all_subjects(**get_page_args())
         
 
     result = get_subject_by_id(subject_id)
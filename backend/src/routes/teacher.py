@@ -2,7 +2,8 @@ from flask import Blueprint,jsonify,request
 from flask_jwt_extended import jwt_required,get_jwt
 from src.schemas import RegisterTeacherSchema,UpdateTeacherSchema
 from marshmallow import ValidationError
-from src.services import add_teacher, get_teacher_by_id, update_teacher, delete_teacher, get_all_teachers
+from src.services import add_teacher, get_teacher_by_id, update_teacher, delete_teacher, get_all_teachers, import_teachers
+from src.pagination import get_page_args
 
 teacher_bp = Blueprint("teacher",__name__)
 
@@ -30,6 +31,26 @@ def add_teach():
     return result
 
 
+@teacher_bp.route("/api/import/teachers", methods=["POST"])
+@jwt_required()
+def import_teachers_file():
+
+    token = get_jwt()
+    if token["role"] != "admin":
+        return jsonify({
+            "message":"only admins can import teachers",
+            "status":"failed"
+        }),403
+
+    upload = request.files.get("file")
+    if not upload:
+        return jsonify({
+            "message": "Upload a file in the 'file' field",
+            "status": "failed"
+        }), 400
+
+    return import_teachers(upload)
+
 @teacher_bp.route("/api/get/teacher")
 @jwt_required()
 def get_teacher():
@@ -43,7 +64,7 @@ def get_teacher():
                 "message":"Admins have acess to see all the teacher's!"
             }),403
         
-        result = get_all_teachers()
+        result = get_all_teachers(**get_page_args())
         return result
         
     result = get_teacher_by_id(teacher_id)
@@ -1,13 +1,13 @@
 from .announcement import AnnouncementSchema, UpdateAnnouncementSchema
 from .assignment_submission import AssignmentSubmissionSchema, UpdateAssignmentSubmissionSchema
 from .assignment import assignmentSchema, UpdateAssignmentSchema
-from .attendance import AttendanceSchema,UpdateAttendanceSchema
+from .attendance import AttendanceSchema,UpdateAttendanceSchema,BulkAttendanceSchema
 from .auth_schema import RegisterAdminSchema, RegisterTeacherSchema,RegisterStudentSchema,UpdateTeacherSchema,UpdateStudentSchema,loginSchema
 from .course import CourseSchema, UpdateCourseSchema
 from .enrollment import EnrollmentSchema,UpdateEnrollmentSchema
 from .event import EventSchema,UpdateEventSchema
-from .result import ResultSchema, UpdateResultSchema
+from .result import ResultSchema, UpdateResultSchema, BulkResultSchema
 from .section import SectionSchema,UpdateSectionSchema
 from .subject import subjectSchema,UpdateSubjectSchema
 
-__all__ = ["AnnouncementSchema","UpdateAnnouncementSchema","AssignmentSubmissionSchema","UpdateAssignmentSubmissionSchema","assignmentSchema","UpdateAssignmentSchema","AttendanceSchema","UpdateAttendanceSchema", "RegisterAdminSchema","RegisterTeacherSchema","RegisterStudentSchema","UpdateTeacherSchema","UpdateStudentSchema","loginSchema","CourseSchema","UpdateCourseSchema","EnrollmentSchema","UpdateEnrollmentSchema","EventSchema","UpdateEventSchema","ResultSchema","UpdateResultSchema","SectionSchema","UpdateSectionSchema", "subjectSchema","UpdateSubjectSchema"]
\ No newline at end of file
+__all__ = ["AnnouncementSchema","UpdateAnnouncementSchema","AssignmentSubmissionSchema","UpdateAssignmentSubmissionSchema","assignmentSchema","UpdateAssignmentSchema","AttendanceSchema","UpdateAttendanceSchema","BulkAttendanceSchema", "RegisterAdminSchema","RegisterTeacherSchema","RegisterStudentSchema","UpdateTeacherSchema","UpdateStudentSchema","loginSchema","CourseSchema","UpdateCourseSchema","EnrollmentSchema","UpdateEnrollmentSchema","EventSchema","UpdateEventSchema","ResultSchema","UpdateResultSchema","BulkResultSchema","SectionSchema","UpdateSectionSchema", "subjectSchema","UpdateSubjectSchema"]
\ No newline at end of file
@@ -9,3 +9,13 @@ class UpdateAttendanceSchema(Schema):
     student_name = fields.Str(required=False)
     subject_name = fields.Str(required=False)
     status = fields.Str(validate=validate.OneOf(["present", "absent", "late"]),required=False)
+
+class BulkAttendanceEntrySchema(Schema):
+    student_id = fields.Int(required=True)
+    status = fields.Str(required=True, validate=validate.OneOf(["present", "absent", "late"]))
+
+class BulkAttendanceSchema(Schema):
+    subject_name = fields.Str(required=True)
+    section_name = fields.Str(required=False)
+    default_status = fields.Str(load_default="present", validate=validate.OneOf(["present", "absent", "late"]))
+    entries = fields.List(fields.Nested(BulkAttendanceEntrySchema), load_default=list)
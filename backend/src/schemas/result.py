@@ -16,4 +16,17 @@ class UpdateResultSchema(Schema):
     total_marks = fields.Decimal(as_string=True, required=False)
     exam_type = fields.String(required=False, validate=validate.Length(min=2, max=50))
     remarks = fields.String(required=False, validate=validate.Length(max=255))
-    obtained_marks = fields.Decimal(as_string=True, required=False)
\ No newline at end of file
+    obtained_marks = fields.Decimal(as_string=True, required=False)
+
+class BulkResultEntrySchema(Schema):
+    student_id = fields.Integer(required=True)
+    obtained_marks = fields.Decimal(as_string=True, required=True)
+    total_marks = fields.Decimal(as_string=True, required=False)
+    remarks = fields.String(required=False, validate=validate.Length(max=255))
+
+class BulkResultSchema(Schema):
+    subject_name = fields.String(required=True)
+    exam_type = fields.String(required=True, validate=validate.OneOf(['midterm', 'final', 'quiz', 'assignment']))
+    exam_label = fields.String(required=True, validate=validate.Length(min=1, max=100))
+    total_marks = fields.Decimal(as_string=True, required=False)
+    results = fields.List(fields.Nested(BulkResultEntrySchema), required=True, validate=validate.Length(min=1))
@@ -0,0 +1,164 @@
+def _name(related):
+    return related.name if related is not None else None
+
+
+def student_row(student):
+    return {
+        "id": student.id,
+        "name": student.name,
+        "username": student.username,
+        "email": student.email,
+        "section_name": _name(student.section)
+    }
+
+
+def teacher_row(teacher):
+    return {
+        "id": teacher.id,
+        "name": teacher.name,
+        "username": teacher.username,
+        "email": teacher.email,
+        "subjects": [subject.name for subject in teacher.subjects]
+    }
+
+
+def course_row(course):
+    return {
+        "id": course.id,
+        "name": course.name,
+        "description": course.description,
+        "course_code": course.course_code,
+        "created_at": course.created_at,
+        "teacher_name": _name(course.teacher)
+    }
+
+
+def subject_row(subject):
+    return {
+        "id": subject.id,
+        "name": subject.name,
+        "teacher_name": _name(subject.teacher),
+        "course_name": _name(subject.course)
+    }
+
+
+def section_row(section):
+    return {
+        "id": section.id,
+        "name": section.name,
+        "teacher_name": _name(section.teacher)
+    }
+
+
+def event_row(event):
+    return {
+        "id": event.id,
+        "title": event.title,
+        "description": event.description,
+        "event_date": str(event.event_date),
+        "event_time": str(event.event_time),
+        "admin_id": event.admin_id,
+        "created_at": str(event.created_at)
+    }
+
+
+def announcement_row(announcement):
+    return {
+        "id": announcement.id,
+        "title": announcement.title,
+        "content": announcement.content,
+        "target_audience": announcement.target_audience,
+        "created_at": announcement.created_at,
+        "teacher_id": announcement.teacher_id,
+        "section_name": _name(announcement.section)
+    }
+
+
+def assignment_row(assignment):
+    return {
+        "id": assignment.id,
+        "title": assignment.title,
+        "description": assignment.description,
+        "due_date": assignment.due_date,
+        "total_marks": str(assignment.total_marks),
+        "subject_name": _name(assignment.subject),
+        "teacher_name": _name(assignment.teacher)
+    }
+
+
+def enrollment_row(enrollment):
+    return {
+        "id": enrollment.id,
+        "enrollment_date": enrollment.enrollment_date,
+        "status": enrollment.status,
+        "grade": enrollment.grade,
+        "student_name": _name(enrollment.student),
+        "course_name": _name(enrollment.course)
+    }
+
+
+def result_row(result):
+    return {
+        "id": result.id,
+        "total_marks": float(result.total_marks),
+        "obtained_marks": float(result.obtained_marks),
+        "grade": result.grade,
+        "exam_type": result.exam_type,
+        "exam_label": result.exam_label,
+        "remarks": result.remarks,
+        "subject_name": _name(result.subject),
+        "student_name": _name(result.student)
+    }
+
+
+# Attendance listings select the names as labelled columns next to the record.
+def attendance_row(record):
+    return {
+        "id": record.id,
+        "student_name": record.student_name,
+        "subject_name": record.subject_name,
+        "mark_at": record.mark_at,
+        "status": record.status
+    }
+
+
+def attendance_summary_row(summary):
+    return {
+        "student_name": summary.student_name,
+        "subject_name": summary.subject_name,
+        "present": summary.present,
+        "absent": summary.absent,
+        "late": summary.late,
+        "total": summary.total,
+        "present_rate": round(summary.present * 100 / summary.total, 1) if summary.total else 0.0
+    }
+
+
+def _submission_fields(submission):
+    marks = float(submission.marks) if submission.marks is not None else None
+    return {
+        "id": submission.id,
+        "submission_text": submission.submission_text or "",
+        "submission_file": submission.submission_file or "",
+        "submitted_at": submission.submitted_at.isoformat() if submission.submitted_at else None,
+        "marks": marks,
+        "marks_obtained": marks,
+        "feedback": submission.feedback or ""
+    }
+
+
+# A student's submissions name the assignment; an assignment's name the student.
+def student_submission_row(submission):
+    row = _submission_fields(submission)
+    row["assignment_id"] = submission.assignment_id
+    row["assignment"] = submission.assignment_title or f"Assignment {submission.assignment_id}"
+    return row
+
+
+def assignment_submission_row(submission):
+    row = _submission_fields(submission)
+    student_name = submission.student_name or f"Student {submission.student_id}"
+    row["student_id"] = submission.student_id
+    row["student"] = student_name
+    row["student_name"] = student_name
+    return row
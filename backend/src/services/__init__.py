@@ -4,12 +4,17 @@ from .section import add_section,get_section_by_id,get_all_sections,edit_section
 from .students import add_students,get_all_students,get_student_by_id,update_student,delete_student
 from .course import add_course,get_all_courses,get_course_by_id,update_course,delete_course
 from .enrollment import enroll_student,get_enrollments_by_course,get_enrollments_by_student,update_enrollment,delete_enrollment,get_all_enrollments
-from .result import add_result, get_result_by_id,get_results_by_student, get_all_results, edit_result, delete_result
+from .result import add_result, add_bulk_results, get_student_transcript, get_result_by_id,get_results_by_student, get_all_results, edit_result, delete_result
 from .subject import add_subject, get_all_subjects, get_subject_by_id, delete_subject,update_subject
 from .teacher import add_teacher, get_teacher_by_id, update_teacher, delete_teacher, get_all_teachers
-from .attendance import mark_attend, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance
+from .attendance import mark_attend, get_attendance_by_student,get_attendance_by_subject,get_all_attendance,update_attendance,delete_attendance,get_attendance_roster,mark_bulk_attendance,get_attendance_summary,rebuild_attendance_summary
 from .assignment import add_assignment, get_assignment_by_id,get_all_assignments,edit_assignment,delete_assignment
 from .assignment_submission import submit_assignment,get_submissions_by_student, get_submissions_by_assignment, update_submission,delete_submission
 from .admin import add_admin
+from .auth import find_user_by_email, upgrade_password_hash
+from .imports import import_students, import_teachers
+from .result_analytics import get_result_analytics, result_analytics
+from .dashboard import get_dashboard_summary
+from .notification import get_notifications, mark_notifications_read, parse_notification_cursor, stream_notifications, publish_notification
 
-__all__ = ["add_announcement","get_all_announcements","get_announcement_by_title","edit_announcement","delete_announcement","add_event","get_event_by_id","get_all_events","update_event","delete_event","add_section","get_section_by_id","get_all_sections","edit_section","delete_section","add_students","get_all_students","get_student_by_id","update_student","delete_student","add_course","get_all_courses","get_course_by_id","update_course","delete_course","enroll_student","get_enrollments_by_course","get_enrollments_by_student","update_enrollment","delete_enrollment","get_all_enrollments","add_result", "get_result_by_id","get_results_by_student", "get_all_results", "edit_result", "delete_result","add_subject", "get_all_subjects", "get_subject_by_id", "delete_subject","update_subject","add_teacher", "get_teacher_by_id", "update_teacher", "delete_teacher", "get_all_teachers","mark_attend", "get_attendance_by_student","get_attendance_by_subject","get_all_attendance","update_attendance","delete_attendance","add_assignment", "get_assignment_by_id","get_all_assignments","edit_assignment","delete_assignment","submit_assignment","get_submissions_by_student", "get_submissions_by_assignment", "update_submission","delete_submission","add_admin"]
\ No newline at end of file
+__all__ = ["add_announcement","get_all_announcements","get_announcement_by_title","edit_announcement","delete_announcement","add_event","get_event_by_id","get_all_events","update_event","delete_event","add_section","get_section_by_id","get_all_sections","edit_section","delete_section","add_students","get_all_students","get_student_by_id","update_student","delete_student","add_course","get_all_courses","get_course_by_id","update_course","delete_course","enroll_student","get_enrollments_by_course","get_enrollments_by_student","update_enrollment","delete_enrollment","get_all_enrollments","add_result","add_bulk_results","get_student_transcript", "get_result_by_id","get_results_by_student", "get_all_results", "edit_result", "delete_result","add_subject", "get_all_subjects", "get_subject_by_id", "delete_subject","update_subject","add_teacher", "get_teacher_by_id", "update_teacher", "delete_teacher", "get_all_teachers","mark_attend", "get_attendance_by_student","get_attendance_by_subject","get_all_attendance","update_attendance","delete_attendance","get_attendance_roster","mark_bulk_attendance","get_attendance_summary","rebuild_attendance_summary","add_assignment", "get_assignment_by_id","get_all_assignments","edit_assignment","delete_assignment","submit_assignment","get_submissions_by_student", "get_submissions_by_assignment", "update_submission","delete_submission","add_admin","find_user_by_email","upgrade_password_hash","import_students","import_teachers","get_result_analytics","result_analytics","get_dashboard_summary","get_notifications","mark_notifications_read","parse_notification_cursor","stream_notifications","publish_notification"]
\ No newline at end of file
@@ -1,6 +1,11 @@
-from src.models import Announcement,Section
+from src.models import Announcement
 from flask import jsonify
 from src.db import db
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.services.notification import publish_notification
+from src.serializers import announcement_row
   
 def add_announcement(title, content, teacher_id, section_id,target_audience='all', created_at=None):
     existing_announcement = Announcement.query.filter_by(title=title).first()
@@ -22,30 +27,25 @@ def add_announcement(title, content, teacher_id, section_id,target_audience='all
 
     db.session.add(new_announcement)
     db.session.commit()
+    invalidate("announcements")
+    publish_notification(new_announcement)
 
     return jsonify({
         "message": "Announcement created successfully",
         "status": "success"
     }), 201
 
-def get_all_announcements():
-    
-    announcements = Announcement.query.all()
+def _announcement_query():
+    return Announcement.query.options(
+        joinedload(Announcement.section)
+    ).order_by(Announcement.id)
+
+def get_all_announcements(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_announcement_query(), Announcement.id, announcement_row, limit, cursor)
 
-    announcement_list = []
-    for announcement in announcements:
-        section = Section.query.get(announcement.section_id)
-        announcement_data = {
-            "id": announcement.id,
-            "title": announcement.title,
-            "content": announcement.content,
-            "target_audience": announcement.target_audience,
-            "section_name": section.name if section else None,
-            "created_at": announcement.created_at,
-            "teacher_id": announcement.teacher_id
-        }
-        announcement_list.append(announcement_data)
-    return jsonify(announcement_list)
+    announcements = _announcement_query().all()
+    return jsonify([announcement_row(row) for row in announcements])
 
 def get_announcement_by_title(announcement_title):
     announcement = Announcement.query.filter_by(title=announcement_title).first()
@@ -55,17 +55,7 @@ def get_announcement_by_title(announcement_title):
             "status": "error"
         }), 404
 
-    section = Section.query.get(announcement.section_id)
-    announcement_data = {
-        "id": announcement.id,
-        "title": announcement.title,
-        "content": announcement.content,
-        "target_audience": announcement.target_audience,
-        "section_name": section.name if section else None,
-        "created_at": announcement.created_at,
-        "teacher_id": announcement.teacher_id
-    }
-    return jsonify(announcement_data)
+    return jsonify(announcement_row(announcement))
 
 def edit_announcement(announcement_title, **kwargs):
     announcement = Announcement.query.filter_by(title=announcement_title).first()
@@ -80,6 +70,7 @@ def edit_announcement(announcement_title, **kwargs):
             setattr(announcement, key, value)
 
     db.session.commit()
+    invalidate("announcements")
 
     return jsonify({
         "message": "Announcement updated successfully",
@@ -96,6 +87,7 @@ def delete_announcement(announcement_title):
 
     db.session.delete(announcement)
     db.session.commit()
+    invalidate("announcements")
 
     return jsonify({
         "message": "Announcement deleted successfully",
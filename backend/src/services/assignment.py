@@ -1,6 +1,10 @@
 from src.models import Assignment
 from flask import jsonify
 from src.db import db
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import assignment_row
 
 def add_assignment(title, description, teacher_id, due_date, subject_id, total_marks):
     new_assignment = Assignment(
@@ -13,6 +17,7 @@ def add_assignment(title, description, teacher_id, due_date, subject_id, total_m
     )
     db.session.add(new_assignment)
     db.session.commit()
+    invalidate("assignments")
 
     return jsonify({
         "message": "Assignment created successfully",
@@ -28,34 +33,23 @@ def get_assignment_by_id(assignment_id):
         }),404
 
     return jsonify({
-        "assignment": {
-            "id": assignment.id,
-            "title": assignment.title,
-            "description": assignment.description,
-            "due_date": assignment.due_date,
-            "subject_name": assignment.subject.name,
-            "teacher_name": assignment.teacher.name,
-            "total_marks": str(assignment.total_marks)
-        },
+        "assignment": assignment_row(assignment),
         "status": "success"
     })
 
-def get_all_assignments():
-    assignments = Assignment.query.all()
-    result = []
-    for assignment in assignments:
-        result.append({
-            "id": assignment.id,
-            "title": assignment.title,
-            "description": assignment.description,
-            "due_date": assignment.due_date,
-            "subject_name": assignment.subject.name,
-            "teacher_name": assignment.teacher.name,
-            "total_marks": str(assignment.total_marks)
-        })
+def _assignment_query():
+    return Assignment.query.options(
+        joinedload(Assignment.subject),
+        joinedload(Assignment.teacher)
+    ).order_by(Assignment.id)
 
+def get_all_assignments(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_assignment_query(), Assignment.id, assignment_row, limit, cursor)
+
+    assignments = _assignment_query().all()
     return jsonify({
-        "assignments": result,
+        "assignments": [assignment_row(row) for row in assignments],
         "status": "success"
     })
 
@@ -72,6 +66,7 @@ def edit_assignment(assignment_id, **kwargs):
             setattr(assignment, key, value)
 
     db.session.commit()
+    invalidate("assignments")
 
     return jsonify({
         "message": "Assignment updated successfully",
@@ -88,6 +83,7 @@ def delete_assignment(assignment_id):
 
     db.session.delete(assignment)
     db.session.commit()
+    invalidate("assignments")
 
     return jsonify({
         "message": "Assignment deleted successfully",
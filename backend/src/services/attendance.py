@@ -1,6 +1,77 @@
-from src.models import Attendance,Student,Subject
+from src.models import Attendance,AttendanceSummary,Student,Subject,Enrollment
 from src.db import db
+from sqlalchemy import insert, update, delete, select, bindparam, func, case
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from flask import jsonify
+from src.pagination import paginate
+from src.streaming import stream_rows
+from src.cache import invalidate
+from src.serializers import attendance_row, attendance_summary_row
+
+
+SUMMARY_STATUSES = ("present", "absent", "late")
+SUMMARY_COUNTS = SUMMARY_STATUSES + ("total",)
+
+def _summary_deltas(added=(), removed=()):
+    """Count changes per (student_id, subject_id) for attendance rows given as (student_id, subject_id, status)."""
+    deltas = {}
+    for rows, sign in ((added, 1), (removed, -1)):
+        for student_id, subject_id, status in rows:
+            counts = deltas.setdefault((student_id, subject_id), dict.fromkeys(SUMMARY_COUNTS, 0))
+            if status in SUMMARY_STATUSES:
+                counts[status] += sign
+            counts["total"] += sign
+    return {key: counts for key, counts in deltas.items() if any(counts.values())}
+
+def _apply_summary_deltas(deltas):
+    """Fold count changes into attendance_summary inside the caller's transaction."""
+    if not deltas:
+        return
+    table = AttendanceSummary.__table__
+    student_ids = {student_id for student_id, _ in deltas}
+    subject_ids = {subject_id for _, subject_id in deltas}
+    existing = set(db.session.execute(
+        select(table.c.student_id, table.c.subject_id).where(
+            table.c.student_id.in_(student_ids),
+            table.c.subject_id.in_(subject_ids)
+        )
+    ).tuples())
+
+    def params(key):
+        return {"key_student_id": key[0], "key_subject_id": key[1], **{f"d_{name}": deltas[key][name] for name in SUMMARY_COUNTS}}
+
+    bump = update(table).where(
+        table.c.student_id == bindparam("key_student_id"),
+        table.c.subject_id == bindparam("key_subject_id")
+    ).values({name: table.c[name] + bindparam(f"d_{name}") for name in SUMMARY_COUNTS})
+
+    updates = [params(key) for key in deltas if key in existing]
+    # A pair without a row can only gain records; anything else means the
+    # summary predates the data and rebuild-attendance-summary will fix it.
+    new_rows = [
+        {"student_id": key[0], "subject_id": key[1], **deltas[key]}
+        for key in deltas
+        if key not in existing and deltas[key]["total"] > 0
+    ]
+
+    if updates:
+        db.session.execute(bump, updates)
+    for row in new_rows:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(table), row)
+        except IntegrityError:
+            # Another request inserted the pair first; add to its row instead.
+            db.session.execute(bump, params((row["student_id"], row["subject_id"])))
+
+    if any(counts["total"] < 0 for counts in deltas.values()):
+        db.session.execute(delete(table).where(
+            table.c.total <= 0,
+            table.c.student_id.in_(student_ids),
+            table.c.subject_id.in_(subject_ids)
+        ))
 
 
 def mark_attend(student_id, subject_id, status):
@@ -11,71 +82,115 @@ def mark_attend(student_id, subject_id, status):
         status=status
     )
     db.session.add(attendance_record)
+    _apply_summary_deltas(_summary_deltas(added=[(student_id, subject_id, status)]))
+    db.session.commit()
+    invalidate("attendance")
+
+    return jsonify({
+        "message": "Attendance marked successfully",
+        "status": "success"
+    }), 201
+
+def get_attendance_roster(subject_id, section_id=None):
+    """Students on a subject's roster as ``(id, name)`` rows, from the section or the course."""
+    if section_id is not None:
+        query = db.session.query(Student.id, Student.name).filter(Student.section_id == section_id)
+    else:
+        query = (
+            db.session.query(Student.id, Student.name)
+            .join(Enrollment, Enrollment.student_id == Student.id)
+            .join(Subject, Subject.course_id == Enrollment.course_id)
+            .filter(Subject.id == subject_id, Enrollment.status == 'active')
+            .distinct()
+        )
+    return query.order_by(Student.id).all()
+
+def mark_bulk_attendance(subject_id, section_id=None, entries=None, default_status='present'):
+    """Mark a whole roster for a subject in one transaction."""
+    entries = entries or {}
+    roster = get_attendance_roster(subject_id, section_id)
+    if not roster:
+        return jsonify({
+            "message": "No students found for this section or subject",
+            "status": "failed"
+        }), 404
+
+    roster_ids = {student.id for student in roster}
+    unknown = sorted(set(entries) - roster_ids)
+    if unknown:
+        return jsonify({
+            "message": "Some students are not on this roster",
+            "student_ids": unknown,
+            "status": "failed"
+        }), 400
+
+    mark_at = datetime.now(ZoneInfo("Asia/Karachi"))
+    rows = [
+        {
+            "student_id": student.id,
+            "subject_id": subject_id,
+            "status": entries.get(student.id, default_status),
+            "mark_at": mark_at
+        }
+        for student in roster
+    ]
+    db.session.execute(insert(Attendance), rows)
+    _apply_summary_deltas(_summary_deltas(
+        added=[(row["student_id"], row["subject_id"], row["status"]) for row in rows]
+    ))
     db.session.commit()
+    invalidate("attendance")
 
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
     return jsonify({
         "message": "Attendance marked successfully",
+        "marked": len(rows),
+        "counts": counts,
         "status": "success"
     }), 201
 
+def _attendance_query():
+    return db.session.query(
+        Attendance.id,
+        Student.name.label("student_name"),
+        Subject.name.label("subject_name"),
+        Attendance.mark_at,
+        Attendance.status
+    ).outerjoin(Student, Attendance.student_id == Student.id
+    ).outerjoin(Subject, Attendance.subject_id == Subject.id
+    ).order_by(Attendance.id)
+
 def get_attendance_by_student(student_id):
-    id_student = Attendance.query.filter_by(student_id=student_id).all()
-    if not id_student:
+    records = _attendance_query().filter(Attendance.student_id == student_id).all()
+    if not records:
         return jsonify({
             "message": "Student not found",
             "status": "error"
         }), 404
-    
-    result = []
-    for record in id_student:
-        student = Student.query.get(record.student_id)
-        subject = Subject.query.get(record.subject_id)
-        result.append({
-            "id": record.id,
-            "student_name": student.name if student else None,
-            "subject_name": subject.name if subject else None,
-            "mark_at": record.mark_at,
-            "status": record.status
-        })
-    return jsonify(result)
+
+    return jsonify([attendance_row(row) for row in records])
 
 def get_attendance_by_subject(subject_id):
-    subject_attendance = Attendance.query.filter_by(subject_id=subject_id).all()
-    if not subject_attendance:
+    records = _attendance_query().filter(Attendance.subject_id == subject_id).all()
+    if not records:
         return jsonify({
             "message": "No attendance records found for this subject",
             "status": "error"
         }), 404
-    
-    result = []
-    for record in subject_attendance:
-        student = Student.query.get(record.student_id)
-        subject = Subject.query.get(record.subject_id)
-        result.append({
-            "id": record.id,
-            "student_name": student.name if student else None,
-            "subject_name": subject.name if subject else None,
-            "mark_at": record.mark_at,
-            "status": record.status
-        })
-    
-    return jsonify(result)
-
-
-def get_all_attendance():
-    attendance_records = Attendance.query.all()
-    result = []
-    for record in attendance_records:
-        student = Student.query.get(record.student_id)
-        subject = Subject.query.get(record.subject_id)
-        result.append({
-            "id": record.id,
-            "student_name": student.name if student else None,
-            "subject_name": subject.name if subject else None,
-            "mark_at": record.mark_at,
-            "status": record.status
-        })
-    return jsonify(result)
+
+    return jsonify([attendance_row(row) for row in records])
+
+
+def get_all_attendance(limit=None, cursor=None, stream=None):
+    if stream is not None:
+        return stream_rows(_attendance_query(), attendance_row, stream)
+    if limit is not None:
+        return paginate(_attendance_query(), Attendance.id, attendance_row, limit, cursor)
+
+    records = _attendance_query().all()
+    return jsonify([attendance_row(row) for row in records])
 
 def update_attendance(attendance_id, **kwargs):
     attendance_record = Attendance.query.get(attendance_id)
@@ -85,11 +200,15 @@ def update_attendance(attendance_id, **kwargs):
             "status": "error"
         }), 404
     
+    before = (attendance_record.student_id, attendance_record.subject_id, attendance_record.status)
     for key, value in kwargs.items():
         if hasattr(attendance_record, key):
             setattr(attendance_record, key, value)
+    after = (attendance_record.student_id, attendance_record.subject_id, attendance_record.status)
     
+    _apply_summary_deltas(_summary_deltas(added=[after], removed=[before]))
     db.session.commit()
+    invalidate("attendance")
     
     return jsonify({
         "message": "Attendance record updated successfully",
@@ -105,10 +224,77 @@ def delete_attendance(attendance_id):
         }), 404
     
     db.session.delete(attendance_record)
+    _apply_summary_deltas(_summary_deltas(
+        removed=[(attendance_record.student_id, attendance_record.subject_id, attendance_record.status)]
+    ))
     db.session.commit()
+    invalidate("attendance")
     
     return jsonify({
         "message": "Attendance record deleted successfully",
         "status": "success"
     })
 
+def get_attendance_summary(student_id=None, subject_id=None):
+    """Attendance counts and present rate per student and subject, read from attendance_summary."""
+    query = db.session.query(
+        AttendanceSummary.present,
+        AttendanceSummary.absent,
+        AttendanceSummary.late,
+        AttendanceSummary.total,
+        Student.name.label("student_name"),
+        Subject.name.label("subject_name")
+    ).join(Student, AttendanceSummary.student_id == Student.id
+    ).join(Subject, AttendanceSummary.subject_id == Subject.id
+    ).order_by(AttendanceSummary.student_id, AttendanceSummary.subject_id)
+    if student_id is not None:
+        query = query.filter(AttendanceSummary.student_id == student_id)
+    if subject_id is not None:
+        query = query.filter(AttendanceSummary.subject_id == subject_id)
+
+    summaries = query.all()
+    if not summaries:
+        return jsonify({
+            "message": "No attendance records found",
+            "status": "error"
+        }), 404
+
+    return jsonify([attendance_summary_row(row) for row in summaries])
+
+def rebuild_attendance_summary():
+    """Recompute attendance_summary and return how many pairs were corrected."""
+    def status_count(status):
+        return func.sum(case((Attendance.status == status, 1), else_=0))
+
+    expected = {
+        (row.student_id, row.subject_id): {
+            "present": int(row.present),
+            "absent": int(row.absent),
+            "late": int(row.late),
+            "total": int(row.total)
+        }
+        for row in db.session.query(
+            Attendance.student_id,
+            Attendance.subject_id,
+            status_count("present").label("present"),
+            status_count("absent").label("absent"),
+            status_count("late").label("late"),
+            func.count(Attendance.id).label("total")
+        ).group_by(Attendance.student_id, Attendance.subject_id)
+    }
+    current = {
+        (row.student_id, row.subject_id): {name: getattr(row, name) for name in SUMMARY_COUNTS}
+        for row in AttendanceSummary.query
+    }
+    mismatched = sum(1 for key in expected.keys() | current.keys() if expected.get(key) != current.get(key))
+
+    table = AttendanceSummary.__table__
+    db.session.execute(delete(table))
+    if expected:
+        db.session.execute(insert(table), [
+            {"student_id": student_id, "subject_id": subject_id, **counts}
+            for (student_id, subject_id), counts in expected.items()
+        ])
+    db.session.commit()
+    invalidate("attendance")
+    return mismatched
@@ -0,0 +1,39 @@
+from src.models import Admin, Teacher, Student
+from src.db import db
+from src.passwords import hash_password
+from sqlalchemy import select, literal, union_all, update
+
+# Lookup order of the previous Admin -> Teacher -> Student scan; an email
+# registered under several roles still resolves to the highest one.
+_IDENTITY_TABLES = (
+    (Admin, "admin"),
+    (Teacher, "teacher"),
+    (Student, "student"),
+)
+_MODELS_BY_ROLE = {role: model for model, role in _IDENTITY_TABLES}
+
+def find_user_by_email(email):
+    """Resolve an email to ``(role, id, name, username, email, password)`` across all account tables."""
+    branches = [
+        select(
+            literal(role).label("role"),
+            literal(priority).label("priority"),
+            model.id,
+            model.name,
+            model.username,
+            model.email,
+            model.password
+        ).where(model.email == email)
+        for priority, (model, role) in enumerate(_IDENTITY_TABLES)
+    ]
+    query = union_all(*branches).order_by("priority").limit(1)
+    return db.session.execute(query).first()
+
+def upgrade_password_hash(app, user, password):
+    """Re-hash a verified ``password`` at the current BCRYPT_LOG_ROUNDS."""
+    with app.app_context():
+        model = _MODELS_BY_ROLE[user.role]
+        db.session.execute(
+            update(model).where(model.id == user.id).values(password=hash_password(password))
+        )
+        db.session.commit()
@@ -1,6 +1,10 @@
-from src.models import Course,Enrollment,Subject,Assignment,AssignmentSubmission,Result,Attendance,Teacher
+from src.models import Course,Enrollment,Subject,Assignment,AssignmentSubmission,Result,Attendance,AttendanceSummary
 from flask import jsonify
 from src.db import db
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import course_row
 
 
 def add_course(name, description, course_code, teacher_id, created_at=None):
@@ -14,38 +18,26 @@ def add_course(name, description, course_code, teacher_id, created_at=None):
         new_course.created_at = created_at
     db.session.add(new_course)
     db.session.commit()
+    invalidate("courses")
     return jsonify({"message": "Course added successfully", "course_id": new_course.id}), 201
 
-def get_all_courses():
-    courses = Course.query.all()
-    course_list = []
-    for course in courses:
-        teacher = Teacher.query.get(course.teacher_id)
-        course_data = {
-            "id": course.id,
-            "name": course.name,
-            "description": course.description,
-            "course_code": course.course_code,
-            "teacher_name": teacher.name if teacher else None,
-            "created_at": course.created_at
-        }
-        course_list.append(course_data)
-    return jsonify(course_list)
+def _course_query():
+    return Course.query.options(
+        joinedload(Course.teacher)
+    ).order_by(Course.id)
+
+def get_all_courses(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_course_query(), Course.id, course_row, limit, cursor)
+
+    courses = _course_query().all()
+    return jsonify([course_row(row) for row in courses])
 
 def get_course_by_id(course_id):
     course = Course.query.get(course_id)
     if not course:
         return jsonify({"message": "Course not found"}), 404
-    teacher = Teacher.query.get(course.teacher_id)
-    course_data = {
-        "id": course.id,
-        "name": course.name,
-        "description": course.description,
-        "course_code": course.course_code,
-        "teacher_name": teacher.name if teacher else None,
-        "created_at": course.created_at
-    }
-    return jsonify(course_data)
+    return jsonify(course_row(course))
 
 def update_course(course_id, **kwargs):
     course = Course.query.get(course_id)
@@ -55,6 +47,7 @@ def update_course(course_id, **kwargs):
         if hasattr(course, key):
             setattr(course, key, value)
     db.session.commit()
+    invalidate("courses")
     return jsonify({"message": "Course updated successfully"})
 
 def delete_course(course_id):
@@ -74,6 +67,7 @@ def delete_course(course_id):
     
     Result.query.filter(Result.subject_id.in_(subject_ids)).delete()
     
+    AttendanceSummary.query.filter(AttendanceSummary.subject_id.in_(subject_ids)).delete()
     Attendance.query.filter(Attendance.subject_id.in_(subject_ids)).delete()
     
     Subject.query.filter_by(course_id=course_id).delete()
@@ -82,4 +76,5 @@ def delete_course(course_id):
     
     db.session.delete(course)
     db.session.commit()
+    invalidate("courses", "subjects", "assignments", "submissions", "results", "attendance", "enrollments")
     return jsonify({"message": "Course deleted successfully"})
\ No newline at end of file
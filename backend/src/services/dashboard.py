@@ -0,0 +1,125 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from flask import jsonify
+from sqlalchemy import select, func, or_
+from src.db import db
+from src.models import Student, Teacher, Course, Section, Subject, Assignment, Announcement, Event, Enrollment
+from src.cache import cached, report_cache
+
+DASHBOARD_RECENT_ITEMS = 5
+
+
+def _counts(**queries):
+    """Run several COUNT(*) queries as scalar subqueries of one SELECT."""
+    row = db.session.execute(select(*(
+        query.scalar_subquery().label(name) for name, query in queries.items()
+    ))).one()
+    return row._asdict()
+
+
+def _count(model, *criteria):
+    return select(func.count()).select_from(model).where(*criteria)
+
+
+def _for_audience(audience):
+    """Announcements aimed at everyone or at ``audience``, as the notification feed filters them."""
+    return or_(Announcement.target_audience.in_(("all", audience)), Announcement.target_audience.is_(None))
+
+
+def _recent_announcements(*criteria):
+    rows = db.session.execute(
+        select(Announcement.id, Announcement.title, Announcement.target_audience, Announcement.created_at, Section.name.label("section_name"))
+        .outerjoin(Section, Announcement.section_id == Section.id)
+        .where(*criteria)
+        .order_by(Announcement.id.desc())
+        .limit(DASHBOARD_RECENT_ITEMS)
+    ).all()
+    return [row._asdict() for row in rows]
+
+
+def _upcoming_events(today):
+    rows = db.session.execute(
+        select(Event.id, Event.title, Event.event_date, Event.event_time)
+        .where(Event.event_date >= today)
+        .order_by(Event.event_date, Event.event_time)
+        .limit(DASHBOARD_RECENT_ITEMS)
+    ).all()
+    return [
+        {"id": row.id, "title": row.title, "event_date": str(row.event_date), "event_time": str(row.event_time)}
+        for row in rows
+    ]
+
+
+def _upcoming_assignments(today, *criteria):
+    rows = db.session.execute(
+        select(Assignment.id, Assignment.title, Assignment.due_date, Subject.name.label("subject_name"))
+        .join(Subject, Assignment.subject_id == Subject.id)
+        .where(Assignment.due_date >= today, *criteria)
+        .order_by(Assignment.due_date, Assignment.id)
+        .limit(DASHBOARD_RECENT_ITEMS)
+    ).all()
+    return [
+        {"id": row.id, "title": row.title, "subject_name": row.subject_name, "due_date": str(row.due_date)}
+        for row in rows
+    ]
+
+
+@cached(report_cache, "students", "teachers", "courses", "sections", "subjects", "assignments", "announcements", "events", "enrollments")
+def _dashboard_snapshot(role, user_id):
+    """Counts and short lists for one role's dashboard."""
+    today = datetime.now(ZoneInfo("Asia/Karachi")).date()
+    snapshot = {"role": role, "upcoming_events": _upcoming_events(today)}
+
+    if role == "admin":
+        snapshot["counts"] = _counts(
+            students=_count(Student),
+            teachers=_count(Teacher),
+            courses=_count(Course),
+            sections=_count(Section),
+            subjects=_count(Subject),
+            assignments=_count(Assignment),
+            announcements=_count(Announcement),
+            events=_count(Event)
+        )
+        snapshot["recent_announcements"] = _recent_announcements()
+    elif role == "teacher":
+        snapshot["counts"] = _counts(
+            students=_count(Student),
+            courses=_count(Course),
+            sections=_count(Section, Section.teacher_id == user_id),
+            subjects=_count(Subject, Subject.teacher_id == user_id),
+            assignments=_count(Assignment, Assignment.teacher_id == user_id),
+            announcements=_count(Announcement, _for_audience("teachers")),
+            events=_count(Event)
+        )
+        snapshot["recent_announcements"] = _recent_announcements(_for_audience("teachers"))
+        snapshot["upcoming_assignments"] = _upcoming_assignments(today, Assignment.teacher_id == user_id)
+    else:
+        section_id = db.session.execute(select(Student.section_id).where(Student.id == user_id)).scalar()
+        course_ids = select(Enrollment.course_id).where(Enrollment.student_id == user_id, Enrollment.status == 'active')
+        subject_ids = select(Subject.id).where(Subject.course_id.in_(course_ids))
+        visible_announcements = (
+            _for_audience("students"),
+            or_(Announcement.section_id.is_(None), Announcement.section_id == section_id)
+        )
+        snapshot["counts"] = _counts(
+            courses=_count(Enrollment, Enrollment.student_id == user_id, Enrollment.status == 'active'),
+            subjects=_count(Subject, Subject.id.in_(subject_ids)),
+            assignments=_count(Assignment, Assignment.subject_id.in_(subject_ids)),
+            announcements=_count(Announcement, *visible_announcements),
+            events=_count(Event)
+        )
+        snapshot["recent_announcements"] = _recent_announcements(*visible_announcements)
+        snapshot["upcoming_assignments"] = _upcoming_assignments(today, Assignment.subject_id.in_(subject_ids))
+
+    return snapshot
+
+
+def get_dashboard_summary(role, user_id):
+    if role not in ("admin", "teacher", "student"):
+        return jsonify({
+            "message": "Access denied",
+            "status": "failed"
+        }), 403
+
+    return jsonify(_dashboard_snapshot(role, None if role == "admin" else user_id))
@@ -1,6 +1,11 @@
 from src.models import Enrollment
 from src.db import db
 from flask import jsonify
+from src.pagination import paginate
+from src.streaming import stream_rows
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import enrollment_row
 
 def enroll_student(student_id, course_id, enrollment_date, status='active', grade=None):
     new_enrollment = Enrollment(
@@ -12,22 +17,23 @@ def enroll_student(student_id, course_id, enrollment_date, status='active', grad
     )
     db.session.add(new_enrollment)
     db.session.commit()
+    invalidate("enrollments")
     return jsonify({"message": "Student enrolled successfully", "enrollment_id": new_enrollment.id}),201
 
-def get_all_enrollments():
-    enrollments = Enrollment.query.all()
-    result = []
-    for enrollment in enrollments:
-        enrollment_data = {
-            "id": enrollment.id,
-            "student_name": enrollment.student.name,
-            "course_name": enrollment.course.name,
-            "enrollment_date": enrollment.enrollment_date,
-            "status": enrollment.status,
-            "grade": enrollment.grade
-        }
-        result.append(enrollment_data)
-    return jsonify(result)
+def _enrollment_query():
+    return Enrollment.query.options(
+        joinedload(Enrollment.student),
+        joinedload(Enrollment.course)
+    ).order_by(Enrollment.id)
+
+def get_all_enrollments(limit=None, cursor=None, stream=None):
+    if stream is not None:
+        return stream_rows(_enrollment_query(), enrollment_row, stream)
+    if limit is not None:
+        return paginate(_enrollment_query(), Enrollment.id, enrollment_row, limit, cursor)
+
+    enrollments = _enrollment_query().all()
+    return jsonify([enrollment_row(row) for row in enrollments])
 
 def get_enrollments_by_student(student_id):
     enrollments = Enrollment.query.filter_by(student_id=student_id)
@@ -66,6 +72,7 @@ def update_enrollment(enrollment_id, **kwargs):
         if hasattr(enrollment, key):
             setattr(enrollment, key, value)
     db.session.commit()
+    invalidate("enrollments")
     return jsonify({"message": "Enrollment updated successfully"}), 200
 
 def delete_enrollment(enrollment_id):
@@ -74,4 +81,5 @@ def delete_enrollment(enrollment_id):
         return False
     db.session.delete(enrollment)
     db.session.commit()
+    invalidate("enrollments")
     return jsonify({"message": "Enrollment deleted successfully"}), 200
\ No newline at end of file
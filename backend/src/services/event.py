@@ -1,6 +1,10 @@
 from src.models import Event
 from src.db import db
 from flask import jsonify
+from src.pagination import paginate
+from src.cache import invalidate
+from src.services.notification import publish_notification
+from src.serializers import event_row
 
 def add_event(title, description, event_date, event_time, admin_id):
     existing_event = Event.query.filter_by(title=title).first()
@@ -20,6 +24,8 @@ def add_event(title, description, event_date, event_time, admin_id):
 
     db.session.add(new_event)
     db.session.commit()
+    invalidate("events")
+    publish_notification(new_event)
 
     return jsonify({
         "message": "Event created successfully",
@@ -34,32 +40,14 @@ def get_event_by_id(event_id):
             "status": "error"
         }), 404
 
-  
-    result =  {
-            "id": event.id,
-            "title": event.title,
-            "description": event.description,
-            "event_date": str(event.event_date),
-            "event_time": str(event.event_time),
-            "admin_id": event.admin_id,
-            "created_at": str(event.created_at)
-        }
-    return jsonify(result)
+    return jsonify(event_row(event))
+
+def get_all_events(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(Event.query, Event.id, event_row, limit, cursor)
 
-def get_all_events():
     events = Event.query.all()
-    result = []
-    for event in events:
-        result.append({
-            "id": event.id,
-            "title": event.title,
-            "description": event.description,
-            "event_date": str(event.event_date),
-            "event_time": str(event.event_time),
-            "admin_id": event.admin_id,
-            "created_at": str(event.created_at)
-        })
-    return jsonify(result)
+    return jsonify([event_row(row) for row in events])
 
 def update_event(event_id, **kwargs):
     event = Event.query.get(event_id)
@@ -73,6 +61,7 @@ def update_event(event_id, **kwargs):
         if hasattr(event, key):
             setattr(event, key, value)
     db.session.commit()
+    invalidate("events")
 
     return jsonify({
         "message": "Event updated successfully",
@@ -89,6 +78,7 @@ def delete_event(event_id):
 
     db.session.delete(event)
     db.session.commit()
+    invalidate("events")
 
     return jsonify({
         "message": "Event deleted successfully",
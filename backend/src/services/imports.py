@@ -0,0 +1,184 @@
+import codecs
+import csv
+import os
+from flask import jsonify
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from src.db import db
+from src.models import Student, Teacher, Section
+from src.schemas import RegisterStudentSchema, RegisterTeacherSchema
+from src.passwords import hash_passwords
+from src.cache import invalidate
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 500))
+
+
+def _csv_rows(stream):
+    """Yield ``(row_number, row)`` from a CSV upload without reading it all into memory."""
+    reader = csv.DictReader(codecs.iterdecode(stream, "utf-8-sig"))
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _xlsx_rows(stream):
+    """Yield ``(row_number, row)`` from the first sheet of an XLSX upload."""
+    from openpyxl import load_workbook
+
+    sheet = load_workbook(stream, read_only=True, data_only=True).active
+    rows = sheet.iter_rows(values_only=True)
+    header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+    for row_number, values in enumerate(rows, start=2):
+        yield row_number, {
+            key: "" if value is None else str(value)
+            for key, value in zip(header, values)
+        }
+
+
+def _read_rows(upload):
+    filename = (upload.filename or "").lower()
+    if filename.endswith(".xlsx"):
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return None, "XLSX import needs openpyxl installed; upload a CSV instead"
+        return _xlsx_rows(upload.stream), None
+    if filename.endswith(".csv"):
+        return _csv_rows(upload.stream), None
+    return None, "Upload a .csv or .xlsx file"
+
+
+def _batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _existing(column, values):
+    """Lower-cased values of ``column`` already in the table, found with one query."""
+    if not values:
+        return set()
+    found = db.session.execute(db.select(column).where(column.in_(values))).scalars()
+    return {value.lower() for value in found}
+
+
+def _import_users(upload, model, schema, tag, build_row):
+    """Validate, deduplicate, hash and insert an uploaded user list batch by batch."""
+    rows, error = _read_rows(upload)
+    if error:
+        return jsonify({
+            "message": error,
+            "status": "failed"
+        }), 400
+
+    schema = schema(unknown=EXCLUDE)
+    seen_usernames = set()
+    seen_emails = set()
+    errors = []
+    imported = 0
+
+    try:
+        for batch in _batches(rows):
+            valid = []
+            for row_number, raw in batch:
+                raw = {key.strip(): value.strip() for key, value in raw.items() if key and value and value.strip()}
+                try:
+                    data = schema.load(raw)
+                except ValidationError as err:
+                    errors.append({"row": row_number, "errors": err.messages})
+                    continue
+                row, row_error = build_row(data)
+                if row_error:
+                    errors.append({"row": row_number, "errors": row_error})
+                    continue
+                valid.append((row_number, data, row))
+
+            existing_usernames = _existing(model.username, [data["username"] for _, data, _ in valid])
+            existing_emails = _existing(model.email, [data["email"] for _, data, _ in valid])
+
+            accepted = []
+            for row_number, data, row in valid:
+                username = data["username"].lower()
+                email = data["email"].lower()
+                row_errors = {}
+                if username in existing_usernames or username in seen_usernames:
+                    row_errors["username"] = ["Username already exists"]
+                if email in existing_emails or email in seen_emails:
+                    row_errors["email"] = ["Email already exists"]
+                if row_errors:
+                    errors.append({"row": row_number, "errors": row_errors})
+                    continue
+                seen_usernames.add(username)
+                seen_emails.add(email)
+                accepted.append((row_number, data, row))
+
+            if not accepted:
+                continue
+
+            hashes = hash_passwords([data["password"] for _, data, _ in accepted])
+            values = [{**row, "password": password} for (_, _, row), password in zip(accepted, hashes)]
+            try:
+                db.session.execute(insert(model), values)
+                db.session.commit()
+            except SQLAlchemyError:
+                db.session.rollback()
+                errors.extend(
+                    {"row": row_number, "errors": {"_schema": ["Could not be saved"]}}
+                    for row_number, _, _ in accepted
+                )
+                continue
+            imported += len(values)
+    except (UnicodeDecodeError, csv.Error) as err:
+        errors.append({"row": None, "errors": {"_schema": [f"Could not read the file: {err}"]}})
+
+    if imported:
+        invalidate(tag)
+    errors.sort(key=lambda error: error["row"] or 0)
+
+    if not imported:
+        return jsonify({
+            "message": "No rows were imported",
+            "imported": 0,
+            "errors": errors,
+            "status": "failed"
+        }), 400
+
+    return jsonify({
+        "message": f"{imported} rows imported",
+        "imported": imported,
+        "errors": errors,
+        "status": "success"
+    }), 201
+
+
+def import_students(upload):
+    section_ids = dict(db.session.execute(db.select(Section.name, Section.id)).all())
+
+    def build_row(data):
+        section_id = section_ids.get(data["section_name"])
+        if section_id is None:
+            return None, {"section_name": ["Section not found"]}
+        return {
+            "name": data["name"],
+            "username": data["username"],
+            "email": data["email"],
+            "section_id": section_id
+        }, None
+
+    return _import_users(upload, Student, RegisterStudentSchema, "students", build_row)
+
+
+def import_teachers(upload):
+    def build_row(data):
+        return {
+            "name": data["name"],
+            "username": data["username"],
+            "email": data["email"]
+        }, None
+
+    return _import_users(upload, Teacher, RegisterTeacherSchema, "teachers", build_row)
@@ -0,0 +1,242 @@
+import os
+import time
+from flask import jsonify
+from sqlalchemy import select, func, or_
+from src.db import db
+from src.models import Announcement, Event, Student, NotificationReadMarker
+from src.notification_hub import notification_hub
+from src.streaming import sse_event, sse_response
+
+NOTIFICATION_LIMIT = 10
+NOTIFICATION_HEARTBEAT = int(os.getenv("NOTIFICATION_HEARTBEAT", 10))
+NOTIFICATION_STREAM_TTL = int(os.getenv("NOTIFICATION_STREAM_TTL", 25))
+
+
+def parse_notification_cursor(cursor):
+    """Read a ``"<announcement_id>-<event_id>"`` cursor; None when it is malformed."""
+    try:
+        announcement_id, event_id = (int(part) for part in str(cursor).split("-"))
+    except ValueError:
+        return None
+    if announcement_id < 0 or event_id < 0:
+        return None
+    return announcement_id, event_id
+
+
+def _format_cursor(announcement_id, event_id):
+    return f"{announcement_id}-{event_id}"
+
+
+def _latest_ids():
+    """Newest announcement and event ids, read from the primary key indexes in one query."""
+    row = db.session.execute(select(
+        select(func.max(Announcement.id)).scalar_subquery(),
+        select(func.max(Event.id)).scalar_subquery()
+    )).one()
+    return row[0] or 0, row[1] or 0
+
+
+def _announcement_filters(role, user_id):
+    """Announcements meant for the caller, excluding the ones they posted."""
+    if role == "admin":
+        return []
+    if role == "teacher":
+        return [
+            or_(Announcement.target_audience.in_(("all", "teachers")), Announcement.target_audience.is_(None)),
+            Announcement.teacher_id != user_id
+        ]
+    section_id = select(Student.section_id).where(Student.id == user_id).scalar_subquery()
+    return [
+        or_(Announcement.target_audience.in_(("all", "students")), Announcement.target_audience.is_(None)),
+        or_(Announcement.section_id.is_(None), Announcement.section_id == section_id)
+    ]
+
+
+def _event_filters(role, user_id):
+    return [Event.admin_id != user_id] if role == "admin" else []
+
+
+def _announcement_item(announcement):
+    return {
+        "id": f"a-{announcement.id}",
+        "type": "announcement",
+        "item_id": announcement.id,
+        "title": announcement.title,
+        "created_at": announcement.created_at,
+        "creator_id": announcement.teacher_id
+    }
+
+
+def _event_item(event):
+    return {
+        "id": f"e-{event.id}",
+        "type": "event",
+        "item_id": event.id,
+        "title": event.title,
+        "event_date": str(event.event_date),
+        "created_at": event.created_at,
+        "creator_id": event.admin_id
+    }
+
+
+def _read_marker(role, user_id):
+    return db.session.get(NotificationReadMarker, (user_id, role))
+
+
+def _feed_rows(query, id_column, since_id, latest_id, limit, incremental):
+    """One kind's rows in ``(since_id, latest_id]``, the id its cursor moves to, and whether more remain."""
+    if latest_id <= since_id:
+        return [], since_id, False
+    query = query.where(id_column > since_id, id_column <= latest_id).limit(limit)
+    if not incremental:
+        return db.session.execute(query.order_by(id_column.desc())).all(), latest_id, False
+
+    rows = db.session.execute(query.order_by(id_column)).all()
+    if len(rows) < limit:
+        return rows[::-1], latest_id, False
+    return rows[::-1], rows[-1].id, rows[-1].id < latest_id
+
+
+def notification_feed(role, user_id, since=None, limit=NOTIFICATION_LIMIT):
+    """New announcements and events for the caller, newest first, with the cursor to poll from."""
+    latest_announcement_id, latest_event_id = _latest_ids()
+    since_announcement_id, since_event_id = since or (0, 0)
+    incremental = since is not None
+
+    announcements, announcement_id, more_announcements = _feed_rows(
+        select(Announcement.id, Announcement.title, Announcement.created_at, Announcement.teacher_id)
+        .where(*_announcement_filters(role, user_id)),
+        Announcement.id, since_announcement_id, latest_announcement_id, limit, incremental
+    )
+    events, event_id, more_events = _feed_rows(
+        select(Event.id, Event.title, Event.event_date, Event.created_at, Event.admin_id)
+        .where(*_event_filters(role, user_id)),
+        Event.id, since_event_id, latest_event_id, limit, incremental
+    )
+    items = [_announcement_item(row) for row in announcements] + [_event_item(row) for row in events]
+
+    response = {
+        "items": items,
+        "cursor": _format_cursor(announcement_id, event_id),
+        "has_more": more_announcements or more_events,
+        "status": "success"
+    }
+    if since is None:
+        marker = _read_marker(role, user_id)
+        read_announcement_id = marker.last_announcement_id if marker else 0
+        read_event_id = marker.last_event_id if marker else 0
+        response["read_cursor"] = _format_cursor(read_announcement_id, read_event_id)
+        response["unread"] = any(
+            item["item_id"] > (read_announcement_id if item["type"] == "announcement" else read_event_id)
+            for item in items
+        )
+    return response
+
+
+def get_notifications(role, user_id, since=None):
+    return jsonify(notification_feed(role, user_id, since))
+
+
+def publish_notification(record):
+    """Push a newly created announcement or event to the open notification streams."""
+    if isinstance(record, Announcement):
+        notification_hub.publish({
+            "item": _announcement_item(record),
+            "target_audience": record.target_audience,
+            "section_id": record.section_id
+        })
+    else:
+        notification_hub.publish({"item": _event_item(record)})
+
+
+def _is_visible(published, role, user_id, section_id):
+    """Python twin of the feed's SQL filters, applied to one published item."""
+    item = published["item"]
+    if item["type"] == "event":
+        return not (role == "admin" and item["creator_id"] == user_id)
+    if role == "admin":
+        return True
+    audience = published["target_audience"]
+    if role == "teacher":
+        return audience in ("all", "teachers", None) and item["creator_id"] != user_id
+    return audience in ("all", "students", None) and published["section_id"] in (None, section_id)
+
+
+def stream_notifications(role, user_id, since=None):
+    """Server-Sent Events stream of the caller's notifications."""
+    if role not in ("admin", "teacher", "student"):
+        return jsonify({
+            "message": "Access denied",
+            "status": "failed"
+        }), 403
+
+    section_id = None
+    if role == "student":
+        section_id = db.session.execute(select(Student.section_id).where(Student.id == user_id)).scalar()
+
+    def catch_up(cursor):
+        """Send the feed after ``cursor`` page by page and return the cursor reached."""
+        feed = notification_feed(role, user_id, cursor)
+        yield sse_event("notifications", feed, feed["cursor"])
+        while feed["has_more"]:
+            feed = notification_feed(role, user_id, parse_notification_cursor(feed["cursor"]))
+            yield sse_event("notifications", feed, feed["cursor"])
+        # Hand the connection back to the pool while the stream sits idle.
+        db.session.close()
+        return parse_notification_cursor(feed["cursor"])
+
+    def generate():
+        seq = notification_hub.seq
+        sent = announcement_id, event_id = yield from catch_up(since)
+
+        deadline = time.monotonic() + NOTIFICATION_STREAM_TTL
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            published, seq, missed = notification_hub.wait(seq, min(NOTIFICATION_HEARTBEAT, remaining))
+            if missed:
+                sent = announcement_id, event_id = yield from catch_up((announcement_id, event_id))
+                continue
+            if not published:
+                yield ": heartbeat\n\n"
+                continue
+
+            items = []
+            for entry in published:
+                item = entry["item"]
+                # Rows committed before the catch-up query were already sent with it.
+                if item["type"] == "announcement":
+                    if item["item_id"] <= sent[0]:
+                        continue
+                    announcement_id = max(announcement_id, item["item_id"])
+                else:
+                    if item["item_id"] <= sent[1]:
+                        continue
+                    event_id = max(event_id, item["item_id"])
+                if _is_visible(entry, role, user_id, section_id):
+                    items.append(item)
+            if items:
+                cursor = _format_cursor(announcement_id, event_id)
+                yield sse_event("notifications", {"items": items[::-1], "cursor": cursor}, cursor)
+
+    return sse_response(generate())
+
+
+def mark_notifications_read(role, user_id, cursor=None):
+    """Move the caller's read marker forward to ``cursor``, or to the newest items."""
+    announcement_id, event_id = cursor or _latest_ids()
+    marker = _read_marker(role, user_id)
+    if marker is None:
+        marker = NotificationReadMarker(user_id=user_id, user_type=role, last_announcement_id=0, last_event_id=0)
+        db.session.add(marker)
+
+    marker.last_announcement_id = max(marker.last_announcement_id, announcement_id)
+    marker.last_event_id = max(marker.last_event_id, event_id)
+    db.session.commit()
+
+    return jsonify({
+        "message": "Notifications marked as read",
+        "read_cursor": _format_cursor(marker.last_announcement_id, marker.last_event_id),
+        "status": "success"
+    })
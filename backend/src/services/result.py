@@ -1,6 +1,15 @@
-from src.models import Result
+from bisect import bisect_right
+from decimal import Decimal
+from src.models import Result, Student, Subject
 from flask import jsonify
 from src.db import db
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from src.pagination import paginate
+from src.streaming import stream_rows
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate, cached, report_cache
+from src.serializers import result_row
 
 def calculate_grade(obtained_marks, total_marks):
     if total_marks is None or obtained_marks is None:
@@ -15,17 +24,21 @@ def calculate_grade(obtained_marks, total_marks):
         }), 400
     
     percentage = (obtained_marks / total_marks) * 100
-    if percentage >= 90:
-        return 'A'
-    elif percentage >= 80:
-        return 'B'
-    elif percentage >= 70:
-        return 'C'
-    elif percentage >= 60:
-        return 'D'
-    else:
-        return 'F'
-    
+    return grade_for_percentage(percentage)
+
+# Lower bound of each grade band, ascending; below the first bound is an F.
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADES = ('F', 'D', 'C', 'B', 'A')
+
+def grade_for_percentage(percentage):
+    return GRADES[bisect_right(GRADE_THRESHOLDS, percentage)]
+
+GRADE_POINTS = {'A': 4.0, 'B': 3.0, 'C': 2.0, 'D': 1.0, 'F': 0.0}
+
+def subject_results_tag(subject_id):
+    """Cache tag for data built from one subject's results only."""
+    return f"results:subject:{subject_id}"
+
 def add_result(subject_id, student_id, total_marks,obtained_marks, exam_type, remarks=None):
     new_result = Result(
         subject_id=subject_id,
@@ -39,12 +52,106 @@ def add_result(subject_id, student_id, total_marks,obtained_marks, exam_type, re
     new_result.grade = grade
     db.session.add(new_result)
     db.session.commit()
+    invalidate("results", subject_results_tag(subject_id))
 
     return jsonify({
         "message": "Result added successfully",
         "status": "success"
     }), 201
 
+RESULT_UPSERT_COLUMNS = ("total_marks", "obtained_marks", "grade", "remarks")
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+def _result_upsert(dialect):
+    """INSERT into results that updates the marks of an existing student, subject, exam type and label row."""
+    if dialect == "mysql":
+        statement = mysql.insert(Result)
+        return statement.on_duplicate_key_update({name: statement.inserted[name] for name in RESULT_UPSERT_COLUMNS})
+    statement = _UPSERT_INSERTS[dialect](Result)
+    return statement.on_conflict_do_update(
+        index_elements=["student_id", "subject_id", "exam_type", "exam_label"],
+        set_={name: statement.excluded[name] for name in RESULT_UPSERT_COLUMNS}
+    )
+
+def add_bulk_results(subject_id, exam_type, exam_label, entries, total_marks=None):
+    """Enter or update the marks of one labelled exam for many students in a single transaction."""
+    errors = {}
+    seen = set()
+    for index, entry in enumerate(entries):
+        entry_errors = []
+        entry_total = entry.get('total_marks', total_marks)
+        obtained = entry.get('obtained_marks')
+        if entry['student_id'] in seen:
+            entry_errors.append("Student appears more than once")
+        seen.add(entry['student_id'])
+        if entry_total is None:
+            entry_errors.append("Total marks are required")
+        elif entry_total <= 0:
+            entry_errors.append("Total marks must be greater than zero")
+        elif obtained is None or obtained < 0 or obtained > entry_total:
+            entry_errors.append("Obtained marks must be between 0 and total marks")
+        if entry_errors:
+            errors[index] = entry_errors
+
+    existing_students = set(db.session.execute(
+        db.select(Student.id).where(Student.id.in_(seen))
+    ).scalars()) if seen else set()
+    existing = set(db.session.execute(
+        db.select(Result.student_id).where(
+            Result.subject_id == subject_id,
+            Result.exam_type == exam_type,
+            Result.exam_label == exam_label,
+            Result.student_id.in_(seen)
+        )
+    ).scalars()) if seen else set()
+    for index, entry in enumerate(entries):
+        if entry['student_id'] not in existing_students:
+            errors.setdefault(index, []).append("Student not found")
+
+    if errors:
+        return jsonify({
+            "message": "Some results are invalid; nothing was saved",
+            "errors": errors,
+            "status": "failed"
+        }), 400
+
+    rows = []
+    grades = {}
+    for entry in entries:
+        entry_total = Decimal(entry.get('total_marks', total_marks))
+        obtained = Decimal(entry['obtained_marks'])
+        grade = grade_for_percentage(obtained / entry_total * 100)
+        grades[grade] = grades.get(grade, 0) + 1
+        rows.append({
+            "student_id": entry['student_id'],
+            "subject_id": subject_id,
+            "exam_type": exam_type,
+            "exam_label": exam_label,
+            "total_marks": entry_total,
+            "obtained_marks": obtained,
+            "grade": grade,
+            "remarks": entry.get('remarks')
+        })
+
+    updated = sum(1 for entry in entries if entry['student_id'] in existing)
+    db.session.execute(_result_upsert(db.session.get_bind().dialect.name), rows)
+    db.session.commit()
+    invalidate("results", subject_results_tag(subject_id))
+
+    return jsonify({
+        "message": "Results saved successfully",
+        "created": len(rows) - updated,
+        "updated": updated,
+        "grades": grades,
+        "status": "success"
+    }), 201
+
+def _result_query():
+    return Result.query.options(
+        joinedload(Result.subject),
+        joinedload(Result.student)
+    ).order_by(Result.id)
+
 def get_result_by_id(result_id):
     result = Result.query.get(result_id)
     if not result:
@@ -53,48 +160,20 @@ def get_result_by_id(result_id):
             "status": "error"
         }), 404
 
-    return jsonify({
-        "id": result.id,
-        "subject_name": result.subject.name,
-        "student_name": result.student.name,
-        "total_marks": float(result.total_marks),
-        "obtained_marks": float(result.obtained_marks),
-        "grade": result.grade,
-        "exam_type": result.exam_type,
-        "remarks": result.remarks
-    })
+    return jsonify(result_row(result))
 
-def get_all_results():
-    results = Result.query.all()
-    results_list = []
-    for result in results:
-        results_list.append({
-            "id": result.id,
-            "subject_name": result.subject.name,
-            "student_name": result.student.name,
-            "total_marks": float(result.total_marks),
-            "obtained_marks": float(result.obtained_marks),
-            "grade": result.grade,
-            "exam_type": result.exam_type,
-            "remarks": result.remarks
-        })
-    return jsonify(results_list)
+def get_all_results(limit=None, cursor=None, stream=None):
+    if stream is not None:
+        return stream_rows(_result_query(), result_row, stream)
+    if limit is not None:
+        return paginate(_result_query(), Result.id, result_row, limit, cursor)
+
+    results = _result_query().all()
+    return jsonify([result_row(row) for row in results])
 
 def get_results_by_student(student_id):
-    results = Result.query.filter_by(student_id=student_id).all()
-    results_list = []
-    for result in results:
-        results_list.append({
-            "id": result.id,
-            "subject_name": result.subject.name,
-            "student_name": result.student.name,
-            "total_marks": float(result.total_marks),
-            "obtained_marks": float(result.obtained_marks),
-            "grade": result.grade,
-            "exam_type": result.exam_type,
-            "remarks": result.remarks
-        })
-    return jsonify(results_list)
+    results = _result_query().filter(Result.student_id == student_id).all()
+    return jsonify([result_row(row) for row in results])
 
 def edit_result(result_id, **kwargs):
     result = Result.query.get(result_id)
@@ -104,6 +183,7 @@ def edit_result(result_id, **kwargs):
             "status": "error"
         }), 404
 
+    previous_subject_id = result.subject_id
     for key, value in kwargs.items():
         if hasattr(result, key):
             setattr(result, key, value)
@@ -113,7 +193,9 @@ def edit_result(result_id, **kwargs):
         total_marks = kwargs.get('total_marks', result.total_marks)
         result.grade = calculate_grade(obtained_marks, total_marks)
 
+    subject_id = result.subject_id
     db.session.commit()
+    invalidate("results", subject_results_tag(previous_subject_id), subject_results_tag(subject_id))
 
     return jsonify({
         "message": "Result updated successfully",
@@ -128,10 +210,81 @@ def delete_result(result_id):
             "status": "error"
         }), 404
 
+    subject_id = result.subject_id
     db.session.delete(result)
     db.session.commit()
+    invalidate("results", subject_results_tag(subject_id))
 
     return jsonify({
         "message": "Result deleted successfully",
         "status": "success"
-    })
\ No newline at end of file
+    })
+
+def _marks_summary(obtained, total):
+    percentage = round(float(obtained * 100 / total), 2) if total else 0.0
+    return {
+        "obtained_marks": float(obtained),
+        "total_marks": float(total),
+        "percentage": percentage,
+        "grade": grade_for_percentage(percentage)
+    }
+
+@cached(report_cache, "results", "students", "subjects")
+def _student_transcript(student_id):
+    """Transcript data for one student, or None when the student does not exist."""
+    student = db.session.query(Student.id, Student.name).filter(Student.id == student_id).first()
+    if not student:
+        return None
+
+    rows = db.session.query(
+        Subject.name.label("subject_name"),
+        Result.exam_type,
+        func.sum(Result.obtained_marks).label("obtained_marks"),
+        func.sum(Result.total_marks).label("total_marks"),
+        func.count(Result.id).label("results")
+    ).join(Subject, Result.subject_id == Subject.id
+    ).filter(Result.student_id == student_id
+    ).group_by(Result.subject_id, Subject.name, Result.exam_type
+    ).order_by(Subject.name, Result.exam_type).all()
+
+    subjects = {}
+    exam_types = {}
+    for row in rows:
+        subject = subjects.setdefault(row.subject_name, {"obtained": 0, "total": 0, "exam_types": {}})
+        subject["obtained"] += row.obtained_marks
+        subject["total"] += row.total_marks
+        subject["exam_types"][row.exam_type] = {**_marks_summary(row.obtained_marks, row.total_marks), "results": row.results}
+        exam_type = exam_types.setdefault(row.exam_type, [0, 0])
+        exam_type[0] += row.obtained_marks
+        exam_type[1] += row.total_marks
+
+    subject_rows = []
+    for name, subject in subjects.items():
+        summary = _marks_summary(subject["obtained"], subject["total"])
+        subject_rows.append({
+            "subject_name": name,
+            **summary,
+            "grade_points": GRADE_POINTS[summary["grade"]],
+            "exam_types": subject["exam_types"]
+        })
+
+    obtained = sum(subject["obtained"] for subject in subjects.values())
+    total = sum(subject["total"] for subject in subjects.values())
+    return {
+        "student_id": student.id,
+        "student_name": student.name,
+        "subjects": subject_rows,
+        "exam_types": {name: _marks_summary(*marks) for name, marks in exam_types.items()},
+        "overall": _marks_summary(obtained, total) if subject_rows else None,
+        "gpa": round(sum(row["grade_points"] for row in subject_rows) / len(subject_rows), 2) if subject_rows else None
+    }
+
+def get_student_transcript(student_id):
+    transcript = _student_transcript(student_id)
+    if transcript is None:
+        return jsonify({
+            "message": "Student not found",
+            "status": "error"
+        }), 404
+
+    return jsonify(transcript)
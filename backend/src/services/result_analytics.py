@@ -0,0 +1,103 @@
+from statistics import fmean, median, pstdev
+from flask import jsonify
+from sqlalchemy import func, case, select
+from src.db import db
+from src.models import Result, Student, Subject
+from src.cache import report_cache, MISSING
+from src.services.result import grade_for_percentage, subject_results_tag, GRADES
+
+ANALYTICS_TOP_N = 10
+ANALYTICS_PERCENTILES = (25, 50, 75, 90)
+
+
+def _percentile(ordered, p):
+    """Linearly interpolated ``p``-th percentile of an ascending list."""
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _compute_analytics(subject_id, exam_type):
+    """Statistics for one subject and exam type from a single grouped fetch."""
+    subject = db.session.query(Subject.id, Subject.name).filter(Subject.id == subject_id).first()
+    if not subject:
+        return None
+
+    obtained = func.sum(Result.obtained_marks)
+    total = func.sum(Result.total_marks)
+    percentage = case((total > 0, obtained * 100 / total), else_=0).label("percentage")
+    rows = db.session.execute(
+        select(percentage, Student.name)
+        .join(Student, Result.student_id == Student.id)
+        .where(Result.subject_id == subject_id, Result.exam_type == exam_type)
+        .group_by(Result.student_id, Student.name)
+        .order_by(percentage.desc(), Student.name)
+    ).all()
+
+    analytics = {
+        "subject_name": subject.name,
+        "exam_type": exam_type,
+        "students": len(rows),
+        "grade_distribution": dict.fromkeys(reversed(GRADES), 0)
+    }
+    if not rows:
+        return {**analytics, "mean": None, "median": None, "min": None, "max": None,
+                "std_dev": None, "percentiles": {}, "rankings": []}
+
+    scores = [round(float(row[0]), 2) for row in rows]
+    count = len(scores)
+    rankings = []
+    start = 0
+    # Scores arrive highest first; walk them one run of ties at a time.
+    while start < count:
+        end = start
+        while end < count and scores[end] == scores[start]:
+            end += 1
+        grade = grade_for_percentage(scores[start])
+        analytics["grade_distribution"][grade] += end - start
+        percentile_rank = round((count - end + (end - start) / 2) * 100 / count, 1)
+        for index in range(start, end):
+            rankings.append({
+                "rank": start + 1,
+                "student_name": rows[index][1],
+                "percentage": scores[index],
+                "grade": grade,
+                "percentile_rank": percentile_rank
+            })
+        start = end
+
+    ascending = scores[::-1]
+    return {
+        **analytics,
+        "mean": round(fmean(ascending), 2),
+        "median": round(median(ascending), 2),
+        "min": ascending[0],
+        "max": ascending[-1],
+        "std_dev": round(pstdev(ascending), 2),
+        "percentiles": {f"p{p}": round(_percentile(ascending, p), 2) for p in ANALYTICS_PERCENTILES},
+        "rankings": rankings
+    }
+
+
+def result_analytics(subject_id, exam_type):
+    """Cached analytics for a subject and exam type, or None when the subject does not exist."""
+    key = ("result_analytics", subject_id, exam_type)
+    analytics = report_cache.get(key)
+    if analytics is MISSING:
+        analytics = _compute_analytics(subject_id, exam_type)
+        report_cache.set(key, analytics, (subject_results_tag(subject_id), "students", "subjects"))
+    return analytics
+
+
+def get_result_analytics(subject_id, exam_type, top_n=None):
+    analytics = result_analytics(subject_id, exam_type)
+    if analytics is None:
+        return jsonify({
+            "message": "Subject not found",
+            "status": "error"
+        }), 404
+
+    if top_n is not None:
+        analytics = {**analytics, "rankings": analytics["rankings"][:top_n]}
+    return jsonify(analytics)
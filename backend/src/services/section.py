@@ -1,6 +1,10 @@
 from src.models import Section
 from flask import jsonify
 from src.db import db
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import section_row
 
 def add_section(name, teacher_id):
     existing_section = Section.query.filter_by(name=name).first()
@@ -17,6 +21,7 @@ def add_section(name, teacher_id):
     )
     db.session.add(new_section)
     db.session.commit()
+    invalidate("sections")
 
     return jsonify({
         "message":"section added successfully",
@@ -31,22 +36,19 @@ def get_section_by_id(section_id):
             "status":"error"
         }), 404
 
-    return jsonify({
-        "id": section.id,
-        "name": section.name,
-        "teacher_name": section.teacher.name
-    })
+    return jsonify(section_row(section))
+
+def _section_query():
+    return Section.query.options(
+        joinedload(Section.teacher)
+    ).order_by(Section.id)
+
+def get_all_sections(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_section_query(), Section.id, section_row, limit, cursor)
 
-def get_all_sections():
-    sections = Section.query.all()
-    section_list = []
-    for section in sections:
-        section_list.append({
-            "id": section.id,
-            "name": section.name,
-            "teacher_name": section.teacher.name
-        })
-    return jsonify(section_list)
+    sections = _section_query().all()
+    return jsonify([section_row(row) for row in sections])
 
 def edit_section(section_id, **kwargs):
     section = Section.query.get(section_id)
@@ -61,6 +63,7 @@ def edit_section(section_id, **kwargs):
             setattr(section, key, value)
 
     db.session.commit()
+    invalidate("sections")
 
     return jsonify({
         "message":"section updated successfully",
@@ -77,6 +80,7 @@ def delete_section(section_id):
 
     db.session.delete(section)
     db.session.commit()
+    invalidate("sections")
 
     return jsonify({
         "message":"section deleted successfully",
@@ -1,7 +1,10 @@
 from src.models import Student,Enrollment
 from flask import jsonify
 from src.db import db
-
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import student_row
 
 
 def add_students(name, username, section, password, email):
@@ -29,31 +32,30 @@ def add_students(name, username, section, password, email):
     new_student.set_password(password)
     db.session.add(new_student)
     db.session.commit()
+    invalidate("students")
     
     return jsonify({
         "message":"student added sucessfully",
         "status":"sucess"
     }), 201
 
-def get_all_students():
-    students = Student.query.all()
+def _student_query():
+    return Student.query.options(
+        joinedload(Student.section)
+    ).order_by(Student.id)
+
+def get_all_students(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_student_query(), Student.id, student_row, limit, cursor)
+
+    students = _student_query().all()
     if not students:
         return jsonify({
             "message":"no students found",
             "status":"failed"
         }), 404
     
-    student_list = []
-    for student in students:
-        student_data = {
-            "id": student.id,
-            "name": student.name,
-            "username": student.username,
-            "section_name": student.section.name,
-            "email": student.email,
-        }
-        student_list.append(student_data)
-    return jsonify(student_list)
+    return jsonify([student_row(row) for row in students])
 
 def get_student_by_id(student_id):
     student = Student.query.get(student_id)
@@ -63,15 +65,8 @@ def get_student_by_id(student_id):
             "status":"failed"
         }), 404
     
-    student_data = {
-        "id": student.id,
-        "name": student.name,
-        "username": student.username,
-        "section_name": student.section.name,
-        "email": student.email,
-    }
     return jsonify({
-        "student": student_data
+        "student": student_row(student)
     })
 
 
@@ -90,6 +85,7 @@ def update_student(student_id, **kwargs):
             setattr(student, key, value)
 
     db.session.commit()
+    invalidate("students")
     
     return jsonify({
         "message":"student updated sucessfully",
@@ -111,6 +107,7 @@ def delete_student(student_id):
 
     db.session.delete(student)
     db.session.commit()
+    invalidate("students", "enrollments")
 
     return jsonify({
         "message":"student deleted sucessfully",
@@ -1,6 +1,10 @@
 from src.models import Subject
 from flask import jsonify
 from src.db import db
+from src.pagination import paginate
+from sqlalchemy.orm import joinedload
+from src.cache import invalidate
+from src.serializers import subject_row
 
 def add_subject(name, teacher_id, course_id):
     new_subject = Subject(
@@ -10,28 +14,28 @@ def add_subject(name, teacher_id, course_id):
     )
     db.session.add(new_subject)
     db.session.commit()
+    invalidate("subjects")
 
     return jsonify({
         "message": "Subject created successfully",
         "status": "success"
     }), 201
 
-def get_all_subjects():
-    subjects = Subject.query.all()
-    subject_list = []
-    for subject in subjects:
-        subject_data = {
-            "id": subject.id,
-            "name": subject.name,
-            "teacher_name": subject.teacher.name if subject.teacher else None,
-            "course_name": subject.course.name if subject.course else None
-        }
-        subject_list.append(subject_data)
-    
+def _subject_query():
+    return Subject.query.options(
+        joinedload(Subject.teacher),
+        joinedload(Subject.course)
+    ).order_by(Subject.id)
+
+def get_all_subjects(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_subject_query(), Subject.id, subject_row, limit, cursor)
+
+    subjects = _subject_query().all()
     return jsonify({
         "message": "Subjects retrieved successfully",
         "status": "success",
-        "data": subject_list
+        "data": [subject_row(row) for row in subjects]
     })
 
 
@@ -43,17 +47,10 @@ def get_subject_by_id(subject_id):
             "status": "error"
         }), 404
     
-    subject_data = {
-        "id": subject.id,
-        "name": subject.name,
-        "teacher_name": subject.teacher.name if subject.teacher else None,
-        "course_name": subject.course.name if subject.course else None
-    }
-    
     return jsonify({
         "message": "Subject retrieved successfully",
         "status": "success",
-        "data": subject_data
+        "data": subject_row(subject)
     })
 
 def delete_subject(subject_id):
@@ -66,6 +63,7 @@ def delete_subject(subject_id):
     
     db.session.delete(subject)
     db.session.commit()
+    invalidate("subjects")
     
     return jsonify({
         "message": "Subject deleted successfully",
@@ -85,6 +83,7 @@ def update_subject(subject_id, **kwargs):
             setattr(subject, key, value)
     
     db.session.commit()
+    invalidate("subjects")
     
     return jsonify({
         "message": "Subject updated successfully",
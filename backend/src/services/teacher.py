@@ -1,6 +1,10 @@
 from src.models import Teacher
 from src.db import db
 from flask import jsonify
+from src.pagination import paginate
+from sqlalchemy.orm import selectinload
+from src.cache import invalidate
+from src.serializers import teacher_row
 
 def add_teacher(name, username, email, password_hash):
     existing_email = Teacher.query.filter_by(email=email).first()
@@ -25,25 +29,24 @@ def add_teacher(name, username, email, password_hash):
     new_teacher.set_password(password_hash)
     db.session.add(new_teacher)
     db.session.commit()
+    invalidate("teachers")
     
     return jsonify({
         "message":"teacher added successfully",
         "status":"success"
     }), 201
 
-def get_all_teachers():
-    all_teachers = Teacher.query.all()
+def _teacher_query():
+    return Teacher.query.options(
+        selectinload(Teacher.subjects)
+    ).order_by(Teacher.id)
 
-    teachers = []
-    for teacher in all_teachers:
-        teachers.append({
-            "id": teacher.id,
-            "name":teacher.name,
-            "subjects": [subject.name for subject in teacher.subjects],
-            "username": teacher.username,
-            "email": teacher.email
-        })
-    return jsonify(teachers)
+def get_all_teachers(limit=None, cursor=None):
+    if limit is not None:
+        return paginate(_teacher_query(), Teacher.id, teacher_row, limit, cursor)
+
+    all_teachers = _teacher_query().all()
+    return jsonify([teacher_row(row) for row in all_teachers])
 
 def get_teacher_by_id(teacher_id):
     teacher = Teacher.query.get(teacher_id)
@@ -78,6 +81,7 @@ def update_teacher(teacher_id, **kwargs):
             setattr(teacher, key, value)
     
     db.session.commit()
+    invalidate("teachers")
     
     return jsonify({
         "message":"teacher updated successfully",
@@ -94,6 +98,7 @@ def delete_teacher(teacher_id):
     
     db.session.delete(teacher)
     db.session.commit()
+    invalidate("teachers")
     
     return jsonify({
         "message":"teacher deleted successfully",
@@ -0,0 +1,63 @@
+from flask import Response, current_app, request, stream_with_context
+
+STREAM_FORMATS = ("ndjson", "json")
+STREAM_BATCH_SIZE = 1000
+
+
+def get_stream_args():
+    """Read the ``stream`` query parameter of a list request."""
+    stream = request.args.get("stream")
+    if stream not in STREAM_FORMATS:
+        return {}
+    return {"stream": stream}
+
+
+def stream_rows(query, serializer, stream):
+    """Stream ``query`` in batches as NDJSON or as a chunked JSON array."""
+    dumps = current_app.json.dumps
+
+    def generate():
+        if stream == "json":
+            yield "["
+
+        chunk = []
+        first = True
+        for row in query.yield_per(STREAM_BATCH_SIZE):
+            chunk.append(dumps(serializer(row)))
+            if len(chunk) == STREAM_BATCH_SIZE:
+                yield _join_chunk(chunk, stream, first)
+                chunk = []
+                first = False
+        if chunk:
+            yield _join_chunk(chunk, stream, first)
+
+        if stream == "json":
+            yield "]"
+
+    mimetype = "application/x-ndjson" if stream == "ndjson" else "application/json"
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+def _join_chunk(chunk, stream, first):
+    if stream == "ndjson":
+        return "\n".join(chunk) + "\n"
+    return ("" if first else ",") + ",".join(chunk)
+
+
+def sse_event(event, data, event_id=None):
+    """Format one Server-Sent Events message with a JSON ``data`` line."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {current_app.json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def sse_response(events):
+    """Stream an iterable of ``sse_event`` strings as ``text/event-stream``."""
+    return Response(
+        stream_with_context(events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,58 @@
+import pytest
+
+from src.models import Attendance, Course, Section, Student, Subject, Teacher
+
+
+def seed_attendance(db, n_records):
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com")
+    teacher.set_password("secret1")
+    db.session.add(teacher)
+    db.session.flush()
+
+    course = Course(name="Course", course_code="C-1", teacher_id=teacher.id)
+    section = Section(name="A", teacher_id=teacher.id)
+    db.session.add_all([course, section])
+    db.session.flush()
+
+    subjects = [Subject(name=f"Subject {i}", teacher_id=teacher.id, course_id=course.id) for i in range(2)]
+    students = [
+        Student(name=f"Student {i}", username=f"student{i}", email=f"student{i}@example.com", password="x", section_id=section.id)
+        for i in range(n_records)
+    ]
+    db.session.add_all(subjects + students)
+    db.session.flush()
+
+    db.session.add_all(
+        Attendance(student_id=student.id, subject_id=subjects[i % 2].id, status="present")
+        for i, student in enumerate(students)
+    )
+    db.session.commit()
+    return teacher
+
+
+def attendance_queries(count_queries, client, headers, url):
+    with count_queries() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    body = response.get_json()
+    rows = body["data"] if isinstance(body, dict) else body
+    assert rows and all(row["student_name"] and row["subject_name"] for row in rows)
+    return len(statements)
+
+
+@pytest.mark.parametrize("url", [
+    "/api/get/attendance",
+    "/api/get/attendance?limit=200",
+    "/api/get/attendance?subject_name=Subject 0",
+    "/api/get/attendance?student_name=Student 0",
+])
+def test_attendance_listing_query_count_does_not_grow_with_rows(db, client, auth_headers, count_queries, url):
+    counts = []
+    for n_records in (3, 40):
+        teacher = seed_attendance(db, n_records)
+        counts.append(attendance_queries(count_queries, client, auth_headers(teacher.id, "teacher"), url))
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+
+    assert counts[0] == counts[1]
@@ -0,0 +1,18 @@
+from src.extention import bcrypt
+from src.models import Teacher
+
+
+def test_login_rehashes_an_outdated_password_after_responding(db, client):
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com",
+                      password=bcrypt.generate_password_hash("secret1", rounds=5).decode("utf-8"))
+    db.session.add(teacher)
+    db.session.commit()
+
+    response = client.post("/api/login", json={"email": "teacher@example.com", "password": "secret1"})
+    assert response.get_json()["status"] is True
+    response.close()
+
+    db.session.expire_all()
+    stored = db.session.get(Teacher, teacher.id).password
+    assert stored.startswith("$2b$04$")
+    assert bcrypt.check_password_hash(stored, "secret1")
@@ -0,0 +1,45 @@
+from src.cache import invalidate
+from src.models import Admin, ResourceVersion, Teacher
+
+
+def test_invalidate_bumps_versions_without_committing_the_session(db):
+    db.session.add(Admin(name="Admin", username="admin", email="admin@example.com", password="x"))
+
+    invalidate("courses", "attendance")
+    db.session.rollback()
+
+    assert db.session.query(Admin).count() == 0
+    versions = {row.name: row.version for row in db.session.query(ResourceVersion)}
+    assert versions == {"courses": 1}
+
+
+def test_invalidate_advances_existing_versions(db):
+    invalidate("courses")
+    invalidate("courses", "teachers")
+
+    versions = {row.name: row.version for row in db.session.query(ResourceVersion)}
+    assert versions == {"courses": 2, "teachers": 1}
+
+
+def test_course_list_revalidates_until_a_course_is_added(db, client, auth_headers):
+    db.session.add(Teacher(name="Teacher", username="teacher", email="teacher@example.com", password="x"))
+    db.session.commit()
+    headers = auth_headers(1, "admin")
+
+    first = client.get("/api/get/courses", headers=headers)
+    assert first.status_code == 200 and first.headers["ETag"]
+    etag = first.headers["ETag"]
+
+    repeat = client.get("/api/get/courses", headers={**headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.data == b""
+    assert repeat.headers["ETag"] == etag
+
+    added = client.post("/api/add/course", headers=headers,
+                        json={"name": "Course", "course_code": "C-1", "teacher_name": "Teacher"})
+    assert added.status_code == 201
+
+    changed = client.get("/api/get/courses", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [course["name"] for course in changed.get_json()["data"]] == ["Course"]
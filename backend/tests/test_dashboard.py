@@ -0,0 +1,42 @@
+import pytest
+
+from src.cache import invalidate
+from src.models import Announcement, Section, Student, Teacher
+
+
+@pytest.fixture
+def classroom(db):
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com")
+    teacher.set_password("secret1")
+    db.session.add(teacher)
+    db.session.flush()
+    section = Section(name="A", teacher_id=teacher.id)
+    db.session.add(section)
+    db.session.flush()
+    student = Student(name="Student", username="student", email="student@example.com", password="x", section_id=section.id)
+    db.session.add(student)
+    db.session.add_all(
+        Announcement(title=f"For {audience}", content="...", teacher_id=teacher.id, target_audience=audience)
+        for audience in ("all", "students", "teachers")
+    )
+    db.session.commit()
+    invalidate("announcements")
+    return teacher, student
+
+
+def summary(client, headers):
+    response = client.get("/api/dashboard/summary", headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_dashboards_only_show_announcements_for_their_audience(client, auth_headers, classroom):
+    teacher, student = classroom
+
+    student_view = summary(client, auth_headers(student.id, "student"))
+    teacher_view = summary(client, auth_headers(teacher.id, "teacher"))
+
+    assert {row["title"] for row in student_view["recent_announcements"]} == {"For all", "For students"}
+    assert student_view["counts"]["announcements"] == 2
+    assert {row["title"] for row in teacher_view["recent_announcements"]} == {"For all", "For teachers"}
+    assert teacher_view["counts"]["announcements"] == 2
@@ -0,0 +1,20 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+
+def test_responses_match_flasks_default_json_output(app):
+    payload = {
+        "created_at": datetime(2024, 1, 29, 10, 0, 0, 123456),
+        "due_date": date(2024, 2, 10),
+        "total_marks": Decimal("100.00"),
+        "nested": {"b": 1, "a": [1, 2.5, None]}
+    }
+
+    with app.test_request_context():
+        response = app.json.response(payload)
+        expected = DefaultJSONProvider(app).response(payload)
+
+    assert response.get_data() == expected.get_data()
+    assert response.get_json()["created_at"] == "Mon, 29 Jan 2024 10:00:00 GMT"
@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from src.models import Admin, Announcement, Assignment, Course, Section, Student, Subject, Teacher
+
+
+def seed_school(db, n):
+    """``n`` teachers, each with their own course, section, subject, assignment, announcement and student."""
+    admin = Admin(name="Admin", username="admin", email="admin@example.com", password="x")
+    db.session.add(admin)
+    for i in range(n):
+        teacher = Teacher(name=f"Teacher {i}", username=f"teacher{i}", email=f"teacher{i}@example.com", password="x")
+        db.session.add(teacher)
+        db.session.flush()
+        course = Course(name=f"Course {i}", course_code=f"C-{i}", teacher_id=teacher.id)
+        section = Section(name=f"Section {i}", teacher_id=teacher.id)
+        db.session.add_all([course, section])
+        db.session.flush()
+        subject = Subject(name=f"Subject {i}", teacher_id=teacher.id, course_id=course.id)
+        db.session.add(subject)
+        db.session.flush()
+        db.session.add_all([
+            Student(name=f"Student {i}", username=f"student{i}", email=f"student{i}@example.com", password="x", section_id=section.id),
+            Assignment(title=f"Assignment {i}", description="...", subject_id=subject.id, teacher_id=teacher.id, due_date=date(2030, 1, 1)),
+            Announcement(title=f"Announcement {i}", content="...", teacher_id=teacher.id, section_id=section.id)
+        ])
+    db.session.commit()
+    return admin
+
+
+@pytest.mark.parametrize("url", [
+    "/api/get/student",
+    "/api/get/teacher",
+    "/api/get/courses",
+    "/api/get/subjects",
+    "/api/get/section",
+    "/api/get/assignments",
+    "/api/get/announcements",
+])
+@pytest.mark.parametrize("query", [{}, {"limit": 200}])
+def test_list_query_count_does_not_grow_with_rows(db, client, auth_headers, count_queries, url, query):
+    counts = []
+    for n in (2, 25):
+        admin = seed_school(db, n)
+        with count_queries() as statements:
+            response = client.get(url, query_string=query, headers=auth_headers(admin.id, "admin"))
+        assert response.status_code == 200
+        counts.append(len(statements))
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+
+    assert counts[0] == counts[1]
+
+
+def test_list_without_params_returns_first_page(db, client, auth_headers, monkeypatch):
+    monkeypatch.setattr("src.pagination.DEFAULT_PAGE_SIZE", 2)
+    monkeypatch.setattr("src.pagination.MAX_PAGE_SIZE", 4)
+    headers = auth_headers(seed_school(db, 6).id, "admin")
+
+    first = client.get("/api/get/student", headers=headers).get_json()
+    assert len(first["data"]) == 2 and first["next_cursor"] == first["data"][-1]["id"]
+
+    capped = client.get("/api/get/student", query_string={"limit": 1000}, headers=headers).get_json()
+    assert len(capped["data"]) == 4
+
+    names, cursor = [], None
+    while True:
+        page = client.get("/api/get/student", query_string={"cursor": cursor} if cursor else {}, headers=headers).get_json()
+        names += [row["name"] for row in page["data"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert names == [f"Student {i}" for i in range(6)]
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from src.models import Admin, Announcement, Event, Teacher
+from src.services import notification
+
+
+@pytest.fixture
+def creators(db):
+    admin = Admin(name="Admin", username="admin", email="admin@example.com")
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com")
+    admin.set_password("secret1")
+    teacher.set_password("secret1")
+    db.session.add_all([admin, teacher])
+    db.session.commit()
+    return admin, teacher
+
+
+def add_items(db, admin, teacher, count, offset=0):
+    db.session.add_all(
+        Announcement(title=f"Announcement {i}", content="...", teacher_id=teacher.id)
+        for i in range(offset, offset + count)
+    )
+    db.session.add_all(
+        Event(title=f"Event {i}", event_date=date(2030, 1, 1), admin_id=admin.id)
+        for i in range(offset, offset + count)
+    )
+    db.session.commit()
+
+
+def read_all(client, headers, cursor):
+    """Follow the feed from ``cursor`` until it is drained, returning the item ids seen."""
+    seen = []
+    while True:
+        response = client.get("/api/notifications", query_string={"since": cursor}, headers=headers)
+        assert response.status_code == 200
+        feed = response.get_json()
+        seen.extend(item["id"] for item in feed["items"])
+        cursor = feed["cursor"]
+        if not feed["has_more"]:
+            return seen, cursor
+
+
+def test_incremental_feed_returns_every_item_beyond_the_limit(db, client, auth_headers, creators):
+    admin, teacher = creators
+    headers = auth_headers(999, "student")
+    add_items(db, admin, teacher, 2)
+    first = client.get("/api/notifications", headers=headers).get_json()
+
+    count = notification.NOTIFICATION_LIMIT * 2 + 3
+    add_items(db, admin, teacher, count, offset=2)
+    seen, cursor = read_all(client, headers, first["cursor"])
+
+    expected = {f"a-{i}" for i in range(3, count + 3)} | {f"e-{i}" for i in range(3, count + 3)}
+    assert sorted(seen) == sorted(expected)
+
+    again, _ = read_all(client, headers, cursor)
+    assert again == []
+
+
+def test_incremental_feed_skips_filtered_rows_without_losing_items(db, client, auth_headers, creators):
+    admin, teacher = creators
+    headers = auth_headers(teacher.id, "teacher")
+    first = client.get("/api/notifications", headers=headers).get_json()
+
+    # The teacher's own announcements are filtered out of their feed.
+    add_items(db, admin, teacher, notification.NOTIFICATION_LIMIT + 1)
+    seen, _ = read_all(client, headers, first["cursor"])
+
+    assert sorted(seen) == sorted(f"e-{i}" for i in range(1, notification.NOTIFICATION_LIMIT + 2))
+
+
+def test_stream_catch_up_sends_every_page(db, client, auth_headers, creators, monkeypatch):
+    admin, teacher = creators
+    monkeypatch.setattr(notification, "NOTIFICATION_STREAM_TTL", 0)
+    add_items(db, admin, teacher, notification.NOTIFICATION_LIMIT + 1)
+
+    response = client.get("/api/notifications/stream", query_string={"since": "0-0"}, headers=auth_headers(999, "student"))
+    body = response.get_data(as_text=True)
+
+    assert body.count("event: notifications") == 2
+    for i in range(notification.NOTIFICATION_LIMIT + 1):
+        assert f'"a-{i + 1}"' in body and f'"e-{i + 1}"' in body
@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from src.models import Course, Result, Section, Student, Subject, Teacher
+from src.services.result import _result_upsert
+
+
+@pytest.fixture
+def school(db):
+    teacher = Teacher(name="Teacher", username="teacher", email="teacher@example.com")
+    teacher.set_password("secret1")
+    db.session.add(teacher)
+    db.session.flush()
+    course = Course(name="Course", course_code="C-1", teacher_id=teacher.id)
+    section = Section(name="A", teacher_id=teacher.id)
+    db.session.add_all([course, section])
+    db.session.flush()
+    subject = Subject(name="Maths", teacher_id=teacher.id, course_id=course.id)
+    students = [
+        Student(name=f"Student {i}", username=f"student{i}", email=f"student{i}@example.com", password="x", section_id=section.id)
+        for i in range(3)
+    ]
+    db.session.add_all([subject] + students)
+    db.session.commit()
+    return teacher, subject, students
+
+
+def post_bulk(client, headers, students, marks, exam_label="Final 2026"):
+    return client.post("/api/create/result/bulk", headers=headers, json={
+        "subject_name": "Maths",
+        "exam_type": "final",
+        "exam_label": exam_label,
+        "total_marks": "100",
+        "results": [{"student_id": student.id, "obtained_marks": str(mark)} for student, mark in zip(students, marks)]
+    })
+
+
+def marks_by_student(db, **filters):
+    return dict(db.session.execute(db.select(Result.student_id, Result.obtained_marks).filter_by(**filters)).all())
+
+
+def test_bulk_results_update_the_same_labelled_exam(db, client, auth_headers, school):
+    teacher, subject, students = school
+    headers = auth_headers(teacher.id, "teacher")
+
+    first = post_bulk(client, headers, students[:2], [50, 60]).get_json()
+    second = post_bulk(client, headers, students, [95, 85, 75]).get_json()
+
+    assert (first["created"], first["updated"]) == (2, 0)
+    assert (second["created"], second["updated"]) == (1, 2)
+    assert marks_by_student(db) == {students[0].id: Decimal("95"), students[1].id: Decimal("85"), students[2].id: Decimal("75")}
+
+
+def test_bulk_results_with_another_label_add_a_new_exam(db, client, auth_headers, school):
+    teacher, subject, students = school
+    headers = auth_headers(teacher.id, "teacher")
+
+    post_bulk(client, headers, students[:1], [50], exam_label="Quiz 1")
+    response = post_bulk(client, headers, students[:1], [70], exam_label="Quiz 2").get_json()
+
+    assert (response["created"], response["updated"]) == (1, 0)
+    assert marks_by_student(db, exam_label="Quiz 1") == {students[0].id: Decimal("50")}
+    assert marks_by_student(db, exam_label="Quiz 2") == {students[0].id: Decimal("70")}
+
+
+def test_single_results_stay_append_only(db, client, auth_headers, school):
+    teacher, subject, students = school
+    payload = {"subject_name": "Maths", "student_name": students[0].name, "total_marks": "20",
+               "obtained_marks": "15", "exam_type": "quiz"}
+    headers = auth_headers(teacher.id, "teacher")
+
+    assert client.post("/api/create/result", headers=headers, json=payload).status_code == 201
+    assert client.post("/api/create/result", headers=headers, json=payload).status_code == 201
+    response = post_bulk(client, headers, students[:1], [90]).get_json()
+
+    assert (response["created"], response["updated"]) == (1, 0)
+    assert db.session.execute(db.select(db.func.count(Result.id))).scalar() == 3
+
+
+def test_mysql_upsert_uses_on_duplicate_key_update():
+    sql = str(_result_upsert("mysql").compile(dialect=mysql.dialect()))
+
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert "grade = VALUES(grade)" in sql and "student_id = VALUES" not in sql
+
+
+def test_ensure_indexes_adds_the_exam_label_to_existing_databases(app, db, school):
+    teacher, subject, students = school
+    db.session.execute(db.text("DROP INDEX uq_results_student_subject_exam_label"))
+    db.session.execute(db.text("ALTER TABLE results DROP COLUMN exam_label"))
+    # Repeated quizzes entered one at a time must not block the new key.
+    for mark in (12, 15):
+        db.session.execute(db.text(
+            "INSERT INTO results (student_id, subject_id, total_marks, obtained_marks, grade, exam_type) "
+            "VALUES (:student, :subject, 20, :mark, 'B', 'quiz')"
+        ), {"student": students[0].id, "subject": subject.id, "mark": mark})
+    db.session.commit()
+
+    output = app.test_cli_runner().invoke(args=["ensure-indexes"]).output
+
+    assert "added    results.exam_label" in output
+    assert "created  uq_results_student_subject_exam_label" in output
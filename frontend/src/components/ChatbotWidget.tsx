@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { Send, Bot, User, X, Trash2, Sparkles, Minimize2 } from 'lucide-react';
-import { chatWithBot } from '../services/api';
+import { streamChatWithBot, deleteChatConversation } from '../services/api';
 import toast from 'react-hot-toast';
 import ReactMarkdown from 'react-markdown';
 import remarkGfm from 'remark-gfm';
@@ -34,6 +34,7 @@ interface ChatbotWidgetProps {
 
 const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
   const CHAT_HISTORY_KEY = 'lms_chatbot_history';
+  const CONVERSATION_ID_KEY = 'lms_chatbot_conversation_id';
   
   const loadChatHistory = (): Message[] => {
     try {
@@ -46,8 +47,10 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
   };
 
   const [messages, setMessages] = useState<Message[]>(loadChatHistory());
+  const [conversationId, setConversationId] = useState<string | null>(() => sessionStorage.getItem(CONVERSATION_ID_KEY));
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [toolStatus, setToolStatus] = useState<string | null>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
   
   // Adjustability states
@@ -63,6 +66,11 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   }, [messages]);
 
+  useEffect(() => {
+    if (conversationId) sessionStorage.setItem(CONVERSATION_ID_KEY, conversationId);
+    else sessionStorage.removeItem(CONVERSATION_ID_KEY);
+  }, [conversationId]);
+
   useEffect(() => {
     localStorage.setItem('chatbotWidth', width.toString());
   }, [width]);
@@ -110,28 +118,48 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
 
     const userMessage = input.trim();
     setInput('');
-    const newMessages = [...messages, { role: 'user', content: userMessage } as Message];
+    const newMessages: Message[] = [...messages, { role: 'user', content: userMessage }, { role: 'assistant', content: '' }];
     setMessages(newMessages);
     setLoading(true);
 
+    // Tokens are appended to the empty placeholder reply as they arrive.
+    const updateReply = (update: (content: string) => string) => {
+      setMessages((prev) => {
+        const next = [...prev];
+        next[next.length - 1] = { role: 'assistant', content: update(next[next.length - 1].content) };
+        return next;
+      });
+    };
+
     try {
-      const response = await chatWithBot(userMessage, messages);
-      setMessages((prev) => [
-        ...prev,
-        { role: 'assistant', content: response.message || 'I apologize, but I couldn\'t process that request.' },
-      ]);
+      await streamChatWithBot(userMessage, conversationId, {
+        onConversation: (id) => setConversationId(id),
+        onToken: (content) => {
+          setToolStatus(null);
+          updateReply((current) => current + content);
+        },
+        onToolCall: (name) => setToolStatus(`Running ${name.replace(/_/g, ' ')}...`),
+        onToolResult: () => setToolStatus('Thinking...'),
+        onDone: (data) => updateReply(() => data.message || 'I apologize, but I couldn\'t process that request.'),
+        onError: (message) => {
+          toast.error(message);
+          updateReply(() => 'Sorry, I encountered an error. Please try again.');
+        },
+      });
     } catch (error: any) {
-      toast.error(error.response?.data?.message || 'Failed to get response');
-      setMessages((prev) => [
-        ...prev,
-        { role: 'assistant', content: 'Sorry, I encountered an error. Please try again.' },
-      ]);
+      toast.error(error.message || 'Failed to get response');
+      updateReply(() => 'Sorry, I encountered an error. Please try again.');
     } finally {
+      setToolStatus(null);
       setLoading(false);
     }
   };
 
   const clearChatHistory = () => {
+    if (conversationId) {
+      deleteChatConversation(conversationId).catch((error) => console.error('Failed to delete conversation:', error));
+    }
+    setConversationId(null);
     setMessages([{ role: 'assistant', content: 'Hello! I\'m your LMS AI assistant. How can I help you today?' }]);
     sessionStorage.removeItem(CHAT_HISTORY_KEY);
     toast.success('Chat history cleared');
@@ -176,7 +204,7 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
 
       {/* Messages */}
       <div className="flex-1 overflow-y-auto p-4 space-y-6 bg-gray-50/50">
-        {messages.map((message, index) => (
+        {messages.filter((message) => message.content).map((message, index) => (
           <div key={index} className={`flex ${message.role === 'user' ? 'justify-end' : 'justify-start'}`}>
             <div className={`flex gap-3 max-w-[85%] ${message.role === 'user' ? 'flex-row-reverse' : ''}`}>
               <div className={`w-8 h-8 rounded-lg flex-shrink-0 flex items-center justify-center ${
@@ -196,7 +224,7 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
             </div>
           </div>
         ))}
-        {loading && (
+        {loading && !messages[messages.length - 1]?.content && (
           <div className="flex justify-start">
             <div className="flex gap-3">
               <div className="w-8 h-8 rounded-lg bg-white border border-gray-200 text-indigo-600 flex items-center justify-center shadow-sm">
@@ -208,6 +236,7 @@ const ChatbotWidget: React.FC<ChatbotWidgetProps> = ({ isOpen, onClose }) => {
                   <div className="w-1.5 h-1.5 bg-indigo-400 rounded-full animate-bounce [animation-delay:0.2s]"></div>
                   <div className="w-1.5 h-1.5 bg-indigo-400 rounded-full animate-bounce [animation-delay:0.4s]"></div>
                 </div>
+                {toolStatus && <p className="text-xs text-gray-400 mt-2">{toolStatus}</p>}
               </div>
             </div>
           </div>
@@ -24,7 +24,8 @@ import {
   PanelLeft,
   Sparkles,
 } from 'lucide-react';
-import { getAnnouncements, getEvents } from '../services/api';
+import { streamNotifications, markNotificationsRead } from '../services/api';
+import type { NotificationFeed, NotificationItem } from '../types';
 import toast from 'react-hot-toast';
 
 // Manus Icon Component
@@ -89,60 +90,69 @@ export const Layout: React.FC<LayoutProps> = ({ children }) => {
     localStorage.setItem('chatbotOpen', chatbotOpen.toString());
   }, [chatbotOpen]);
 
-  // Fetch real-time notifications
+  // Notifications are pushed over one stream: the full feed first, then new items as they are created
+  const notificationCursor = useRef<string | undefined>(undefined);
+
   useEffect(() => {
-    const fetchNotifications = async () => {
+    const toNotification = (item: NotificationItem): Notification => ({
+      id: item.id,
+      title: item.title,
+      type: item.type,
+      time: item.type === 'event' ? item.event_date || 'Upcoming' : 'Recently',
+      creatorId: item.creator_id
+    });
+
+    const handleFeed = (feed: NotificationFeed) => {
+      const initial = !notificationCursor.current;
+      notificationCursor.current = feed.cursor;
+      if (initial) {
+        setNotifications(feed.items.map(toNotification));
+        setHasUnread(!!feed.unread);
+      } else if (feed.items.length > 0) {
+        setNotifications(prev => [...feed.items.map(toNotification), ...prev].slice(0, 10));
+        setHasUnread(true);
+      }
+    };
+
+    if (!user) return;
+
+    notificationCursor.current = undefined;
+    const controller = new AbortController();
+    let retryTimer: ReturnType<typeof setTimeout>;
+
+    // The server ends the stream every 25 seconds or so; reconnect with the last cursor
+    // so nothing published in between is missed, backing off after failures.
+    const connect = async (failures: number) => {
       try {
-        const [announcements, events] = await Promise.all([
-          getAnnouncements(),
-          getEvents()
-        ]);
-        
-        // Current user ID from auth context
-        const currentUserId = user?.id;
-
-        const combined: Notification[] = [
-          ...(Array.isArray(announcements) ? announcements
-            .filter((a: any) => a.teacher_id !== currentUserId) // Filter out self-created announcements
-            .slice(0, 5)
-            .map((a: any) => ({
-              id: `a-${a.id}`,
-              title: a.title,
-              type: 'announcement' as const,
-              time: 'Recently',
-              creatorId: a.teacher_id
-            })) : []),
-          ...(Array.isArray(events) ? events
-            .filter((e: any) => e.admin_id !== currentUserId) // Filter out self-created events
-            .slice(0, 5)
-            .map((e: any) => ({
-              id: `e-${e.id}`,
-              title: e.title,
-              type: 'event' as const,
-              time: e.event_date || 'Upcoming',
-              creatorId: e.admin_id
-            })) : [])
-        ];
-        
-        setNotifications(combined);
-        if (combined.length > 0 && !localStorage.getItem('notificationsRead')) {
-          setHasUnread(true);
-        }
+        await streamNotifications(handleFeed, notificationCursor.current, controller.signal);
+        failures = 0;
       } catch (error) {
-        console.error('Failed to fetch notifications');
+        if (controller.signal.aborted) return;
+        console.error('Notification stream interrupted');
+        failures += 1;
       }
+      if (controller.signal.aborted) return;
+      retryTimer = setTimeout(() => connect(failures), Math.min(1000 * 2 ** failures, 60000));
     };
+    connect(0);
 
-    if (user) {
-      fetchNotifications();
-      const interval = setInterval(fetchNotifications, 60000);
-      return () => clearInterval(interval);
-    }
+    return () => {
+      controller.abort();
+      clearTimeout(retryTimer);
+    };
   }, [user, userRole]);
 
-  const handleMarkAllRead = () => {
+  const markRead = async () => {
     setHasUnread(false);
-    localStorage.setItem('notificationsRead', 'true');
+    try {
+      await markNotificationsRead(notificationCursor.current);
+    } catch (error) {
+      console.error('Failed to mark notifications as read');
+    }
+  };
+
+  const handleMarkAllRead = () => {
+    markRead();
     toast.success('All notifications marked as read');
   };
 
@@ -150,8 +160,7 @@ export const Layout: React.FC<LayoutProps> = ({ children }) => {
     const path = userRole === 'admin' ? '/admin/events' : `/${userRole}/announcements`;
     navigate(path);
     setShowNotifications(false);
-    setHasUnread(false);
-    localStorage.setItem('notificationsRead', 'true');
+    markRead();
   };
 
   const handleLogout = () => {
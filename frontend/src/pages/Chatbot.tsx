@@ -17,6 +17,7 @@ const Chatbot: React.FC = () => {
       content: 'Hello! I\'m your LMS assistant. How can I help you today?',
     },
   ]);
+  const [conversationId, setConversationId] = useState<string | null>(null);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
   const messagesEndRef = useRef<HTMLDivElement>(null);
@@ -39,7 +40,8 @@ const Chatbot: React.FC = () => {
     setLoading(true);
 
     try {
-      const response = await chatWithBot(userMessage);
+      const response = await chatWithBot(userMessage, conversationId);
+      if (response.conversation_id) setConversationId(response.conversation_id);
       setMessages((prev) => [
         ...prev,
         { role: 'assistant', content: response.message || 'I apologize, but I couldn\'t process that request.' },
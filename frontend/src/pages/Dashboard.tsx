@@ -15,43 +15,21 @@ import {
   Clock,
   CheckCircle2,
 } from 'lucide-react';
-import { getStudents, getTeachers, getCourses, getAssignments, getAnnouncements, getEvents } from '../services/api';
+import { getDashboardSummary } from '../services/api';
+import type { DashboardSummary } from '../types';
 import toast from 'react-hot-toast';
 
 const Dashboard: React.FC = () => {
   const { userRole, user } = useAuth();
   const navigate = useNavigate();
-  const [stats, setStats] = useState({
-    students: 0,
-    teachers: 0,
-    courses: 0,
-    assignments: 0,
-    announcements: 0,
-    events: 0,
-  });
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    const fetchStats = async () => {
+    const fetchSummary = async () => {
       try {
         setLoading(true);
-        const [studentsRes, teachersRes, coursesRes, assignmentsRes, announcementsRes, eventsRes] = await Promise.allSettled([
-          getStudents(),
-          getTeachers(),
-          getCourses(),
-          getAssignments(),
-          getAnnouncements(),
-          getEvents(),
-        ]);
-
-        setStats({
-          students: studentsRes.status === 'fulfilled' ? (Array.isArray(studentsRes.value) ? studentsRes.value.length : 1) : 0,
-          teachers: teachersRes.status === 'fulfilled' ? (Array.isArray(teachersRes.value) ? teachersRes.value.length : 1) : 0,
-          courses: coursesRes.status === 'fulfilled' ? (Array.isArray(coursesRes.value) ? coursesRes.value.length : 1) : 0,
-          assignments: assignmentsRes.status === 'fulfilled' ? (Array.isArray(assignmentsRes.value) ? assignmentsRes.value.length : 1) : 0,
-          announcements: announcementsRes.status === 'fulfilled' ? (Array.isArray(announcementsRes.value) ? announcementsRes.value.length : 1) : 0,
-          events: eventsRes.status === 'fulfilled' ? (Array.isArray(eventsRes.value) ? eventsRes.value.length : 1) : 0,
-        });
+        setSummary(await getDashboardSummary());
       } catch (error) {
         toast.error('Failed to load dashboard data');
       } finally {
@@ -59,28 +37,59 @@ const Dashboard: React.FC = () => {
       }
     };
 
-    fetchStats();
+    fetchSummary();
   }, []);
 
+  const counts = summary?.counts;
+  const stats = {
+    students: counts?.students ?? 0,
+    teachers: counts?.teachers ?? 0,
+    courses: counts?.courses ?? 0,
+    subjects: counts?.subjects ?? 0,
+    assignments: counts?.assignments ?? 0,
+    announcements: counts?.announcements ?? 0,
+    events: counts?.events ?? 0,
+  };
+  const upcomingEvents = summary?.upcoming_events ?? [];
+  const recentAnnouncements = summary?.recent_announcements ?? [];
+
   const statCards = [
+    userRole === 'student'
+      ? {
+          title: 'Announcements',
+          value: stats.announcements,
+          icon: Bell,
+          color: 'text-blue-600',
+          bgColor: 'bg-blue-50',
+          path: '/student/announcements',
+        }
+      : {
+          title: 'Total Students',
+          value: stats.students,
+          icon: Users,
+          color: 'text-blue-600',
+          bgColor: 'bg-blue-50',
+          path: userRole === 'admin' ? '/admin/students' : undefined,
+        },
+    userRole === 'admin'
+      ? {
+          title: 'Total Teachers',
+          value: stats.teachers,
+          icon: GraduationCap,
+          color: 'text-emerald-600',
+          bgColor: 'bg-emerald-50',
+          path: '/admin/teachers',
+        }
+      : {
+          title: userRole === 'teacher' ? 'My Subjects' : 'Subjects',
+          value: stats.subjects,
+          icon: GraduationCap,
+          color: 'text-emerald-600',
+          bgColor: 'bg-emerald-50',
+          path: undefined,
+        },
     {
-      title: 'Total Students',
-      value: stats.students,
-      icon: Users,
-      color: 'text-blue-600',
-      bgColor: 'bg-blue-50',
-      path: userRole === 'admin' ? '/admin/students' : undefined,
-    },
-    {
-      title: 'Total Teachers',
-      value: stats.teachers,
-      icon: GraduationCap,
-      color: 'text-emerald-600',
-      bgColor: 'bg-emerald-50',
-      path: userRole === 'admin' ? '/admin/teachers' : undefined,
-    },
-    {
-      title: 'Active Courses',
+      title: userRole === 'student' ? 'My Courses' : 'Active Courses',
       value: stats.courses,
       icon: BookOpen,
       color: 'text-violet-600',
@@ -338,6 +347,16 @@ const Dashboard: React.FC = () => {
                       <p className="text-sm text-gray-600 mt-1">Stay updated with upcoming activities</p>
                     </div>
                   </div>
+                  {upcomingEvents.length > 0 && (
+                    <ul className="mt-4 space-y-2">
+                      {upcomingEvents.map((event) => (
+                        <li key={event.id} className="flex items-center justify-between gap-3 text-sm">
+                          <span className="font-semibold text-gray-800 truncate">{event.title}</span>
+                          <span className="text-gray-500 whitespace-nowrap">{event.event_date}</span>
+                        </li>
+                      ))}
+                    </ul>
+                  )}
                   <button 
                     onClick={() => navigate(userRole === 'admin' ? '/admin/events' : '#')} 
                     className="mt-4 w-full flex items-center justify-center gap-2 px-4 py-3 bg-primary-600 text-white font-bold rounded-xl hover:bg-primary-700 transition-colors shadow-md"
@@ -367,6 +386,15 @@ const Dashboard: React.FC = () => {
                       <p className="text-sm text-gray-600 mt-1">Check the latest updates</p>
                     </div>
                   </div>
+                  {recentAnnouncements.length > 0 && (
+                    <ul className="mt-4 space-y-2">
+                      {recentAnnouncements.map((announcement) => (
+                        <li key={announcement.id} className="text-sm font-semibold text-gray-800 truncate">
+                          {announcement.title}
+                        </li>
+                      ))}
+                    </ul>
+                  )}
                   <button 
                     onClick={() => navigate(`/${userRole}/announcements`)} 
                     className="mt-4 w-full flex items-center justify-center gap-2 px-4 py-3 bg-blue-600 text-white font-bold rounded-xl hover:bg-blue-700 transition-colors shadow-md"
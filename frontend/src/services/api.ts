@@ -14,6 +14,8 @@ import type {
   Result,
   Announcement,
   Event,
+  DashboardSummary,
+  NotificationFeed,
 } from '../types';
 
 const API_BASE_URL = 'http://localhost:5000/api';
@@ -69,6 +71,22 @@ api.interceptors.response.use(
   }
 );
 
+// List endpoints answer one page at a time; follow next_cursor to collect every row.
+// Filtered listings (by student, subject, ...) are not paged and come back as a plain array.
+const LIST_PAGE_SIZE = 200;
+
+const getAllPages = async (url: string, params: Record<string, unknown> = {}) => {
+  const rows: any[] = [];
+  let cursor: number | null = null;
+  do {
+    const response: any = await api.get(url, { params: { ...params, limit: LIST_PAGE_SIZE, cursor: cursor ?? undefined } });
+    if (Array.isArray(response.data)) return response.data;
+    rows.push(...response.data.data);
+    cursor = response.data.next_cursor;
+  } while (cursor !== null);
+  return rows;
+};
+
 // Auth
 export const login = async (credentials: LoginCredentials): Promise<AuthResponse> => {
   const response = await api.post<AuthResponse>('/login', credentials);
@@ -93,7 +111,8 @@ export const addStudent = async (data: { name: string; username: string; email:
 };
 
 export const getStudents = async (id?: number) => {
-  const response = await api.get('/get/student', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/student');
+  const response = await api.get('/get/student', { params: { id } });
   return response.data;
 };
 
@@ -114,7 +133,8 @@ export const addTeacher = async (data: { name: string; username: string; email:
 };
 
 export const getTeachers = async (id?: number) => {
-  const response = await api.get('/get/teacher', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/teacher');
+  const response = await api.get('/get/teacher', { params: { id } });
   return response.data;
 };
 
@@ -135,7 +155,8 @@ export const addSection = async (data: { name: string; teacher_name: string }) =
 };
 
 export const getSections = async (id?: number) => {
-  const response = await api.get('/get/section', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/section');
+  const response = await api.get('/get/section', { params: { id } });
   return response.data;
 };
 
@@ -156,7 +177,8 @@ export const addCourse = async (data: { name: string; description: string; cours
 };
 
 export const getCourses = async (id?: number) => {
-  const response = await api.get('/get/courses', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/courses');
+  const response = await api.get('/get/courses', { params: { id } });
   return response.data;
 };
 
@@ -180,6 +202,7 @@ export const getSubjects = async (id?: number) => {
   const url = '/get/subjects';
   const params = id ? { id } : {};
   console.log('Fetching subjects from:', `${API_BASE_URL}${url}`, params);
+  if (!id) return getAllPages(url);
   const response = await api.get(url, { params });
   console.log('Subjects API response:', response.data);
   return response.data;
@@ -207,9 +230,9 @@ export const getEnrollments = async (course_name?: string, student_name?: string
   if (course_name) params.course_name = course_name;
   if (student_name) params.student_name = student_name;
   console.log('Fetching enrollments from:', `${API_BASE_URL}${url}`, params);
-  const response = await api.get(url, { params });
-  console.log('Enrollments API response:', response.data);
-  return response.data;
+  const rows = await getAllPages(url, params);
+  console.log('Enrollments API response:', rows);
+  return rows;
 };
 
 export const updateEnrollment = async (id: number, data: { status?: string; grade?: string }) => {
@@ -232,6 +255,7 @@ export const getAssignments = async (id?: number) => {
   const url = '/get/assignments';
   const params = id ? { id } : {};
   console.log('Fetching assignments from:', `${API_BASE_URL}${url}`, params);
+  if (!id) return getAllPages(url);
   const response = await api.get(url, { params });
   console.log('Assignments API response:', response.data);
   return response.data;
@@ -291,8 +315,7 @@ export const markAttendance = async (data: { student_name: string; subject_name:
 };
 
 export const getAttendance = async (student_name?: string, subject_name?: string) => {
-  const response = await api.get('/get/attendance', { params: { student_name, subject_name } });
-  return response.data;
+  return getAllPages('/get/attendance', { student_name, subject_name });
 };
 
 export const updateAttendance = async (id: number, data: { status?: 'present' | 'absent' | 'late'; student_name?: string; subject_name?: string }) => {
@@ -324,6 +347,7 @@ export const getResults = async (id?: number) => {
   const url = '/get/result';
   const params = id ? { id } : {};
   console.log('Fetching results from:', `${API_BASE_URL}${url}`, params);
+  if (!id) return getAllPages(url);
   const response = await api.get(url, { params });
   console.log('Results API response:', response.data);
   return response.data;
@@ -346,7 +370,8 @@ export const createAnnouncement = async (data: { title: string; content: string;
 };
 
 export const getAnnouncements = async (id?: number) => {
-  const response = await api.get('/get/announcements', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/announcements');
+  const response = await api.get('/get/announcements', { params: { id } });
   return response.data;
 };
 
@@ -367,7 +392,8 @@ export const createEvent = async (data: { title: string; description: string; ev
 };
 
 export const getEvents = async (id?: number) => {
-  const response = await api.get('/get/events', { params: id ? { id } : {} });
+  if (!id) return getAllPages('/get/events');
+  const response = await api.get('/get/events', { params: { id } });
   return response.data;
 };
 
@@ -381,11 +407,132 @@ export const deleteEvent = async (id: number) => {
   return response.data;
 };
 
+// Dashboard
+export const getDashboardSummary = async (): Promise<DashboardSummary> => {
+  const response = await api.get('/dashboard/summary');
+  return response.data;
+};
+
+// Parse a Server-Sent Events body, calling onEvent for each message with JSON data.
+// Comment lines (heartbeats) are skipped.
+const readEventStream = async (
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: string, payload: any, id?: string) => void,
+) => {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const dispatch = (block: string) => {
+    let event = 'message';
+    let data = '';
+    let id: string | undefined;
+    for (const line of block.split('\n')) {
+      if (line.startsWith('event: ')) event = line.slice(7);
+      else if (line.startsWith('data: ')) data += line.slice(6);
+      else if (line.startsWith('id: ')) id = line.slice(4);
+    }
+    if (!data) return;
+    onEvent(event, JSON.parse(data), id);
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      dispatch(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+    }
+  }
+};
+
+// Notifications
+// Pass the cursor from the previous response as `since` to fetch only new items.
+export const getNotifications = async (since?: string): Promise<NotificationFeed> => {
+  const response = await api.get('/notifications', { params: since ? { since } : {} });
+  return response.data;
+};
+
+// Server push of the feed; resolves when the server closes it so the caller can reconnect.
+export const streamNotifications = async (
+  onFeed: (feed: NotificationFeed) => void,
+  lastEventId?: string,
+  signal?: AbortSignal,
+) => {
+  const token = localStorage.getItem('token');
+  const response = await fetch(`${API_BASE_URL}/notifications/stream`, {
+    headers: {
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+      ...(lastEventId ? { 'Last-Event-ID': lastEventId } : {}),
+    },
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error('Failed to open notification stream');
+  }
+  await readEventStream(response.body, (event, payload) => {
+    if (event === 'notifications') onFeed(payload);
+  });
+};
+
+export const markNotificationsRead = async (cursor?: string) => {
+  const response = await api.post('/notifications/read', cursor ? { cursor } : {});
+  return response.data;
+};
+
 // Chatbot - Extended timeout for AI processing
-export const chatWithBot = async (message: string, conversationHistory?: Array<{role: string; content: string}>) => {
-  const response = await api.post('/chat', { message, history: conversationHistory }, {
+// The server keeps the conversation; only the new message and its id are sent.
+export const chatWithBot = async (message: string, conversationId?: string | null) => {
+  const response = await api.post('/chat', { message, conversation_id: conversationId || undefined }, {
     timeout: 120000, // 120 seconds (2 minutes) for chatbot responses
   });
   return response.data;
 };
 
+export interface ChatStreamHandlers {
+  onConversation?: (conversationId: string) => void;
+  onToken?: (content: string) => void;
+  onToolCall?: (name: string) => void;
+  onToolResult?: (name: string, status: string) => void;
+  onDone?: (data: { message: string; conversation_id: string }) => void;
+  onError?: (message: string) => void;
+}
+
+// Server-Sent Events over fetch: EventSource cannot POST or send the token.
+export const streamChatWithBot = async (
+  message: string,
+  conversationId: string | null,
+  handlers: ChatStreamHandlers,
+) => {
+  const token = localStorage.getItem('token');
+  const response = await fetch(`${API_BASE_URL}/chat/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+    body: JSON.stringify({ message, conversation_id: conversationId || undefined }),
+  });
+  if (!response.ok || !response.body) {
+    const data = await response.json().catch(() => ({}));
+    throw new Error(data.message || 'Failed to get response');
+  }
+
+  await readEventStream(response.body, (event, payload) => {
+    if (event === 'conversation') handlers.onConversation?.(payload.conversation_id);
+    else if (event === 'token') handlers.onToken?.(payload.content);
+    else if (event === 'tool_call') handlers.onToolCall?.(payload.name);
+    else if (event === 'tool_result') handlers.onToolResult?.(payload.name, payload.status);
+    else if (event === 'done') handlers.onDone?.(payload);
+    else if (event === 'error') handlers.onError?.(payload.message);
+  });
+};
+
+export const deleteChatConversation = async (conversationId: string) => {
+  const response = await api.delete(`/chat/${conversationId}`);
+  return response.data;
+};
+
@@ -129,3 +129,38 @@ export interface Event {
   admin: string;
 }
 
+
+export interface DashboardSummary {
+  role: 'admin' | 'teacher' | 'student';
+  counts: {
+    students?: number;
+    teachers?: number;
+    courses: number;
+    sections?: number;
+    subjects: number;
+    assignments: number;
+    announcements: number;
+    events: number;
+  };
+  upcoming_events: { id: number; title: string; event_date: string; event_time: string }[];
+  recent_announcements: { id: number; title: string; target_audience: string; section_name: string | null; created_at: string }[];
+  upcoming_assignments?: { id: number; title: string; subject_name: string; due_date: string }[];
+}
+
+export interface NotificationItem {
+  id: string;
+  type: 'announcement' | 'event';
+  item_id: number;
+  title: string;
+  created_at: string;
+  creator_id: number;
+  event_date?: string;
+}
+
+export interface NotificationFeed {
+  items: NotificationItem[];
+  cursor: string;
+  has_more?: boolean;
+  read_cursor?: string;
+  unread?: boolean;
+}